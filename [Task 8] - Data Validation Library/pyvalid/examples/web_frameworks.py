@@ -4,9 +4,10 @@
 
 from typing import Dict, Any, Optional
 from datetime import datetime
+import importlib.util
 import logging
 from fastapi import FastAPI, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from django.http import JsonResponse
 from django.views import View
@@ -27,6 +28,9 @@ from pyvalid.validators import (
     ArrayValidator
 )
 
+# orjson сериализует ответы быстрее стандартного json; ORJSONResponse требует его наличия
+FastJSONResponse = ORJSONResponse if importlib.util.find_spec("orjson") is not None else JSONResponse
+
 # Настройка логирования
 setup_logging(
     log_file="web_validation.log",
@@ -46,7 +50,7 @@ user_schema = Schema({
 })
 
 # Пример 1: Интеграция с FastAPI
-app = FastAPI(title="PyValid FastAPI Example")
+app = FastAPI(title="PyValid FastAPI Example", default_response_class=FastJSONResponse)
 
 class UserModel(BaseModel):
     """Модель пользователя для FastAPI."""
@@ -210,17 +214,17 @@ class ValidationMiddleware(BaseHTTPMiddleware):
         try:
             # Получение данных из запроса
             if request.method in ("POST", "PUT", "PATCH"):
-                body = await request.json()
+                body = await request.body()
                 
-                # Валидация данных
-                logger.log_validation_start(body)
+                # Разбор JSON и валидация данных за один вызов
+                is_valid, errors, data = self.schema.validate_bytes(body)
+                logger.log_validation_start(data)
                 
-                with validation_context(body) as context:
-                    is_valid, errors = self.schema.validate(body)
+                with validation_context(data) as context:
                     logger.log_validation_end(is_valid, errors)
                     
                     if not is_valid:
-                        return JSONResponse(
+                        return FastJSONResponse(
                             status_code=400,
                             content={
                                 "status": "error",
@@ -234,7 +238,7 @@ class ValidationMiddleware(BaseHTTPMiddleware):
         
         except Exception as e:
             logger.log_validation_error(e)
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=500,
                 content={
                     "status": "error",
@@ -10,7 +10,8 @@ PyValid - Мощная библиотека валидации для Python с
 - Поддержка контекстной валидации
 """
 
-import logging
+# Имя logging в пакете занимает подмодуль pyvalid.logging
+from logging import getLogger
 from typing import Any, Optional, TypeVar, Union, Dict, List, Callable
 from contextlib import contextmanager
 from functools import lru_cache
@@ -25,15 +26,17 @@ from .validators import (
     DateValidator,
     ObjectValidator,
     ArrayValidator,
-    CustomValidator,
-    AsyncValidator
+    CustomValidator
 )
+from .async_validators import AsyncValidator, async_validator
+from .cache import cached_validator
+from .logging import setup_logging, ValidationLogger
 from .exceptions import ValidationError, ValidatorError
 from .metrics import ValidationMetrics
 from .context import ValidationContext
 
 # Настройка логирования
-logger = logging.getLogger(__name__)
+logger = getLogger(__name__)
 
 __version__ = "0.2.0"
 __all__ = [
@@ -57,8 +60,14 @@ __all__ = [
     "ValidationError",
     "ValidatorError",
     
+    # Логирование
+    "setup_logging",
+    "ValidationLogger",
+    
     # Утилиты
     "validation_context",
+    "async_validator",
+    "cached_validator",
     "get_cached_validator",
     "measure_validation_time"
 ]
@@ -2,25 +2,33 @@
 Модуль для кэширования валидаторов и регулярных выражений.
 """
 
-from typing import Any, Callable, Optional, TypeVar, Dict, Pattern
+from typing import Any, Callable, Optional, TypeVar, Dict, Pattern, Tuple
+from collections import OrderedDict
 from functools import lru_cache, wraps
 import re
 import logging
-from threading import Lock
+from threading import Lock, RLock
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 ValidatorFunc = Callable[[Any], tuple[bool, Optional[str]]]
 
-# Глобальный кэш для регулярных выражений
-_regex_cache: Dict[str, Pattern] = {}
-_regex_lock = Lock()
+# Максимальный размер кэша регулярных выражений
+REGEX_CACHE_MAXSIZE = 1000
+
+# Глобальный LRU-кэш для регулярных выражений
+_regex_cache: "OrderedDict[Tuple[str, int], Pattern]" = OrderedDict()
+_regex_lock = RLock()
+_regex_stats = {"hits": 0, "misses": 0, "evictions": 0}
 
 def get_cached_regex(pattern: str, flags: int = 0) -> Pattern:
     """
     Получает скомпилированное регулярное выражение из кэша.
     
+    Кэш ограничен REGEX_CACHE_MAXSIZE записями, при переполнении
+    вытесняются давно не использовавшиеся выражения.
+    
     Args:
         pattern: Шаблон регулярного выражения
         flags: Флаги компиляции
@@ -28,17 +36,32 @@ def get_cached_regex(pattern: str, flags: int = 0) -> Pattern:
     Returns:
         Pattern: Скомпилированное регулярное выражение
     """
-    cache_key = f"{pattern}:{flags}"
+    cache_key = (pattern, flags)
     
     with _regex_lock:
-        if cache_key not in _regex_cache:
-            try:
-                _regex_cache[cache_key] = re.compile(pattern, flags)
-            except re.error as e:
-                logger.error(f"Invalid regex pattern: {pattern}")
-                raise ValueError(f"Invalid regex pattern: {str(e)}")
-        
-        return _regex_cache[cache_key]
+        compiled = _regex_cache.get(cache_key)
+        if compiled is not None:
+            _regex_cache.move_to_end(cache_key)
+            _regex_stats["hits"] += 1
+            return compiled
+        _regex_stats["misses"] += 1
+    
+    # Компиляция выполняется вне блокировки
+    try:
+        compiled = re.compile(pattern, flags)
+    except re.error as e:
+        logger.error(f"Invalid regex pattern: {pattern}")
+        raise ValueError(f"Invalid regex pattern: {str(e)}")
+    
+    with _regex_lock:
+        # Другой поток мог успеть добавить то же выражение
+        compiled = _regex_cache.setdefault(cache_key, compiled)
+        _regex_cache.move_to_end(cache_key)
+        while len(_regex_cache) > REGEX_CACHE_MAXSIZE:
+            _regex_cache.popitem(last=False)
+            _regex_stats["evictions"] += 1
+    
+    return compiled
 
 def clear_regex_cache() -> None:
     """
@@ -46,6 +69,22 @@ def clear_regex_cache() -> None:
     """
     with _regex_lock:
         _regex_cache.clear()
+        for key in _regex_stats:
+            _regex_stats[key] = 0
+
+def regex_cache_info() -> Dict[str, int]:
+    """
+    Возвращает статистику кэша регулярных выражений.
+    
+    Returns:
+        Dict[str, int]: Количество попаданий, промахов, вытеснений и текущий размер
+    """
+    with _regex_lock:
+        return {
+            **_regex_stats,
+            "size": len(_regex_cache),
+            "maxsize": REGEX_CACHE_MAXSIZE
+        }
 
 def cached_validator(maxsize: Optional[int] = 128):
     """
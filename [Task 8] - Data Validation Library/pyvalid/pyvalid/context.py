@@ -4,11 +4,34 @@
 
 from typing import Any, Dict, Optional, List, Callable
 from contextlib import contextmanager
+from functools import lru_cache
 import logging
+import sys
+from threading import Lock
 from .metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+# Максимальное число различных путей к полям в кэше
+PATH_CACHE_MAXSIZE = 4096
+
+@lru_cache(maxsize=PATH_CACHE_MAXSIZE)
+def join_path(parent: str, field_name: str) -> str:
+    """
+    Возвращает интернированный путь к полю.
+    
+    Схемы проверяют одни и те же поля многократно, поэтому путь
+    строится один раз и дальше берется из кэша без новых аллокаций.
+    
+    Args:
+        parent: Путь к родительскому полю
+        field_name: Имя поля
+    
+    Returns:
+        Путь в формате "parent.field_name"
+    """
+    return sys.intern(f"{parent}.{field_name}" if parent else str(field_name))
+
 class ValidationContext:
     """
     Класс для управления контекстом валидации.
@@ -27,11 +50,33 @@ class ValidationContext:
         custom_validators: Optional[Dict[str, Callable]] = None,
         strict_mode: bool = False
     ):
+        self._validation_stack: List[str] = []
+        # Полные пути для каждого уровня стека валидации
+        self._path_stack: List[str] = []
+        self.reset(data, path, custom_validators, strict_mode)
+    
+    def reset(
+        self,
+        data: Any,
+        path: str = "",
+        custom_validators: Optional[Dict[str, Callable]] = None,
+        strict_mode: bool = False
+    ) -> None:
+        """
+        Переинициализирует контекст для повторного использования.
+        
+        Args:
+            data: Данные для валидации
+            path: Начальный путь к полю
+            custom_validators: Пользовательские валидаторы
+            strict_mode: Режим строгой валидации
+        """
         self.path = path
         self.data = data
         self.custom_validators = custom_validators or {}
         self.strict_mode = strict_mode
-        self._validation_stack: List[str] = []
+        self._validation_stack.clear()
+        self._path_stack.clear()
     
     @contextmanager
     def enter_field(self, field_name: str):
@@ -46,14 +91,18 @@ class ValidationContext:
             ...     validate_user(user_data)
         """
         old_path = self.path
-        self.path = f"{old_path}.{field_name}" if old_path else field_name
+        self.path = join_path(old_path, field_name)
         self._validation_stack.append(field_name)
+        self._path_stack.append(
+            join_path(self._path_stack[-1] if self._path_stack else "", field_name)
+        )
         
         try:
             yield
         finally:
             self.path = old_path
             self._validation_stack.pop()
+            self._path_stack.pop()
     
     def get_field_value(self, field_name: str) -> Any:
         """
@@ -76,7 +125,7 @@ class ValidationContext:
         Returns:
             Полный путь в формате "field1.field2.field3"
         """
-        return ".".join(self._validation_stack)
+        return self._path_stack[-1] if self._path_stack else ""
     
     def validate_with_metrics(self, validator: Callable, value: Any) -> tuple[bool, Optional[str]]:
         """
@@ -149,6 +198,34 @@ class ValidationContext:
 # Глобальный контекст валидации
 current_context: Optional[ValidationContext] = None
 
+# Пул освобожденных контекстов для повторного использования
+MAX_CONTEXT_POOL_SIZE = 32
+_context_pool: List[ValidationContext] = []
+_context_pool_lock = Lock()
+
+def _acquire_context(
+    data: Any,
+    path: str,
+    custom_validators: Optional[Dict[str, Callable]],
+    strict_mode: bool
+) -> ValidationContext:
+    """Берет контекст из пула или создает новый."""
+    with _context_pool_lock:
+        context = _context_pool.pop() if _context_pool else None
+    
+    if context is None:
+        return ValidationContext(data, path, custom_validators, strict_mode)
+    
+    context.reset(data, path, custom_validators, strict_mode)
+    return context
+
+def _release_context(context: ValidationContext) -> None:
+    """Возвращает контекст в пул, освобождая ссылку на данные."""
+    context.reset(None)
+    with _context_pool_lock:
+        if len(_context_pool) < MAX_CONTEXT_POOL_SIZE:
+            _context_pool.append(context)
+
 def get_current_context() -> Optional[ValidationContext]:
     """
     Возвращает текущий контекст валидации.
@@ -174,15 +251,20 @@ def validation_context(
         custom_validators: Пользовательские валидаторы
         strict_mode: Режим строгой валидации
     
+    Контекст берется из пула и возвращается в него после выхода из блока,
+    поэтому сохранять ссылку на него за пределами блока with нельзя.
+    
     Example:
         >>> with validation_context(user_data, strict_mode=True):
         ...     validate_user(user_data)
     """
     global current_context
     old_context = current_context
-    current_context = ValidationContext(data, path, custom_validators, strict_mode)
+    context = _acquire_context(data, path, custom_validators, strict_mode)
+    current_context = context
     
     try:
-        yield current_context
+        yield context
     finally:
-        current_context = old_context 
\ No newline at end of file
+        current_context = old_context
+        _release_context(context) 
\ No newline at end of file
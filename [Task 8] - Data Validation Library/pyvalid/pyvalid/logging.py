@@ -3,17 +3,87 @@
 """
 
 import logging
+import logging.handlers
+import copy
 import json
-from typing import Any, Dict, Optional
+import queue
+import atexit
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import sys
 from .metrics import metrics
 
+try:
+    import orjson
+except ImportError:  # orjson - необязательная зависимость
+    orjson = None
+
 # Настройка базового логгера
 logger = logging.getLogger("pyvalid")
 logger.setLevel(logging.DEBUG)
 
+# Фоновый слушатель очереди логов (используется при use_queue=True)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler для очереди внутри процесса.
+    
+    Стандартный prepare() готовит запись к передаче между процессами:
+    вклеивает трассировку в message и обнуляет exc_info. Здесь запись
+    не покидает процесс, поэтому exc_info сохраняется, и ValidationFormatter
+    выводит структурированное поле "exception".
+    
+    Форматирование выполняется в потоке слушателя, пока потоки валидации
+    продолжают менять метрики и переданные данные. Поэтому снимок метрик
+    и копия validation_data делаются здесь, в вызывающем потоке.
+    
+    Attributes:
+        include_metrics: Прикладывать ли к записи снимок метрик
+    """
+    
+    def __init__(self, log_queue: "queue.SimpleQueue[logging.LogRecord]", include_metrics: bool = True):
+        super().__init__(log_queue)
+        self.include_metrics = include_metrics
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if self.include_metrics and not hasattr(record, "metrics"):
+            record.metrics = metrics.get_summary()
+        
+        validation_data = getattr(record, "validation_data", None)
+        if validation_data is not None:
+            try:
+                record.validation_data = copy.deepcopy(validation_data)
+            except Exception:
+                # Некопируемые значения - копируем хотя бы верхний уровень
+                record.validation_data = copy.copy(validation_data)
+        
+        return record
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """
+    Сериализует запись лога в JSON.
+    
+    Использует orjson, если он установлен, иначе стандартный json.
+    
+    Args:
+        data: Данные записи лога
+    
+    Returns:
+        str: JSON-строка
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # orjson не умеет сериализовать некоторые типы - используем json
+            pass
+    return json.dumps(data, ensure_ascii=False)
+
 # Форматтер для логов
 class ValidationFormatter(logging.Formatter):
     """
@@ -47,9 +117,12 @@ class ValidationFormatter(logging.Formatter):
             "line": record.lineno
         }
         
-        # Добавляем метрики, если включены
+        # Добавляем метрики, если включены; снимок из записи
+        # (см. _InProcessQueueHandler) соответствует моменту логирования
         if self.include_metrics:
-            metrics_data = metrics.get_summary()
+            metrics_data = getattr(record, "metrics", None)
+            if metrics_data is None:
+                metrics_data = metrics.get_summary()
             if metrics_data:
                 log_data["metrics"] = metrics_data
         
@@ -66,13 +139,14 @@ class ValidationFormatter(logging.Formatter):
                 "message": str(record.exc_info[1])
             }
         
-        return json.dumps(log_data, ensure_ascii=False)
+        return _dumps(log_data)
 
 def setup_logging(
     log_file: Optional[str] = None,
     log_level: int = logging.INFO,
     include_metrics: bool = True,
-    console_output: bool = True
+    console_output: bool = True,
+    use_queue: bool = False
 ) -> None:
     """
     Настраивает систему логирования.
@@ -82,6 +156,10 @@ def setup_logging(
         log_level: Уровень логирования
         include_metrics: Включать ли метрики в логи
         console_output: Выводить ли логи в консоль
+        use_queue: Выполнять форматирование и запись в фоновом потоке.
+            Логгер получает QueueHandler, а файловый и консольный обработчики
+            вызываются QueueListener'ом, поэтому записи попадают в файл
+            с задержкой (до вызова stop_logging())
     
     Example:
         >>> setup_logging(
@@ -90,8 +168,10 @@ def setup_logging(
         ...     include_metrics=True
         ... )
     """
-    # Очищаем существующие обработчики
+    # Останавливаем предыдущий слушатель и очищаем существующие обработчики
+    stop_logging()
     logger.handlers.clear()
+    handlers: List[logging.Handler] = []
     
     # Создаем форматтер
     formatter = ValidationFormatter(include_metrics=include_metrics)
@@ -104,14 +184,45 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setFormatter(formatter)
         file_handler.setLevel(log_level)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
     # Настраиваем вывод в консоль
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         console_handler.setLevel(log_level)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    if not use_queue:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return
+    
+    # Вызывающий поток только кладет LogRecord в очередь
+    global _queue_listener
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _InProcessQueueHandler(log_queue, include_metrics=include_metrics)
+    queue_handler.setLevel(log_level)
+    logger.addHandler(queue_handler)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+def stop_logging() -> None:
+    """
+    Останавливает фоновый слушатель очереди логов, дописывая оставшиеся записи.
+    
+    Вызывается автоматически при повторной настройке и при завершении процесса.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+atexit.register(stop_logging)
 
 def log_validation(
     message: str,
@@ -138,6 +249,10 @@ def log_validation(
         ...     validation_data={"value": "invalid@email"}
         ... )
     """
+    # Не собираем дополнительные поля, если уровень отключен
+    if not logger.isEnabledFor(level):
+        return
+    
     extra = {}
     
     if validation_path:
@@ -190,8 +305,11 @@ class ValidationLogger:
             is_valid: Результат валидации
             errors: Словарь ошибок
         """
-        message = "Validation successful" if is_valid else "Validation failed"
         level = logging.INFO if is_valid else logging.WARNING
+        if not logger.isEnabledFor(level):
+            return
+        
+        message = "Validation successful" if is_valid else "Validation failed"
         
         log_validation(
             message,
@@ -216,8 +334,11 @@ class ValidationLogger:
             is_valid: Результат валидации
             error: Сообщение об ошибке
         """
-        field_path = f"{self.validation_path}.{field}" if self.validation_path else field
         level = logging.DEBUG if is_valid else logging.WARNING
+        if not logger.isEnabledFor(level):
+            return
+        
+        field_path = f"{self.validation_path}.{field}" if self.validation_path else field
         
         log_validation(
             f"Field validation {'successful' if is_valid else 'failed'}",
@@ -229,6 +350,38 @@ class ValidationLogger:
             } if error else {"value": value}
         )
     
+    def log_fields(
+        self,
+        results: List[Tuple[str, Any, bool, Optional[str]]]
+    ) -> None:
+        """
+        Логирует результаты валидации нескольких полей одной записью.
+        
+        Заменяет серию вызовов log_field_validation: вместо записи на каждое
+        поле формируется одна запись со списком "fields".
+        
+        Args:
+            results: Список кортежей (имя поля, значение, результат, ошибка)
+        """
+        all_valid = all(is_valid for _, _, is_valid, _ in results)
+        level = logging.DEBUG if all_valid else logging.WARNING
+        if not logger.isEnabledFor(level):
+            return
+        
+        fields = []
+        for field, value, is_valid, error in results:
+            entry = {"field": field, "value": value, "is_valid": is_valid}
+            if error:
+                entry["error"] = error
+            fields.append(entry)
+        
+        log_validation(
+            f"Fields validation {'successful' if all_valid else 'failed'}",
+            level=level,
+            validation_path=self.validation_path,
+            validation_data={"fields": fields}
+        )
+    
     def log_validation_error(
         self,
         error: Exception,
@@ -4,13 +4,16 @@
 
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Any, Deque, Dict, Iterable, Optional, Union
+from collections import Counter, defaultdict, deque
 import statistics
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Максимальное количество хранимых замеров времени для одного поля
+MAX_FIELD_SAMPLES = 1000
+
 @dataclass
 class ValidationMetrics:
     """
@@ -21,15 +24,17 @@ class ValidationMetrics:
         total_time: Общее время валидации в секундах
         success_count: Количество успешных валидаций
         failure_count: Количество неуспешных валидаций
-        field_times: Время валидации по полям
+        field_times: Время валидации по полям (последние MAX_FIELD_SAMPLES замеров)
         error_counts: Количество ошибок по типам
     """
     total_validations: int = 0
     total_time: float = 0.0
     success_count: int = 0
     failure_count: int = 0
-    field_times: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
-    error_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    field_times: Dict[str, Deque[float]] = field(
+        default_factory=lambda: defaultdict(lambda: deque(maxlen=MAX_FIELD_SAMPLES))
+    )
+    error_counts: Counter = field(default_factory=Counter)
     
     def start_validation(self) -> float:
         """
@@ -40,7 +45,13 @@ class ValidationMetrics:
         """
         return time.perf_counter()
     
-    def end_validation(self, start_time: float, path: str, success: bool, error_type: Optional[str] = None) -> None:
+    def end_validation(
+        self,
+        start_time: float,
+        path: str,
+        success: bool,
+        error_type: Optional[Union[str, Iterable[str]]] = None
+    ) -> None:
         """
         Завершает отсчет времени и обновляет метрики.
         
@@ -48,7 +59,7 @@ class ValidationMetrics:
             start_time: Время начала валидации
             path: Путь к валидируемому полю
             success: Результат валидации
-            error_type: Тип ошибки, если валидация не удалась
+            error_type: Тип ошибки (или несколько типов), если валидация не удалась
         """
         duration = time.perf_counter() - start_time
         
@@ -60,8 +71,21 @@ class ValidationMetrics:
             self.success_count += 1
         else:
             self.failure_count += 1
-            if error_type:
+            if isinstance(error_type, str):
                 self.error_counts[error_type] += 1
+            elif error_type:
+                self.error_counts.update(error_type)
+    
+    def reset(self) -> None:
+        """
+        Сбрасывает все накопленные метрики.
+        """
+        self.total_validations = 0
+        self.total_time = 0.0
+        self.success_count = 0
+        self.failure_count = 0
+        self.field_times.clear()
+        self.error_counts.clear()
     
     def get_field_stats(self, path: str) -> Dict[str, float]:
         """
@@ -73,9 +97,11 @@ class ValidationMetrics:
         Returns:
             Словарь со статистикой (min, max, avg, median)
         """
-        times = self.field_times[path]
+        times = self.field_times.get(path)
         if not times:
             return {}
+        # Копия: другие потоки могут дописывать замеры во время подсчета
+        times = tuple(times)
             
         return {
             "min": min(times),
@@ -100,7 +126,7 @@ class ValidationMetrics:
             "error_distribution": dict(self.error_counts),
             "field_stats": {
                 path: self.get_field_stats(path)
-                for path in self.field_times
+                for path in list(self.field_times)
             }
         }
     
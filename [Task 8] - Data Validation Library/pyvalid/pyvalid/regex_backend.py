@@ -0,0 +1,128 @@
+"""
+Модуль выбора движка регулярных выражений.
+
+Если установлен hyperscan, шаблоны вида ``^...$`` компилируются в DFA без
+возвратов; иначе используется стандартный ``re`` через общий кэш
+регулярных выражений.
+"""
+
+from functools import lru_cache
+from typing import Any, Optional, Union, Pattern
+import logging
+import threading
+
+from .cache import get_cached_regex, REGEX_CACHE_MAXSIZE
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
+
+
+def _anchored_expression(pattern: str) -> str:
+    """
+    Оборачивает шаблон так, чтобы поиск в любой позиции совпадал с ``re.match``.
+    
+    Hyperscan сообщает о совпадении в любом месте строки, а ``^`` в начале
+    шаблона не якорит альтернативы: ``^a|b$`` находит ``b`` в ``"xb"``.
+    Внешняя группа с ``^`` привязывает весь шаблон к началу строки.
+    
+    Args:
+        pattern: Исходный шаблон
+    
+    Returns:
+        str: Шаблон для компиляции в hyperscan
+    """
+    return f"^(?:{pattern})"
+
+# Название активного движка
+BACKEND = "hyperscan" if hyperscan is not None else "re"
+
+
+class HyperscanMatcher:
+    """
+    Обертка над базой hyperscan с интерфейсом ``match`` как у ``re.Pattern``.
+    
+    Scratch-буфер hyperscan не потокобезопасен, поэтому
+    для каждого потока создается свой.
+    
+    Attributes:
+        pattern: Исходный шаблон
+    """
+    
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[_anchored_expression(pattern).encode()],
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8]
+        )
+        self._local = threading.local()
+    
+    def _get_scratch(self) -> Any:
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self._db)
+            self._local.scratch = scratch
+        return scratch
+    
+    def match(self, value: str) -> bool:
+        """
+        Проверяет соответствие строки шаблону.
+        
+        Args:
+            value: Проверяемая строка
+        
+        Returns:
+            bool: True, если строка соответствует шаблону
+        """
+        found = []
+        
+        def on_match(*args: Any) -> bool:
+            found.append(True)
+            return True  # Остановить сканирование после первого совпадения
+        
+        try:
+            self._db.scan(value.encode(), match_event_handler=on_match, scratch=self._get_scratch())
+        except hyperscan.ScanTerminated:
+            # Остановка из обработчика совпадений сообщается исключением
+            pass
+        return bool(found)
+
+
+@lru_cache(maxsize=REGEX_CACHE_MAXSIZE)
+def _compile_hyperscan(pattern: str) -> Optional[HyperscanMatcher]:
+    try:
+        return HyperscanMatcher(pattern)
+    except hyperscan.error as e:
+        # Обратные ссылки, lookaround и т.п. hyperscan не поддерживает
+        logger.debug(f"Hyperscan cannot compile {pattern!r}, using re: {e}")
+        return None
+
+
+def get_matcher(pattern: str) -> Union[Pattern, HyperscanMatcher]:
+    """
+    Возвращает объект с методом ``match`` для указанного шаблона.
+    
+    Hyperscan используется для шаблонов вида ``^...$``; весь шаблон
+    компилируется внутри заякоренной группы (см. ``_anchored_expression``),
+    поэтому результат совпадает с ``re.match`` и для альтернатив.
+    
+    Args:
+        pattern: Шаблон регулярного выражения
+    
+    Returns:
+        Union[Pattern, HyperscanMatcher]: Скомпилированный шаблон
+    
+    Raises:
+        ValueError: Если шаблон некорректен
+    """
+    # Проверка синтаксиса и запасной вариант всегда через re
+    compiled = get_cached_regex(pattern)
+    if hyperscan is not None and pattern.startswith("^") and pattern.endswith("$"):
+        matcher = _compile_hyperscan(pattern)
+        if matcher is not None:
+            return matcher
+    return compiled
@@ -4,10 +4,19 @@
 Содержит класс Schema для описания и проверки сложных структур данных.
 """
 
-from typing import Any, Dict, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional, Union
+import json
 from .validators import Validator
 from .exceptions import ValidationError, SchemaError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Ключ ошибки, относящейся ко всему документу, а не к отдельному полю
+ROOT_ERROR_KEY = "__root__"
+
 class Schema:
     """
     Класс для описания схемы валидации сложных структур данных.
@@ -19,6 +28,48 @@ class Schema:
     def __init__(self, fields: Dict[str, Validator], strict: bool = False):
         self.fields = fields
         self.strict = strict
+        self.compile()
+
+    def compile(self) -> None:
+        """
+        Подготавливает план валидации по текущему набору полей.
+        
+        План - это кортеж пар (имя поля, метод validate валидатора), который
+        обходится в validate() без повторного разбора словаря fields.
+        По плану также генерируется специализированная функция проверки полей
+        без цикла (см. _generate_validate_fields).
+        Вызывается автоматически при создании схемы; при изменении fields
+        после создания схемы метод нужно вызвать повторно.
+        """
+        self._field_names = frozenset(self.fields)
+        self._plan: Tuple[Tuple[str, Callable[[Any], Tuple[bool, Optional[str]]]], ...] = tuple(
+            (field, validator.validate) for field, validator in self.fields.items()
+        )
+        self._validate_fields = self._generate_validate_fields()
+
+    def _generate_validate_fields(self) -> Callable[[Dict[str, Any], Dict[str, str]], None]:
+        """
+        Генерирует функцию проверки полей, развернутую по плану валидации.
+        
+        Для каждого поля создается отдельный блок кода, а имена полей и методы
+        validate передаются в пространство имен функции как константы, поэтому
+        при валидации не выполняется обход плана и распаковка кортежей.
+        
+        Returns:
+            Функция (data, errors), записывающая ошибки полей в errors
+        """
+        namespace: Dict[str, Any] = {}
+        lines = ["def _validate_fields(data, errors):", "    get_value = data.get"]
+        for index, (field, validate) in enumerate(self._plan):
+            namespace[f"_field{index}"] = field
+            namespace[f"_validate{index}"] = validate
+            lines.append(f"    is_valid, error = _validate{index}(get_value(_field{index}))")
+            lines.append("    if not is_valid:")
+            lines.append(f"        errors[_field{index}] = error")
+        lines.append("    return None")
+        code = compile("\n".join(lines), "<pyvalid.schema>", "exec")
+        exec(code, namespace)
+        return namespace["_validate_fields"]
 
     def validate(self, data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, str]]]:
         """
@@ -35,16 +86,79 @@ class Schema:
         errors = {}
         # Проверка на неожиданные поля
         if self.strict:
-            unknown_fields = set(data.keys()) - set(self.fields.keys())
+            unknown_fields = data.keys() - self._field_names
             if unknown_fields:
                 for field in unknown_fields:
                     errors[field] = "Unexpected field"
-        # Проверка каждого поля по валидатору
-        for field, validator in self.fields.items():
-            value = data.get(field)
-            is_valid, error = validator.validate(value)
-            if not is_valid:
-                errors[field] = error
+        # Проверка каждого поля сгенерированной по плану функцией
+        self._validate_fields(data, errors)
         if errors:
             return False, errors
-        return True, None 
\ No newline at end of file
+        return True, None 
+
+    def validate_bytes(
+        self,
+        raw: Union[bytes, str]
+    ) -> Tuple[bool, Optional[Dict[str, str]], Optional[Dict[str, Any]]]:
+        """
+        Разбирает JSON-документ и валидирует его по схеме.
+        
+        Тело запроса разбирается один раз (через orjson, если он установлен),
+        и полученный словарь сразу проходит по плану валидации без
+        промежуточных копий. Некорректный JSON или документ, не являющийся
+        объектом, отклоняются до запуска валидаторов полей.
+        
+        Args:
+            raw: JSON-документ в виде bytes или str
+        
+        Returns:
+            (is_valid, errors, data):
+                is_valid (bool): Валидны ли данные
+                errors (dict): Словарь ошибок (None, если ошибок нет)
+                data (dict): Разобранный документ (None, если JSON некорректен)
+        """
+        try:
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError as e:
+            # orjson.JSONDecodeError и json.JSONDecodeError наследуют ValueError
+            return False, {ROOT_ERROR_KEY: f"Invalid JSON: {e}"}, None
+        if not isinstance(data, dict):
+            return False, {ROOT_ERROR_KEY: "Value must be an object"}, data
+        is_valid, errors = self.validate(data)
+        return is_valid, errors, data
+
+    def validate_many(
+        self,
+        records: List[Dict[str, Any]]
+    ) -> List[Tuple[bool, Optional[Dict[str, str]]]]:
+        """
+        Валидирует список записей по схеме.
+        
+        Валидация выполняется по столбцам: каждый валидатор проходит по всем
+        значениям своего поля. Каждое значение проверяется отдельно, поэтому
+        результат совпадает с вызовом validate() для каждой записи, в том
+        числе для пользовательских валидаторов с состоянием.
+        
+        Args:
+            records: Список словарей с данными для валидации
+        
+        Returns:
+            Список пар (is_valid, errors) в порядке исходных записей
+        """
+        errors: List[Dict[str, str]] = [{} for _ in records]
+        # Проверка на неожиданные поля
+        if self.strict:
+            field_names = self._field_names
+            for record, record_errors in zip(records, errors):
+                for field in record.keys() - field_names:
+                    record_errors[field] = "Unexpected field"
+        # Проверка каждого столбца по подготовленному плану
+        for field, validate in self._plan:
+            for record, record_errors in zip(records, errors):
+                is_valid, error = validate(record.get(field))
+                if not is_valid:
+                    record_errors[field] = error
+        return [
+            (False, record_errors) if record_errors else (True, None)
+            for record_errors in errors
+        ]
\ No newline at end of file
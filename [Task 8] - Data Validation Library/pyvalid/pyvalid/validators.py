@@ -7,13 +7,17 @@
 - Пользовательские валидаторы
 """
 
-import re
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime, date
 from typing import Any, Optional, Union, Dict, List, Callable, Tuple, TypeVar, Generic
 from typing_extensions import TypeGuard
 
 from .exceptions import ValidationError, ValidatorError
+from .regex_backend import get_matcher
+
+# Строковые представления, допустимые для нестрогой проверки булевых значений
+_BOOLEAN_STRINGS = frozenset(("true", "false", "1", "0"))
 
 # Типовые переменные
 T = TypeVar('T')
@@ -123,6 +127,13 @@ class StringValidator(Validator[str]):
         self.pattern = pattern
         self.allowed_values = allowed_values
         self.trim_whitespace = trim_whitespace
+        # Регулярное выражение компилируется один раз и разделяется между валидаторами
+        self._compiled_pattern = get_matcher(pattern) if pattern is not None else None
+        # Границы длины для единой проверки диапазона в validate()
+        self._length_bounds = (
+            min_length if min_length is not None else 0,
+            max_length if max_length is not None else sys.maxsize
+        )
     
     def validate(self, value: Any) -> Tuple[bool, Optional[str]]:
         """Валидирует строковое значение."""
@@ -146,26 +157,22 @@ class StringValidator(Validator[str]):
         if self.trim_whitespace:
             value = value.strip()
         
-        # Проверка минимальной длины
-        if self.min_length is not None and len(value) < self.min_length:
-            return False, self._format_error(
-                f"String length must be at least {self.min_length} characters"
-            )
-        
-        # Проверка максимальной длины
-        if self.max_length is not None and len(value) > self.max_length:
+        # Проверка длины: одно сравнение диапазона, ветвление только при ошибке
+        length = len(value)
+        min_length, max_length = self._length_bounds
+        if not min_length <= length <= max_length:
+            if length < min_length:
+                return False, self._format_error(
+                    f"String length must be at least {self.min_length} characters"
+                )
             return False, self._format_error(
                 f"String length must be at most {self.max_length} characters"
             )
         
-        # Проверка пустой строки
-        if self.min_length and self.min_length > 0 and len(value) == 0:
-            return False, self._format_error("String cannot be empty")
-        
         # Проверка регулярного выражения
-        if self.pattern is not None:
-            if not re.match(self.pattern, value):
-                return False, self._format_error(f"String does not match pattern: {self.pattern}")
+        pattern = self._compiled_pattern
+        if pattern is not None and not pattern.match(value):
+            return False, self._format_error(f"String does not match pattern: {self.pattern}")
         
         # Проверка разрешенных значений
         if self.allowed_values is not None and value not in self.allowed_values:
@@ -204,6 +211,14 @@ class NumberValidator(Validator[Union[int, float]]):
         self.max_value = max_value
         self.integer_only = integer_only
         self.allowed_values = allowed_values
+        # Множество для проверки разрешенных значений за O(1);
+        # нехешируемые значения проверяются по исходному списку
+        self._allowed_set = None
+        if allowed_values is not None:
+            try:
+                self._allowed_set = frozenset(allowed_values)
+            except TypeError:
+                self._allowed_set = allowed_values
     
     def validate(self, value: Any) -> Tuple[bool, Optional[str]]:
         """Валидирует числовое значение."""
@@ -240,7 +255,7 @@ class NumberValidator(Validator[Union[int, float]]):
             )
         
         # Проверка разрешенных значений
-        if self.allowed_values is not None and value not in self.allowed_values:
+        if self._allowed_set is not None and value not in self._allowed_set:
             return False, self._format_error(
                 f"Value must be one of: {', '.join(map(str, self.allowed_values))}"
             )
@@ -289,7 +304,7 @@ class BooleanValidator(Validator[bool]):
         # Нестрогая проверка (разрешает строки "true"/"false", числа 0/1)
         if not self.strict:
             if isinstance(value, str):
-                if value.lower() not in ("true", "false", "1", "0"):
+                if value.lower() not in _BOOLEAN_STRINGS:
                     return False, self._format_error("Value must be a valid boolean")
             elif isinstance(value, (int, float)):
                 if value not in (0, 1):
@@ -349,8 +364,11 @@ class DateValidator(Validator[Union[datetime, date]]):
                 if self.format:
                     value = datetime.strptime(value, self.format)
                 else:
-                    # Попытка автоматического парсинга
-                    value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+                    # Попытка автоматического парсинга; fromisoformat реализован на C,
+                    # поэтому строку копируем только при наличии суффикса 'Z'
+                    if value.endswith('Z'):
+                        value = value[:-1] + '+00:00'
+                    value = datetime.fromisoformat(value)
             except ValueError:
                 return False, self._format_error("Invalid date format")
         
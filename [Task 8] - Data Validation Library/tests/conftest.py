@@ -0,0 +1,15 @@
+"""
+Общие фикстуры для тестов PyValid.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    """Общий цикл событий для всех асинхронных тестов модуля."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
@@ -37,6 +37,9 @@ setup_logging(
 
 logger = ValidationLogger()
 
+# Временная метка вычисляется один раз при импорте модуля
+_NOW_ISO = datetime.now().isoformat()
+
 # Фикстуры
 @pytest.fixture
 def user_schema():
@@ -68,7 +71,7 @@ def valid_user_data():
         "email": "john@example.com",
         "age": 25,
         "is_active": True,
-        "created_at": datetime.now().isoformat()
+        "created_at": _NOW_ISO
     }
 
 @pytest.fixture
@@ -98,19 +101,19 @@ class TestAsyncValidator:
         await asyncio.sleep(0.1)  # Имитация асинхронной операции
         return "@" in value and "." in value
     
-    def test_async_validator_decorator(self):
+    def test_async_validator_decorator(self, event_loop):
         """Тест декоратора асинхронного валидатора."""
         validator = self.validate_username
         
         # Проверка валидного значения
-        result = asyncio.run(validator("john_doe"))
+        result = event_loop.run_until_complete(validator("john_doe"))
         assert result is True
         
         # Проверка невалидного значения
-        result = asyncio.run(validator("jo"))
+        result = event_loop.run_until_complete(validator("jo"))
         assert result is False
     
-    def test_multiple_async_validators(self):
+    def test_multiple_async_validators(self, event_loop):
         """Тест нескольких асинхронных валидаторов."""
         username_validator = self.validate_username
         email_validator = self.validate_email
@@ -121,31 +124,31 @@ class TestAsyncValidator:
             return username_valid and email_valid
         
         # Проверка валидных данных
-        result = asyncio.run(validate_user("john_doe", "john@example.com"))
+        result = event_loop.run_until_complete(validate_user("john_doe", "john@example.com"))
         assert result is True
         
         # Проверка невалидных данных
-        result = asyncio.run(validate_user("jo", "invalid-email"))
+        result = event_loop.run_until_complete(validate_user("jo", "invalid-email"))
         assert result is False
 
 # Тесты для асинхронной схемы валидации
 class TestAsyncSchemaValidator:
     """Тесты для асинхронной схемы валидации."""
     
-    def test_async_schema_validation(self, async_user_schema, valid_user_data, invalid_user_data):
+    def test_async_schema_validation(self, event_loop, async_user_schema, valid_user_data, invalid_user_data):
         """Тест валидации асинхронной схемы."""
         # Проверка валидных данных
-        is_valid, errors = asyncio.run(async_user_schema.validate(valid_user_data))
+        is_valid, errors = event_loop.run_until_complete(async_user_schema.validate(valid_user_data))
         assert is_valid
         assert errors is None
         
         # Проверка невалидных данных
-        is_valid, errors = asyncio.run(async_user_schema.validate(invalid_user_data))
+        is_valid, errors = event_loop.run_until_complete(async_user_schema.validate(invalid_user_data))
         assert not is_valid
         assert errors is not None
         assert len(errors) > 0
     
-    def test_async_schema_strict_mode(self, async_user_schema):
+    def test_async_schema_strict_mode(self, event_loop, async_user_schema):
         """Тест строгого режима асинхронной схемы."""
         # Создаем схему в строгом режиме
         strict_schema = create_async_schema(
@@ -164,11 +167,11 @@ class TestAsyncSchemaValidator:
         }
         
         # Проверка в строгом режиме
-        is_valid, errors = asyncio.run(strict_schema.validate(data))
+        is_valid, errors = event_loop.run_until_complete(strict_schema.validate(data))
         assert not is_valid
         assert "extra_field" in str(errors)
     
-    def test_async_schema_nested_validation(self):
+    def test_async_schema_nested_validation(self, event_loop):
         """Тест валидации вложенных объектов."""
         # Создаем схему с вложенными объектами
         nested_schema = create_async_schema({
@@ -207,12 +210,12 @@ class TestAsyncSchemaValidator:
         }
         
         # Проверка валидных данных
-        is_valid, errors = asyncio.run(nested_schema.validate(valid_data))
+        is_valid, errors = event_loop.run_until_complete(nested_schema.validate(valid_data))
         assert is_valid
         assert errors is None
         
         # Проверка невалидных данных
-        is_valid, errors = asyncio.run(nested_schema.validate(invalid_data))
+        is_valid, errors = event_loop.run_until_complete(nested_schema.validate(invalid_data))
         assert not is_valid
         assert errors is not None
         assert len(errors) > 0
@@ -221,7 +224,7 @@ class TestAsyncSchemaValidator:
 class TestAsyncValidationMetrics:
     """Тесты для метрик асинхронной валидации."""
     
-    def test_validate_with_metrics(self, async_user_schema, valid_user_data, invalid_user_data):
+    def test_validate_with_metrics(self, event_loop, async_user_schema, valid_user_data, invalid_user_data):
         """Тест валидации с метриками."""
         from pyvalid.metrics import metrics
         
@@ -234,14 +237,14 @@ class TestAsyncValidationMetrics:
         metrics._error_counts.clear()
         
         # Валидация валидных данных
-        is_valid, errors = asyncio.run(
+        is_valid, errors = event_loop.run_until_complete(
             validate_with_metrics(async_user_schema, valid_user_data)
         )
         assert is_valid
         assert errors is None
         
         # Валидация невалидных данных
-        is_valid, errors = asyncio.run(
+        is_valid, errors = event_loop.run_until_complete(
             validate_with_metrics(async_user_schema, invalid_user_data)
         )
         assert not is_valid
@@ -264,18 +267,18 @@ class TestAsyncValidationMetrics:
         assert len(error_counts) > 0
         assert sum(error_counts.values()) > 0
     
-    def test_async_validation_performance(self, async_user_schema, valid_user_data):
+    def test_async_validation_performance(self, event_loop, async_user_schema, valid_user_data):
         """Тест производительности асинхронной валидации."""
         import time
         
         # Валидация без метрик
         start_time = time.time()
-        is_valid, errors = asyncio.run(async_user_schema.validate(valid_user_data))
+        is_valid, errors = event_loop.run_until_complete(async_user_schema.validate(valid_user_data))
         base_time = time.time() - start_time
         
         # Валидация с метриками
         start_time = time.time()
-        is_valid, errors = asyncio.run(
+        is_valid, errors = event_loop.run_until_complete(
             validate_with_metrics(async_user_schema, valid_user_data)
         )
         metrics_time = time.time() - start_time
@@ -287,7 +290,7 @@ class TestAsyncValidationMetrics:
 class TestAsyncValidationLogging:
     """Тесты для логирования асинхронной валидации."""
     
-    def test_async_validation_logging(self, async_user_schema, valid_user_data, invalid_user_data):
+    def test_async_validation_logging(self, event_loop, async_user_schema, valid_user_data, invalid_user_data):
         """Тест логирования асинхронной валидации."""
         logger = ValidationLogger()
         
@@ -300,10 +303,10 @@ class TestAsyncValidationLogging:
                 logger.log_validation_error(e, {"data": data})
         
         # Логирование валидных данных
-        asyncio.run(validate_with_logging(valid_user_data))
+        event_loop.run_until_complete(validate_with_logging(valid_user_data))
         
         # Логирование невалидных данных
-        asyncio.run(validate_with_logging(invalid_user_data))
+        event_loop.run_until_complete(validate_with_logging(invalid_user_data))
         
         # Логирование ошибки
         async def validate_with_error():
@@ -313,4 +316,4 @@ class TestAsyncValidationLogging:
             except Exception as e:
                 logger.log_validation_error(e, {"data": invalid_user_data})
         
-        asyncio.run(validate_with_error()) 
\ No newline at end of file
+        event_loop.run_until_complete(validate_with_error()) 
\ No newline at end of file
@@ -23,6 +23,7 @@ from pyvalid.validators import (
 from pyvalid.cache import (
     get_cached_regex,
     clear_regex_cache,
+    regex_cache_info,
     cached_validator,
     ValidatorCache
 )
@@ -101,6 +102,43 @@ class TestRegexCache:
             assert isinstance(regex, Pattern)
             # Новый объект, не из кэша
             assert regex is not get_cached_regex(pattern)
+    
+    def test_regex_cache_eviction(self, regex_patterns, monkeypatch):
+        """Тест вытеснения старых выражений из ограниченного кэша."""
+        import pyvalid.cache
+        
+        monkeypatch.setattr(pyvalid.cache, "REGEX_CACHE_MAXSIZE", 2)
+        clear_regex_cache()
+        
+        for pattern in regex_patterns:
+            get_cached_regex(pattern)
+        get_cached_regex(regex_patterns[-1])
+        
+        info = regex_cache_info()
+        assert info["size"] == 2
+        assert info["evictions"] == len(regex_patterns) - 2
+        assert info["misses"] == len(regex_patterns)
+        assert info["hits"] == 1
+    
+    def test_hyperscan_expression_rejects_unanchored_alternative(self):
+        """Тест того, что альтернатива без общего якоря не совпадает в середине строки."""
+        from pyvalid.regex_backend import _anchored_expression
+        
+        pattern = "^a|b$"
+        # Поиск в любой позиции, как в hyperscan, находит "b" в конце
+        assert re.search(pattern, "xb") is not None
+        assert re.search(_anchored_expression(pattern), "xb") is None
+        for value in ("a", "ab", "b", "xb", "x"):
+            expected = re.match(pattern, value) is not None
+            assert (re.search(_anchored_expression(pattern), value) is not None) == expected
+    
+    def test_get_matcher_rejects_unanchored_alternative(self):
+        """Тест того, что выбранный движок не принимает ``^a|b$`` для "xb"."""
+        from pyvalid.regex_backend import get_matcher
+        
+        matcher = get_matcher("^a|b$")
+        assert not matcher.match("xb")
+        assert matcher.match("b")
 
 # Тесты для кэширования валидаторов
 class TestValidatorCache:
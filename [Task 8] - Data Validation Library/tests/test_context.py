@@ -34,6 +34,9 @@ setup_logging(
 
 logger = ValidationLogger()
 
+# Временная метка вычисляется один раз при импорте модуля
+_NOW_ISO = datetime.now().isoformat()
+
 # Фикстуры
 @pytest.fixture
 def user_schema():
@@ -54,7 +57,7 @@ def valid_user_data():
         "email": "john@example.com",
         "age": 25,
         "is_active": True,
-        "created_at": datetime.now().isoformat()
+        "created_at": _NOW_ISO
     }
 
 @pytest.fixture
@@ -291,7 +294,7 @@ class TestContextIntegration:
             assert is_valid1 is True
             assert is_valid2 is True
     
-    def test_context_with_async_validation(self, valid_user_data):
+    def test_context_with_async_validation(self, event_loop, valid_user_data):
         """Тест контекста с асинхронной валидацией."""
         import asyncio
         from pyvalid.async_validators import async_validator
@@ -309,7 +312,7 @@ class TestContextIntegration:
                 with context.enter_field("username"):
                     assert context.get_field_value("username") == "john_doe"
         
-        asyncio.run(validate_in_context())
+        event_loop.run_until_complete(validate_in_context())
     
     def test_nested_contexts(self, valid_user_data):
         """Тест вложенных контекстов."""
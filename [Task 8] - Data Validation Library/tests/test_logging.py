@@ -4,6 +4,7 @@
 
 import pytest
 import logging
+import logging.handlers
 import json
 import os
 from datetime import datetime
@@ -25,10 +26,14 @@ from pyvalid.validators import (
 from pyvalid.logging import (
     ValidationFormatter,
     setup_logging,
+    stop_logging,
     log_validation,
     ValidationLogger
 )
 
+# Временная метка вычисляется один раз при импорте модуля
+_NOW_ISO = datetime.now().isoformat()
+
 # Фикстуры
 @pytest.fixture
 def user_schema():
@@ -49,7 +54,7 @@ def valid_user_data():
         "email": "john@example.com",
         "age": 25,
         "is_active": True,
-        "created_at": datetime.now().isoformat()
+        "created_at": _NOW_ISO
     }
 
 @pytest.fixture
@@ -222,6 +227,116 @@ class TestLoggingSetup:
         # Проверяем формат
         assert isinstance(formatter, ValidationFormatter)
         assert formatter._fmt == custom_format
+    
+    def test_setup_with_queue(self, temp_log_file):
+        """Тест логирования через фоновую очередь."""
+        setup_logging(
+            log_file=temp_log_file,
+            log_level=logging.DEBUG,
+            include_metrics=False,
+            console_output=False,
+            use_queue=True
+        )
+        
+        logger = logging.getLogger("pyvalid")
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        
+        log_validation("Queued record", validation_path="user.username")
+        stop_logging()
+        
+        with open(temp_log_file, "r") as f:
+            log_data = json.loads(f.read().strip())
+            assert log_data["message"] == "Queued record"
+            assert log_data["validation_path"] == "user.username"
+    
+    def test_queue_keeps_exception_info(self, temp_log_file):
+        """Тест сохранения структурированной информации об исключении в очереди."""
+        setup_logging(
+            log_file=temp_log_file,
+            log_level=logging.DEBUG,
+            include_metrics=False,
+            console_output=False,
+            use_queue=True
+        )
+        
+        ValidationLogger("user.age").log_validation_error(ValueError("Age is negative"))
+        stop_logging()
+        
+        with open(temp_log_file, "r") as f:
+            log_data = json.loads(f.read().strip())
+            assert log_data["message"] == "Validation error occurred"
+            assert log_data["exception"] == {"type": "ValueError", "message": "Age is negative"}
+    
+    def test_queue_snapshots_record_at_log_time(self, temp_log_file):
+        """Тест снимка метрик и данных в момент логирования, а не форматирования."""
+        from pyvalid.metrics import metrics
+        
+        metrics.reset()
+        setup_logging(
+            log_file=temp_log_file,
+            log_level=logging.DEBUG,
+            include_metrics=True,
+            console_output=False,
+            use_queue=True
+        )
+        
+        try:
+            metrics.end_validation(metrics.start_validation(), "user.age", True)
+            data = {"value": 25}
+            log_validation("Snapshot", validation_path="user.age", validation_data=data)
+            data["value"] = -1
+            metrics.end_validation(metrics.start_validation(), "user.age", False, "range")
+            stop_logging()
+        finally:
+            metrics.reset()
+        
+        with open(temp_log_file, "r") as f:
+            log_data = json.loads(f.read().strip())
+            assert log_data["validation_data"] == {"value": 25}
+            assert log_data["metrics"]["total_validations"] == 1
+            assert log_data["metrics"]["error_distribution"] == {}
+    
+    def test_queue_with_concurrent_metrics_updates(self, temp_log_file):
+        """Тест логирования через очередь, пока другой поток добавляет метрики полей."""
+        import threading
+        from pyvalid.metrics import metrics
+        
+        metrics.reset()
+        setup_logging(
+            log_file=temp_log_file,
+            log_level=logging.DEBUG,
+            include_metrics=True,
+            console_output=False,
+            use_queue=True
+        )
+        
+        stop = threading.Event()
+        
+        def add_fields():
+            # Словари метрик постоянно меняют размер: поля добавляются и сбрасываются
+            index = 0
+            while not stop.is_set():
+                metrics.end_validation(metrics.start_validation(), f"field_{index}", False, f"error_{index}")
+                index = (index + 1) % 200
+                if index == 0:
+                    metrics.reset()
+        
+        worker = threading.Thread(target=add_fields)
+        worker.start()
+        try:
+            for index in range(300):
+                log_validation(f"Record {index}", validation_data={"index": index})
+        finally:
+            stop.set()
+            worker.join()
+            stop_logging()
+            metrics.reset()
+        
+        with open(temp_log_file, "r") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        assert [record["validation_data"]["index"] for record in records] == list(range(300))
+        assert all("metrics" in record for record in records)
 
 # Тесты для логирования валидации
 class TestValidationLogging:
@@ -304,6 +419,34 @@ class TestValidationLogging:
             assert "test" in log_content
             assert "value" in log_content
     
+    def test_log_fields(self, temp_log_file, invalid_user_data):
+        """Тест пакетного логирования результатов полей."""
+        # Настройка логирования
+        setup_logging(
+            log_file=temp_log_file,
+            log_level=logging.DEBUG,
+            include_metrics=False
+        )
+        
+        logger = ValidationLogger("user")
+        
+        # Одна запись для всех полей
+        logger.log_fields([
+            ("username", invalid_user_data["username"], False, "Too short"),
+            ("age", 25, True, None)
+        ])
+        
+        # Проверяем содержимое лог-файла
+        with open(temp_log_file, "r") as f:
+            lines = [line for line in f.read().splitlines() if line]
+        
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["message"] == "Fields validation failed"
+        assert record["validation_path"] == "user"
+        assert [entry["field"] for entry in record["validation_data"]["fields"]] == ["username", "age"]
+        assert record["validation_data"]["fields"][0]["error"] == "Too short"
+    
     def test_log_validation_with_context(self, temp_log_file, user_schema, valid_user_data):
         """Тест логирования валидации в контексте."""
         # Настройка логирования
@@ -360,11 +503,12 @@ class TestLoggingIntegration:
         # Проверяем содержимое лог-файла
         with open(temp_log_file, "r") as f:
             log_content = f.read()
+            log_content_lower = log_content.lower()
             
             assert "Starting validation" in log_content
             assert "Validation completed" in log_content
-            assert "metrics" in log_content.lower()
-            assert "validation_time" in log_content.lower()
+            assert "metrics" in log_content_lower
+            assert "validation_time" in log_content_lower
     
     def test_logging_with_caching(self, temp_log_file, user_schema, valid_user_data):
         """Тест логирования с кэшированием."""
@@ -402,7 +546,7 @@ class TestLoggingIntegration:
             assert "Validation completed" in log_content
             assert "cache" in log_content.lower()
     
-    def test_logging_with_async_validation(self, temp_log_file, user_schema, valid_user_data):
+    def test_logging_with_async_validation(self, event_loop, temp_log_file, user_schema, valid_user_data):
         """Тест логирования с асинхронной валидацией."""
         import asyncio
         from pyvalid.async_validators import async_validator
@@ -428,7 +572,7 @@ class TestLoggingIntegration:
             logger.log_validation_end(is_valid, None)
         
         # Запускаем асинхронную валидацию
-        asyncio.run(validate_with_logging())
+        event_loop.run_until_complete(validate_with_logging())
         
         # Проверяем содержимое лог-файла
         with open(temp_log_file, "r") as f:
@@ -35,6 +35,9 @@ setup_logging(
 
 logger = ValidationLogger()
 
+# Временная метка вычисляется один раз при импорте модуля
+_NOW_ISO = datetime.now().isoformat()
+
 # Фикстуры
 @pytest.fixture
 def user_schema():
@@ -55,7 +58,7 @@ def valid_user_data():
         "email": "john@example.com",
         "age": 25,
         "is_active": True,
-        "created_at": datetime.now().isoformat()
+        "created_at": _NOW_ISO
     }
 
 @pytest.fixture
@@ -305,7 +308,7 @@ class TestMetricsIntegration:
                 "email": f"user_{i}@example.com",
                 "age": 20 + i,
                 "is_active": True,
-                "created_at": datetime.now().isoformat()
+                "created_at": _NOW_ISO
             }
             for i in range(5)
         ]
@@ -5,6 +5,7 @@
 import pytest
 from datetime import datetime, timedelta
 import asyncio
+import logging
 from typing import Dict, Any, Optional
 
 from pyvalid import (
@@ -136,6 +137,17 @@ class TestNumberValidator:
         is_valid, error = validator.validate("50")
         assert not is_valid
         assert "type" in error.lower()
+    
+    def test_allowed_values(self):
+        """Тест разрешенных значений, включая нехешируемые."""
+        validator = NumberValidator(allowed_values=[1, 2.5])
+        assert validator.validate(2.5) == (True, None)
+        assert not validator.validate(3)[0]
+        
+        # Нехешируемые значения не ломают создание валидатора
+        validator = NumberValidator(allowed_values=[[1], 2])
+        assert validator.validate(2) == (True, None)
+        assert not validator.validate(3)[0]
 
 class TestBooleanValidator:
     """Тесты для валидатора булевых значений."""
@@ -240,6 +252,51 @@ class TestObjectValidator:
             is_valid, errors = user_schema.validate(data)
             assert not is_valid
             assert "extra_field" in errors
+    
+    def test_validate_many(self, user_schema, valid_user_data, invalid_user_data):
+        """Тест пакетной валидации списка объектов."""
+        results = user_schema.validate_many([valid_user_data, invalid_user_data, valid_user_data])
+        
+        assert len(results) == 3
+        assert results[0] == user_schema.validate(valid_user_data)
+        assert results[1] == user_schema.validate(invalid_user_data)
+        assert results[2] == results[0]
+    
+    def test_validate_many_runs_custom_validator_per_record(self):
+        """Тест вызова пользовательского валидатора для каждой записи, даже с одинаковыми значениями."""
+        calls = []
+        
+        def allow_first_only(value):
+            calls.append(value)
+            return len(calls) == 1
+        
+        schema = Schema({"code": NumberValidator(custom_validator=allow_first_only)})
+        results = schema.validate_many([{"code": 1}, {"code": 1}])
+        
+        assert calls == [1, 1]
+        assert results[0] == (True, None)
+        assert not results[1][0]
+    
+    def test_validate_bytes(self):
+        """Тест валидации JSON-документа."""
+        schema = Schema({
+            "username": StringValidator(min_length=3),
+            "age": NumberValidator(min_value=18)
+        })
+        
+        is_valid, errors, data = schema.validate_bytes(b'{"username": "john_doe", "age": 25}')
+        assert is_valid
+        assert errors is None
+        assert data == {"username": "john_doe", "age": 25}
+        
+        is_valid, errors, _ = schema.validate_bytes('{"username": "jo", "age": 25}')
+        assert not is_valid
+        assert "username" in errors
+        
+        is_valid, errors, data = schema.validate_bytes(b'{"username": ')
+        assert not is_valid
+        assert "__root__" in errors
+        assert data is None
 
 class TestArrayValidator:
     """Тесты для валидатора массивов."""
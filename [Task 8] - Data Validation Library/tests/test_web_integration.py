@@ -39,6 +39,9 @@ setup_logging(
 
 logger = ValidationLogger()
 
+# Временная метка вычисляется один раз при импорте модуля
+_NOW_ISO = datetime.now().isoformat()
+
 # Фикстуры
 @pytest.fixture
 def user_schema():
@@ -59,7 +62,7 @@ def valid_user_data():
         "email": "john@example.com",
         "age": 25,
         "is_active": True,
-        "created_at": datetime.now().isoformat()
+        "created_at": _NOW_ISO
     }
 
 @pytest.fixture
@@ -127,7 +130,7 @@ class TestFastAPI:
             "email": "john@example.com",
             "age": 25,
             "is_active": True,
-            "created_at": datetime.now().isoformat()
+            "created_at": _NOW_ISO
         }
         
         response = test_client.post("/test/", json=valid_data)
@@ -205,7 +208,7 @@ class TestDjango:
             "email": "john@example.com",
             "age": 25,
             "is_active": True,
-            "created_at": datetime.now().isoformat()
+            "created_at": _NOW_ISO
         }
         
         request = factory.post(
@@ -1,20 +1,219 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union, TypedDict, NotRequired
-from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple, Set, Callable, Union, TypedDict, NotRequired, AsyncIterator
+from dataclasses import dataclass, field, asdict
 from enum import Enum
-import openai
+from functools import lru_cache
+from contextlib import asynccontextmanager
 import os
 import json
+import hashlib
+import html as html_lib
+import copy
+from pathlib import Path
 import aiohttp
 import asyncio
-from openai import AsyncOpenAI
 from dotenv import load_dotenv
 from datetime import datetime
 from bs4 import BeautifulSoup
 import re
 import logging
 import time
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import weakref
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
+
+if TYPE_CHECKING:
+    # The SDK is heavy to import, it is loaded when the first client is created
+    from openai import AsyncOpenAI
+
+try:
+    # Optional fast JSON parser
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional C-based HTML parser, much faster than BeautifulSoup
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    # Optional Aho-Corasick automaton for multi-pattern search
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # C-backed parser for BeautifulSoup, several times faster than html.parser
+    import lxml  # noqa: F401
+    BS4_PARSER = "lxml"
+except ImportError:
+    BS4_PARSER = "html.parser"
+
+# Technology detection rules: (marker, technology name)
+_FRONTEND_ATTR_RULES = (
+    ("data-reactroot", "React"),
+    ("ng-version", "Angular"),
+    ("data-vue-app", "Vue.js")
+)
+_SERVER_RULES = (
+    ("nginx", "Nginx"),
+    ("apache", "Apache"),
+    ("node", "Node.js")
+)
+_SCRIPT_LIBRARY_RULES = (
+    ("jquery", "jQuery"),
+    ("bootstrap", "Bootstrap"),
+    ("font-awesome", "Font Awesome")
+)
+_HTML_TOOL_RULES = (
+    ("google-analytics", "Google Analytics"),
+    ("gtm", "Google Tag Manager"),
+    ("hotjar", "Hotjar")
+)
+
+# Single selector matching any frontend framework marker
+_FRONTEND_SELECTOR = ",".join(f"[{attr}]" for attr, _ in _FRONTEND_ATTR_RULES)
+
+# Meta description tag and its content attribute, found without parsing the page
+_META_DESCRIPTION_RE = re.compile(r"<meta\s[^>]*\bname\s*=\s*[\"']?description\b[^>]*>", re.IGNORECASE)
+_CONTENT_ATTR_RE = re.compile(r"\bcontent\s*=\s*(?:\"([^\"]*)\"|'([^']*)')", re.IGNORECASE)
+
+# Security-related response headers: by name prefix and well-known names (lowercase)
+_SECURITY_HEADER_PREFIXES = ("x-", "strict-", "content-")
+_SECURITY_HEADER_NAMES = frozenset({
+    "referrer-policy",
+    "permissions-policy",
+    "cross-origin-opener-policy",
+    "cross-origin-embedder-policy",
+    "cross-origin-resource-policy"
+})
+
+@lru_cache(maxsize=512)
+def _is_security_header(name: str) -> bool:
+    """Check whether a response header is security-related (memoized per header name)."""
+    name = name.lower()
+    return name.startswith(_SECURITY_HEADER_PREFIXES) or name in _SECURITY_HEADER_NAMES
+
+@lru_cache(maxsize=64)
+def format_service_description(title: str, name: str, url: Optional[str], description: Optional[str]) -> str:
+    """
+    Formulate service description for an analysis (memoized).
+    
+    Args:
+        title: Analysis title, e.g. "Technical analysis"
+        name: Service name
+        url: Service URL
+        description: Known service description
+        
+    Returns:
+        Description passed to the AI analysis
+    """
+    result = f"{title} of service {name}"
+    
+    if url:
+        result += f" (URL: {url})"
+    
+    if description:
+        result += f"\n\nService description: {description}"
+    
+    return result
+
+def _build_marker_scanner(rules: Tuple[Tuple[str, str], ...]) -> Callable[[str], Set[str]]:
+    """
+    Build a function finding all rule markers in a text in a single pass.
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed,
+    otherwise a case-insensitive regex alternation.
+    
+    Args:
+        rules: Detection rules (marker, technology name) with lowercase markers
+        
+    Returns:
+        Function returning the set of markers found in the text
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for marker, _ in rules:
+            automaton.add_word(marker, marker)
+        automaton.make_automaton()
+        return lambda text: {marker for _, marker in automaton.iter(text.lower())}
+    
+    pattern = re.compile("|".join(re.escape(marker) for marker, _ in rules), re.IGNORECASE)
+    return lambda text: {match.lower() for match in pattern.findall(text)}
+
+# Single scan for all tool markers in the page and library markers in script sources
+_scan_tool_markers = _build_marker_scanner(_HTML_TOOL_RULES)
+_scan_library_markers = _build_marker_scanner(_SCRIPT_LIBRARY_RULES)
+# Raw-text pre-scan for frontend attributes; the page is parsed only if some marker occurs
+_scan_frontend_markers = _build_marker_scanner(_FRONTEND_ATTR_RULES)
+
+def dumps_prompt_json(data: Any) -> str:
+    """
+    Serialize data for inclusion into an AI prompt.
+    
+    The output is compact: indentation only adds tokens to the request.
+    Uses orjson when available, falling back to json for data orjson rejects.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        Compact JSON string with non-ASCII characters kept as is
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+def _parse_html(html: str, page: Optional["FetchedPage"] = None) -> Any:
+    """
+    Parse HTML page with the fastest available parser.
+    
+    The description and technology detection read the same page, so when the
+    fetched page is given the parsed document is kept on it and each page is
+    parsed only once. It is released together with the page.
+    
+    Args:
+        html: HTML content of the page
+        page: Fetched page the HTML belongs to
+        
+    Returns:
+        selectolax tree if selectolax is installed, otherwise BeautifulSoup document
+    """
+    if page is not None and page.parsed is not None:
+        return page.parsed
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+    else:
+        tree = BeautifulSoup(html, BS4_PARSER)
+    if page is not None:
+        page.parsed = tree
+    return tree
+
+# Пользовательский промпт; подстановки заполняются в _get_user_prompt
+_USER_PROMPT_TEMPLATE = """Проанализируй следующий сервис:
+
+Название: {name}
+Описание: {description}
+URL: {url}
+
+Дополнительный контекст:
+- Тип анализа: {analysis_type}
+- Цель: Получить структурированный анализ для принятия решений
+- Формат: JSON с ключами, соответствующими аспектам анализа
+
+Проведи глубокий анализ, учитывая:
+1. Явно указанную информацию
+2. Неявные детали из контекста
+3. Отраслевые тренды и лучшие практики
+4. Потенциальные риски и возможности
+
+ВАЖНО: Все результаты анализа должны быть на русском языке!
+
+Верни структурированный ответ в формате JSON на русском языке."""
 
 # Load environment variables
 load_dotenv()
@@ -45,7 +244,7 @@ class APIRateLimitError(APIError):
     """Raised when API rate limit is exceeded."""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ServiceMetadata:
     """Metadata about the service being analyzed."""
     name: str
@@ -54,7 +253,7 @@ class ServiceMetadata:
     created_at: datetime = field(default_factory=datetime.now)
     last_updated: datetime = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(slots=True)
 class WebMetadata:
     """Web-specific metadata about the service."""
     status_code: int
@@ -63,7 +262,25 @@ class WebMetadata:
     technologies: Dict[str, List[str]] = field(default_factory=dict)
     response_time: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
+class FetchedPage:
+    """Service page fetched once and shared by description and metadata extraction."""
+    status: int
+    headers: Any
+    html: str = ""
+    fetched_at: float = 0.0
+    # Description, web metadata and parsed document of the page, filled on first use
+    description: Optional[str] = None
+    web_metadata: Optional[Dict[str, Any]] = None
+    parsed: Any = None
+
+@dataclass(slots=True)
+class _PageLock:
+    """Lock serializing work on one page, with the number of tasks holding or awaiting it."""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+@dataclass(slots=True)
 class AnalysisResult:
     """Base class for analysis results."""
     service_info: ServiceMetadata
@@ -72,6 +289,7 @@ class AnalysisResult:
     error: Optional[str] = None
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
+@dataclass(slots=True)
 class TechnicalAnalysisResult(AnalysisResult):
     """Technical analysis specific results."""
     architecture: Optional[str] = None
@@ -81,6 +299,7 @@ class TechnicalAnalysisResult(AnalysisResult):
     scalability: Dict[str, Any] = field(default_factory=dict)
     availability: Optional[Dict[str, Any]] = None
 
+@dataclass(slots=True)
 class UserAnalysisResult(AnalysisResult):
     """User experience analysis specific results."""
     user_scenarios: List[str] = field(default_factory=list)
@@ -89,6 +308,7 @@ class UserAnalysisResult(AnalysisResult):
     success_metrics: List[str] = field(default_factory=list)
     improvement_recommendations: List[str] = field(default_factory=list)
 
+@dataclass(slots=True)
 class BusinessAnalysisResult(AnalysisResult):
     """Business analysis specific results."""
     business_model: Dict[str, Any] = field(default_factory=dict)
@@ -98,6 +318,141 @@ class BusinessAnalysisResult(AnalysisResult):
     monetization_strategies: List[str] = field(default_factory=list)
     growth_potential: Dict[str, Any] = field(default_factory=dict)
 
+# Connection pool settings of the shared HTTP session
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 20
+HTTP_KEEPALIVE_TIMEOUT = 60
+HTTP_DNS_CACHE_TTL = 300
+HTTP_TOTAL_TIMEOUT = 30
+
+# Shared HTTP session per event loop, reused by all analyzers
+_shared_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Get or create the HTTP session shared by analyzers on the running event loop.
+    
+    Reusing one session keeps a single connection pool, so analyzers hitting
+    the same host reuse TCP/TLS connections.
+    
+    Returns:
+        Shared aiohttp session
+    """
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=HTTP_TOTAL_TIMEOUT)
+        )
+        _shared_sessions[loop] = session
+    return session
+
+async def close_shared_session() -> None:
+    """Close the shared HTTP session of the running event loop, if any."""
+    session = _shared_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+# Timeout of service page requests
+PAGE_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Service pages are read in chunks and truncated after this many bytes
+PAGE_READ_CHUNK_SIZE = 8192
+PAGE_MAX_BYTES = 2 * 1024 * 1024
+
+# Maximum number of fetched pages kept per event loop (oldest are evicted first)
+PAGE_CACHE_MAX_ENTRIES = 256
+
+# Time after which a cached page is fetched again, seconds
+PAGE_CACHE_TTL = 600
+
+# Fetched service pages per event loop, shared by analyzers of the same URL
+_page_caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, FetchedPage]]" = (
+    weakref.WeakKeyDictionary()
+)
+_page_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _PageLock]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Maximum number of description analyses kept per event loop (oldest are evicted first)
+ANALYSIS_CACHE_MAX_ENTRIES = 128
+
+# Successful description analyses per event loop, keyed by analyzer, service and description hash
+_analysis_caches: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, ...], Dict[str, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+@asynccontextmanager
+async def _page_lock(url: str) -> AsyncIterator[None]:
+    """
+    Hold the lock serializing fetching and processing of a page on the running event loop.
+    
+    The lock is dropped as soon as no task holds or awaits it, so failed and
+    non-200 URLs, which never enter the page cache, do not leave locks behind.
+    """
+    locks = _page_locks.setdefault(asyncio.get_running_loop(), {})
+    entry = locks.get(url)
+    if entry is None:
+        entry = locks[url] = _PageLock()
+    entry.users += 1
+    try:
+        async with entry.lock:
+            yield
+    finally:
+        entry.users -= 1
+        if entry.users == 0 and locks.get(url) is entry:
+            del locks[url]
+
+def _get_cached_page(url: str) -> Optional[FetchedPage]:
+    """Get a cached page of the running event loop unless it has expired."""
+    page = _page_caches.get(asyncio.get_running_loop(), {}).get(url)
+    if page is not None and time.monotonic() - page.fetched_at < PAGE_CACHE_TTL:
+        return page
+    return None
+
+# OpenAI clients shared by all analyzers, one per API key
+_ai_clients: Dict[str, "AsyncOpenAI"] = {}
+
+# Timeout of OpenAI API requests, seconds
+AI_REQUEST_TIMEOUT = 30.0
+
+def get_ai_client(api_key: str) -> "AsyncOpenAI":
+    """
+    Get or create the OpenAI client shared by analyzers using the same API key.
+    
+    The client keeps its HTTP connection pool between calls, so consecutive
+    analyses reuse TLS connections to the API instead of opening new ones.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        Shared OpenAI client
+    """
+    client = _ai_clients.get(api_key)
+    if client is None:
+        from openai import AsyncOpenAI
+        
+        # Retries are handled by tenacity in _call_ai_api, built-in ones would multiply them
+        client = AsyncOpenAI(api_key=api_key, timeout=AI_REQUEST_TIMEOUT, max_retries=0)
+        _ai_clients[api_key] = client
+    return client
+
+async def close_ai_clients() -> None:
+    """Close all shared OpenAI clients."""
+    while _ai_clients:
+        _, client = _ai_clients.popitem()
+        await client.close()
+
 class AnalysisResponse(TypedDict):
     """Type definition for AI analysis response."""
     service_info: Dict[str, Any]
@@ -117,6 +472,12 @@ class BaseAnalyzer(ABC):
     # API model to use
     API_MODEL = "gpt-4-turbo-preview"
     
+    # On-disk cache of AI responses (disabled unless AI_CACHE_DIR is set)
+    AI_CACHE_DIR = os.getenv("AI_CACHE_DIR")
+    
+    # Maximum number of cached AI responses (least recently used are evicted)
+    AI_CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "256"))
+    
     # Примеры анализа для few-shot обучения
     EXAMPLES = {
         AnalysisType.BUSINESS: [
@@ -238,6 +599,9 @@ class BaseAnalyzer(ABC):
         ]
     }
 
+    # Готовые системные промпты по типам анализа (заполняются при первом обращении)
+    _system_prompts: Dict[AnalysisType, str] = {}
+
     def __init__(
         self,
         service_name: str,
@@ -261,36 +625,54 @@ class BaseAnalyzer(ABC):
         )
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._client: Optional[AsyncOpenAI] = None
         self._session: Optional[aiohttp.ClientSession] = None
         
         if not self.api_key:
             raise APIKeyError("OpenAI API key not provided")
+
+    @property
+    def _client(self) -> "AsyncOpenAI":
+        """
+        OpenAI client shared by analyzers with the same API key.
         
+        Created on first use, so analyses served from caches never load the SDK.
+        
+        Raises:
+            APIKeyError: If the client cannot be initialized
+        """
         try:
-            self._client = AsyncOpenAI(api_key=self.api_key)
+            return get_ai_client(self.api_key)
         except Exception as e:
             raise APIKeyError(f"Failed to initialize OpenAI client: {str(e)}")
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._session = aiohttp.ClientSession()
+        self._session = await get_shared_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        # The shared session stays open for other analyzers (see close_shared_session)
+        self._session = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
+        """Get aiohttp session (the shared one unless set explicitly)."""
         if not self._session:
-            self._session = aiohttp.ClientSession()
+            self._session = await get_shared_session()
         return self._session
 
     def _get_system_prompt(self, analysis_type: AnalysisType) -> str:
         """Возвращает системный промпт с контекстом и примерами."""
+        # Промпт зависит только от типа анализа, поэтому строится один раз
+        prompt = self._system_prompts.get(analysis_type)
+        if prompt is None:
+            prompt = self._build_system_prompt(analysis_type)
+            self._system_prompts[analysis_type] = prompt
+        return prompt
+
+    @classmethod
+    def _build_system_prompt(cls, analysis_type: AnalysisType) -> str:
+        """Строит системный промпт для указанного типа анализа."""
         base_prompt = """Ты - эксперт по анализу сервисов и продуктов. Твоя задача - проанализировать описание сервиса и предоставить структурированный анализ НА РУССКОМ ЯЗЫКЕ.
 Используй свой опыт и знания для:
 1. Выявления неявной информации из контекста
@@ -305,7 +687,7 @@ class BaseAnalyzer(ABC):
 Вот пример анализа:"""
 
         # Добавляем пример для конкретного типа анализа
-        example = self.EXAMPLES[analysis_type][0]
+        example = cls.EXAMPLES[analysis_type][0]
         example_str = f"""
 Входные данные: {example['input']}
 Результат анализа: {json.dumps(example['output'], ensure_ascii=False, indent=2)}
@@ -352,28 +734,12 @@ class BaseAnalyzer(ABC):
 
     def _get_user_prompt(self, description: str, analysis_type: AnalysisType) -> str:
         """Формирует пользовательский промпт с контекстом."""
-        context = f"""Проанализируй следующий сервис:
-
-Название: {self.service_metadata.name}
-Описание: {description}
-URL: {self.service_metadata.url or 'Не указан'}
-
-Дополнительный контекст:
-- Тип анализа: {analysis_type.value}
-- Цель: Получить структурированный анализ для принятия решений
-- Формат: JSON с ключами, соответствующими аспектам анализа
-
-Проведи глубокий анализ, учитывая:
-1. Явно указанную информацию
-2. Неявные детали из контекста
-3. Отраслевые тренды и лучшие практики
-4. Потенциальные риски и возможности
-
-ВАЖНО: Все результаты анализа должны быть на русском языке!
-
-Верни структурированный ответ в формате JSON на русском языке."""
-
-        return context
+        return _USER_PROMPT_TEMPLATE.format(
+            name=self.service_metadata.name,
+            description=description,
+            url=self.service_metadata.url or 'Не указан',
+            analysis_type=analysis_type.value
+        )
 
     def _validate_analysis_result(self, result: Dict[str, Any]) -> bool:
         """Validate analysis result structure."""
@@ -398,9 +764,15 @@ URL: {self.service_metadata.url or 'Не указан'}
         try:
             async with self:
                 if not self.service_metadata.description and self.service_metadata.url:
-                    self.service_metadata.description = await self._get_service_description()
-                
-                service_info = await self._enrich_service_info()
+                    # Description lookup and enrichment read the same page, run them together
+                    description, service_info = await asyncio.gather(
+                        self._get_service_description(),
+                        self._enrich_service_info()
+                    )
+                    self.service_metadata.description = description
+                    service_info["description"] = description
+                else:
+                    service_info = await self._enrich_service_info()
                 analysis_results = await self._perform_specific_analysis(service_info)
                 
                 if not self._validate_analysis_result(analysis_results):
@@ -416,6 +788,73 @@ URL: {self.service_metadata.url or 'Не указан'}
             self.logger.error(error_msg)
             return self._create_error_result(error_msg)
 
+    async def _fetch_page(self) -> FetchedPage:
+        """
+        Fetch the service page, reusing the result of a previous fetch.
+        
+        Pages are cached by URL on the running event loop for PAGE_CACHE_TTL seconds,
+        so the description lookup, metadata enrichment and all analyzers of the same
+        service share one request. Only successful (200) pages are cached: failed
+        requests and error statuses such as 429 or 503 are fetched again next time.
+        
+        Returns:
+            Fetched page (HTML is read only for successful responses)
+        """
+        url = self.service_metadata.url
+        page = _get_cached_page(url)
+        if page is not None:
+            return page
+        
+        # Concurrent callers wait for the same request instead of issuing their own
+        async with _page_lock(url):
+            page = _get_cached_page(url)
+            if page is None:
+                session = await self._get_session()
+                async with session.get(url, timeout=PAGE_FETCH_TIMEOUT) as response:
+                    html = await self._read_page(response) if response.status == 200 else ""
+                    page = FetchedPage(
+                        status=response.status,
+                        headers=response.headers,
+                        html=html,
+                        fetched_at=time.monotonic()
+                    )
+                
+                if page.status == 200:
+                    cache = _page_caches.setdefault(asyncio.get_running_loop(), {})
+                    cache.pop(url, None)
+                    if len(cache) >= PAGE_CACHE_MAX_ENTRIES:
+                        del cache[next(iter(cache))]
+                    cache[url] = page
+        return page
+
+    @staticmethod
+    async def _read_page(response: aiohttp.ClientResponse) -> str:
+        """
+        Read page HTML in chunks, stopping after PAGE_MAX_BYTES.
+        
+        Everything used for analysis is near the top of the page, so huge pages
+        are truncated instead of being read into memory in full.
+        
+        Args:
+            response: HTTP response of the service page
+            
+        Returns:
+            Decoded (possibly truncated) HTML
+        """
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(PAGE_READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= PAGE_MAX_BYTES:
+                break
+        
+        raw = b"".join(chunks)[:PAGE_MAX_BYTES]
+        try:
+            return raw.decode(response.charset or "utf-8", errors="replace")
+        except LookupError:
+            return raw.decode("utf-8", errors="replace")
+
     async def _get_service_description(self) -> str:
         """
         Get service description from URL.
@@ -427,26 +866,15 @@ URL: {self.service_metadata.url or 'Не указан'}
             return f"Service {self.service_metadata.name}"
         
         try:
-            session = await self._get_session()
-            async with session.get(self.service_metadata.url, timeout=30) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    # Try to get meta description
-                    meta_desc = soup.find('meta', attrs={'name': 'description'})
-                    if meta_desc and meta_desc.get('content'):
-                        return meta_desc['content']
-                    
-                    # Try to get first paragraph
-                    first_p = soup.find('p')
-                    if first_p and first_p.text.strip():
-                        return first_p.text.strip()
-                    
-                    # Fallback to title
-                    title = soup.find('title')
-                    if title and title.text.strip():
-                        return title.text.strip()
+            page = await self._fetch_page()
+            if page.status == 200:
+                # Description is extracted once per cached page and shared by all analyzers
+                async with _page_lock(self.service_metadata.url):
+                    if page.description is None:
+                        # Parse off the event loop thread
+                        page.description = await asyncio.to_thread(self._extract_description, page.html, page) or ""
+                if page.description:
+                    return page.description
             
             return f"Service {self.service_metadata.name} at {self.service_metadata.url}"
             
@@ -457,6 +885,56 @@ URL: {self.service_metadata.url or 'Не указан'}
             self.logger.warning(f"Error getting service description: {str(e)}")
             return f"Service {self.service_metadata.name} at {self.service_metadata.url}"
 
+    @staticmethod
+    def _extract_description(html: str, page: Optional[FetchedPage] = None) -> Optional[str]:
+        """
+        Extract service description from HTML page.
+        
+        Uses meta description, then the first paragraph, then the page title.
+        
+        Args:
+            html: HTML content of the page
+            page: Fetched page keeping the parsed document, if any
+            
+        Returns:
+            Description or None if nothing suitable was found
+        """
+        # Common case: the meta description is found by a regex scan, without parsing the page
+        meta = _META_DESCRIPTION_RE.search(html)
+        if meta is not None:
+            content = _CONTENT_ATTR_RE.search(meta.group(0))
+            if content is not None and (content.group(1) or content.group(2)):
+                return html_lib.unescape(content.group(1) or content.group(2))
+        
+        # Collect all candidates in a single pass over the document
+        first_p = title = None
+        if HTMLParser is not None:
+            for node in _parse_html(html, page).css('meta[name="description"], p, title'):
+                if node.tag == 'meta':
+                    if node.attributes.get('content'):
+                        return node.attributes['content']
+                elif node.tag == 'p':
+                    if first_p is None:
+                        first_p = node.text()
+                elif title is None:
+                    title = node.text()
+        else:
+            for node in _parse_html(html, page).find_all(['meta', 'p', 'title']):
+                if node.name == 'meta':
+                    if node.get('name') == 'description' and node.get('content'):
+                        return node['content']
+                elif node.name == 'p':
+                    if first_p is None:
+                        first_p = node.text
+                elif title is None:
+                    title = node.text
+        
+        # Fallback to first paragraph, then to title
+        for text in (first_p, title):
+            if text and text.strip():
+                return text.strip()
+        return None
+
     async def _enrich_service_info(self) -> Dict[str, Any]:
         """Enrich service information with metadata."""
         service_info = {
@@ -468,22 +946,23 @@ URL: {self.service_metadata.url or 'Не указан'}
         
         if self.service_metadata.url:
             try:
-                session = await self._get_session()
-                async with session.get(self.service_metadata.url, timeout=30) as response:
-                    if response.status == 200:
-                        web_metadata = WebMetadata(
-                            status_code=response.status,
-                            headers=dict(response.headers),
-                            security_headers={
-                                header: value
-                                for header, value in response.headers.items()
-                                if header.lower().startswith(('x-', 'strict-', 'content-'))
-                            }
-                        )
-                        
-                        html = await response.text()
-                        web_metadata.technologies = await self._detect_technologies(html, response.headers)
-                        service_info["additional_data"]["web_metadata"] = web_metadata.__dict__
+                page = await self._fetch_page()
+                if page.status == 200:
+                    # Metadata is extracted once per cached page and shared by all analyzers
+                    async with _page_lock(self.service_metadata.url):
+                        if page.web_metadata is None:
+                            web_metadata = WebMetadata(
+                                status_code=page.status,
+                                headers=dict(page.headers),
+                                security_headers={
+                                    header: value
+                                    for header, value in page.headers.items()
+                                    if _is_security_header(header)
+                                }
+                            )
+                            web_metadata.technologies = await self._detect_technologies(page.html, page.headers, page)
+                            page.web_metadata = asdict(web_metadata)
+                    service_info["additional_data"]["web_metadata"] = page.web_metadata
             
             except asyncio.TimeoutError:
                 self.logger.warning("Timeout while enriching service info")
@@ -492,13 +971,49 @@ URL: {self.service_metadata.url or 'Не указан'}
         
         return service_info
 
-    async def _detect_technologies(self, html: str, headers: Dict[str, str]) -> Dict[str, List[str]]:
+    async def _detect_technologies(
+        self,
+        html: str,
+        headers: Dict[str, str],
+        page: Optional[FetchedPage] = None
+    ) -> Dict[str, List[str]]:
         """
         Detect technologies used by the service based on HTML content and headers.
         
         Args:
             html: HTML content of the page
             headers: HTTP response headers
+            page: Fetched page keeping the parsed document, if any
+            
+        Returns:
+            Dictionary containing detected technologies
+        """
+        try:
+            # Parsing and marker scans are CPU-bound, run them off the event loop thread
+            return await asyncio.to_thread(self._detect_technologies_sync, html, headers, page)
+        except Exception as e:
+            self.logger.warning(f"Error detecting technologies: {str(e)}")
+            return {
+                "frontend": [],
+                "backend": [],
+                "frameworks": [],
+                "libraries": [],
+                "tools": []
+            }
+
+    @staticmethod
+    def _detect_technologies_sync(
+        html: str,
+        headers: Dict[str, str],
+        page: Optional[FetchedPage] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Detect technologies synchronously, see _detect_technologies.
+        
+        Args:
+            html: HTML content of the page
+            headers: HTTP response headers
+            page: Fetched page keeping the parsed document, if any
             
         Returns:
             Dictionary containing detected technologies
@@ -511,64 +1026,81 @@ URL: {self.service_metadata.url or 'Не указан'}
             "tools": []
         }
         
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Check for common frontend frameworks
-            if soup.find(attrs={"data-reactroot": True}):
-                technologies["frontend"].append("React")
-            if soup.find(attrs={"ng-version": True}):
-                technologies["frontend"].append("Angular")
-            if soup.find(attrs={"data-vue-app": True}):
-                technologies["frontend"].append("Vue.js")
-            
-            # Check for common backend technologies
-            server = headers.get("Server", "").lower()
-            if "nginx" in server:
-                technologies["backend"].append("Nginx")
-            if "apache" in server:
-                technologies["backend"].append("Apache")
-            if "node" in server:
-                technologies["backend"].append("Node.js")
-            
-            # Check for common libraries
-            scripts = soup.find_all("script", src=True)
-            for script in scripts:
-                src = script["src"].lower()
-                if "jquery" in src:
-                    technologies["libraries"].append("jQuery")
-                if "bootstrap" in src:
-                    technologies["libraries"].append("Bootstrap")
-                if "font-awesome" in src:
-                    technologies["libraries"].append("Font Awesome")
-            
-            # Check for common tools
-            if "google-analytics" in html.lower():
-                technologies["tools"].append("Google Analytics")
-            if "gtm" in html.lower():
-                technologies["tools"].append("Google Tag Manager")
-            if "hotjar" in html.lower():
-                technologies["tools"].append("Hotjar")
+        # Attribute and script markers need the parsed page, but a page whose raw
+        # text contains none of them cannot match, so parsing is skipped
+        if _scan_frontend_markers(html) or _scan_library_markers(html):
+            frontend, script_sources = BaseAnalyzer._extract_html_markers(html, page)
+        else:
+            frontend, script_sources = [], []
+        technologies["frontend"].extend(frontend)
+            
+        # Check for common backend technologies
+        server = headers.get("Server", "").lower()
+        technologies["backend"].extend(
+            name for marker, name in _SERVER_RULES if marker in server
+        )
         
-        except Exception as e:
-            self.logger.warning(f"Error detecting technologies: {str(e)}")
+        # Check for common libraries
+        found_markers = _scan_library_markers("\n".join(script_sources))
+        technologies["libraries"].extend(
+            name for marker, name in _SCRIPT_LIBRARY_RULES if marker in found_markers
+        )
+        
+        # Check for common tools
+        found_markers = _scan_tool_markers(html)
+        technologies["tools"].extend(
+            name for marker, name in _HTML_TOOL_RULES if marker in found_markers
+        )
         
         return technologies
 
+    @staticmethod
+    def _extract_html_markers(html: str, page: Optional[FetchedPage] = None) -> Tuple[List[str], List[str]]:
+        """
+        Extract technology markers from HTML page.
+        
+        Args:
+            html: HTML content of the page
+            page: Fetched page keeping the parsed document, if any
+            
+        Returns:
+            Detected frontend frameworks and script sources
+        """
+        found_attrs = set()
+        if HTMLParser is not None:
+            tree = _parse_html(html, page)
+            for node in tree.css(_FRONTEND_SELECTOR):
+                found_attrs.update(node.attributes)
+            script_sources = [node.attributes.get("src") or "" for node in tree.css("script[src]")]
+        else:
+            soup = _parse_html(html, page)
+            for node in soup.select(_FRONTEND_SELECTOR):
+                found_attrs.update(node.attrs)
+            script_sources = [script["src"] for script in soup.find_all("script", src=True)]
+        
+        frontend = [name for attr, name in _FRONTEND_ATTR_RULES if attr in found_attrs]
+        return frontend, script_sources
+
     @retry(
         stop=stop_after_attempt(MAX_RETRIES),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((APIRateLimitError, APIRequestError))
+        # Short jittered backoff; jitter keeps concurrent analyzers from retrying in lockstep
+        wait=wait_exponential_jitter(multiplier=0.5, max=8, jitter=0.5),
+        retry=retry_if_exception_type((APIRateLimitError, APIRequestError)),
+        reraise=True
     )
-    async def _call_ai_api(self, prompt: str) -> Dict[str, Any]:
+    async def _call_ai_api(self, prompt: str, no_cache: bool = False) -> Dict[str, Any]:
         """
         Call OpenAI API with retry logic and proper error handling.
         
+        The model is asked for a JSON object and the response is parsed here once.
+        Responses are served from the on-disk cache when AI_CACHE_DIR is set.
+        
         Args:
             prompt: Analysis prompt
+            no_cache: Always make a live API call, bypassing the cache
             
         Returns:
-            API response as dictionary
+            Parsed API response as dictionary
             
         Raises:
             APIKeyError: If API key is invalid
@@ -578,24 +1110,43 @@ URL: {self.service_metadata.url or 'Не указан'}
         if not self.api_key:
             raise APIKeyError("OpenAI API key not provided")
         
+        cache_key = None
+        if self.AI_CACHE_DIR and not no_cache:
+            cache_key = self._get_cache_key(prompt)
+            cached = self._read_cached_response(cache_key)
+            if cached is not None:
+                self.logger.debug("Using cached AI response")
+                return self._parse_ai_response(cached)
+        
+        client = self._client
+        import openai
+        
         try:
             # Prepare request
             messages = [
-                {"role": "system", "content": "You are a professional service analyzer. Provide detailed analysis in English."},
+                {"role": "system", "content": "You are a professional service analyzer. Provide detailed analysis in English as a JSON object."},
                 {"role": "user", "content": prompt}
             ]
             
             # Make API call
-            response = await self._client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=self.API_MODEL,
                 messages=messages,
                 temperature=0.7,
                 max_tokens=self.MAX_TOKENS,
+                # JSON mode: the content is a JSON object that is parsed right away
+                response_format={"type": "json_object"},
                 timeout=30  # 30 seconds timeout
             )
             
-            # Extract and return content
-            return response.choices[0].message.content
+            # Extract content; the raw text is cached, the parsed dict is returned.
+            # Replies that fail to parse (e.g. truncated at MAX_TOKENS) are not
+            # cached, so the next run calls the API again
+            content = response.choices[0].message.content
+            parsed = self._parse_ai_response(content)
+            if cache_key is not None and not (isinstance(parsed, dict) and "error" in parsed):
+                self._write_cached_response(cache_key, content)
+            return parsed
             
         except openai.RateLimitError as e:
             self.logger.warning(f"Rate limit exceeded: {str(e)}")
@@ -613,6 +1164,37 @@ URL: {self.service_metadata.url or 'Не указан'}
             self.logger.error(f"Unexpected error during API call: {str(e)}")
             raise APIRequestError(f"Unexpected error during API call: {str(e)}")
 
+    def _get_cache_key(self, prompt: str) -> str:
+        """Build the AI response cache key from the model and prompt."""
+        return hashlib.blake2b(f"{self.API_MODEL}\0{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def _read_cached_response(self, cache_key: str) -> Optional[str]:
+        """Read a cached AI response, marking it as recently used."""
+        path = Path(self.AI_CACHE_DIR).expanduser() / f"{cache_key}.json"
+        try:
+            raw = path.read_bytes()
+            content = (orjson.loads(raw) if orjson is not None else json.loads(raw))["content"]
+            path.touch()
+            return content
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_cached_response(self, cache_key: str, content: str) -> None:
+        """Store an AI response in the cache, evicting the least recently used entries."""
+        cache_dir = Path(self.AI_CACHE_DIR).expanduser()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            entry = {"model": self.API_MODEL, "content": content}
+            (cache_dir / f"{cache_key}.json").write_bytes(
+                orjson.dumps(entry) if orjson is not None
+                else json.dumps(entry, ensure_ascii=False).encode("utf-8")
+            )
+            entries = sorted(cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+            for stale in entries[:max(len(entries) - self.AI_CACHE_MAX_ENTRIES, 0)]:
+                stale.unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Failed to write AI response cache: {str(e)}")
+
     async def _analyze_with_ai(self, service_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze service using AI with improved error handling.
@@ -630,14 +1212,8 @@ URL: {self.service_metadata.url or 'Не указан'}
             # Prepare prompt
             prompt = self._prepare_analysis_prompt(service_info)
             
-            # Call OpenAI API with retry logic
-            response = await self._call_ai_api(prompt)
-            
-            # Parse response
-            if isinstance(response, dict) and "error" in response:
-                return response
-            
-            return self._parse_ai_response(response)
+            # Call OpenAI API with retry logic, the response is already parsed
+            return await self._call_ai_api(prompt)
             
         except APIKeyError as e:
             self.logger.error(f"API key error: {str(e)}")
@@ -660,6 +1236,9 @@ URL: {self.service_metadata.url or 'Не указан'}
         """
         Analyze service description using AI.
         
+        Successful results are memoized on the running event loop, so repeated
+        analyses of the same description do not call the API again.
+        
         Args:
             description: Service description to analyze
             analysis_type: Type of analysis to perform
@@ -667,6 +1246,19 @@ URL: {self.service_metadata.url or 'Не указан'}
         Returns:
             Dictionary containing analysis results
         """
+        cache = _analysis_caches.setdefault(asyncio.get_running_loop(), {})
+        # The prompt depends on the analyzer class and service, not only on the description
+        cache_key = (
+            self.__class__.__name__,
+            self.service_metadata.name,
+            self.service_metadata.url or "",
+            hashlib.blake2b(description.encode("utf-8"), digest_size=16).hexdigest(),
+            analysis_type.value
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         service_info = {
             "service_name": self.service_metadata.name,
             "service_url": self.service_metadata.url,
@@ -674,7 +1266,12 @@ URL: {self.service_metadata.url or 'Не указан'}
             "additional_data": {}
         }
         
-        return await self._analyze_with_ai(service_info)
+        result = await self._analyze_with_ai(service_info)
+        if "error" not in result:
+            if len(cache) >= ANALYSIS_CACHE_MAX_ENTRIES:
+                del cache[next(iter(cache))]
+            cache[cache_key] = copy.deepcopy(result)
+        return result
 
     def _prepare_analysis_prompt(self, service_info: Dict[str, Any]) -> str:
         """
@@ -710,6 +1307,9 @@ URL: {self.service_metadata.url or 'Не указан'}
                         cleaned_response = cleaned_response[:-3]
                     cleaned_response = cleaned_response.strip()
                     
+                    # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+                    if orjson is not None:
+                        return orjson.loads(cleaned_response)
                     return json.loads(cleaned_response)
                 except json.JSONDecodeError:
                     self.logger.warning("Response is not valid JSON, attempting to parse as structured text")
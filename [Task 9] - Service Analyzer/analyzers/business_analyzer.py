@@ -1,8 +1,88 @@
-from .base_analyzer import BaseAnalyzer, AnalysisType, BusinessAnalysisResult, AnalysisResponse
+from .base_analyzer import BaseAnalyzer, AnalysisType, AnalysisResponse, dumps_prompt_json, format_service_description
 from typing import Dict, Any, List
-import json
 import asyncio
 
+# Placeholder for empty report fields
+_NOT_SPECIFIED = "Not specified"
+
+# Business analysis prompt; placeholders are filled in _prepare_analysis_prompt
+_PROMPT_TEMPLATE = """Проанализируй следующий веб-сервис с бизнес-точки зрения.
+        Сфокусируйся на выявлении:
+        1. Краткой истории (год основания, важные этапы развития)
+        2. Целевой аудитории (основные сегменты пользователей)
+        3. Основных функций (2-4 ключевых функционала)
+        4. Уникальных торговых преимуществ (ключевые отличия от конкурентов)
+        5. Бизнес-модели (как сервис зарабатывает деньги)
+        6. Информации о технологическом стеке (любые намеки на используемые технологии)
+        7. Восприятия сильных сторон (положительные стороны или выделяющиеся особенности)
+        8. Восприятия слабых сторон (упомянутые недостатки или ограничения)
+
+        Информация о сервисе:
+        Название: {service_name}
+        URL: {service_url}
+        Описание: {description}
+
+        Дополнительные данные:
+        {additional_data}
+
+        Верни анализ в формате JSON объекта со следующей структурой:
+        {{
+            "history": {{
+                "founded_year": "год основания",
+                "key_milestones": ["важное событие 1", "важное событие 2", ...]
+            }},
+            "target_audience": {{
+                "primary": "основная аудитория",
+                "secondary": "вторичная аудитория",
+                "demographics": "демографические характеристики"
+            }},
+            "key_features": ["функция 1", "функция 2", "функция 3", "функция 4"],
+            "unique_advantages": ["преимущество 1", "преимущество 2", ...],
+            "business_model": {{
+                "revenue_streams": ["источник дохода 1", "источник дохода 2", ...],
+                "pricing_strategy": "стратегия ценообразования"
+            }},
+            "tech_stack": {{
+                "frontend": ["технология 1", "технология 2"],
+                "backend": ["технология 1", "технология 2"],
+                "infrastructure": ["технология 1", "технология 2"]
+            }},
+            "perceived_strengths": ["сильная сторона 1", "сильная сторона 2", ...],
+            "perceived_weaknesses": ["слабая сторона 1", "слабая сторона 2", ...]{market_section}
+        }}
+
+        ВАЖНО: Все результаты должны быть на русском языке! Предоставь конкретные, практические выводы.
+        """
+
+# Market analysis part of the expected JSON structure
+_MARKET_SECTION = """,
+            "market": {
+                "market_size": {"оценка": "размер и потенциал рынка"},
+                "market_trends": ["тренд 1", "тренд 2", ...],
+                "competitive_landscape": {"конкурент": "позиция на рынке"},
+                "growth_opportunities": ["возможность 1", "возможность 2", ...],
+                "risks": ["риск 1", "риск 2", ...]
+            }"""
+
+# Report sections: (title, result key, whether the value is a dict)
+_REPORT_SECTIONS = (
+    ("Краткая история", "history", True),
+    ("Целевая аудитория", "target_audience", True),
+    ("Основные функции", "key_features", False),
+    ("Уникальные торговые преимущества", "unique_advantages", False),
+    ("Бизнес-модель", "business_model", True),
+    ("Информация о технологическом стеке", "tech_stack", True),
+    ("Восприятие сильных сторон", "perceived_strengths", False),
+    ("Восприятие слабых сторон", "perceived_weaknesses", False)
+)
+_MARKET_REPORT_SECTIONS = (
+    ("Размер рынка", "market_size", True),
+    ("Тренды рынка", "market_trends", False),
+    ("Конкурентная среда", "competitive_landscape", True),
+    ("Возможности роста", "growth_opportunities", False),
+    ("Риски", "risks", False)
+)
+
 class BusinessAnalyzer(BaseAnalyzer):
     """Analyzer for business aspects of the service."""
     
@@ -24,12 +104,12 @@ class BusinessAnalyzer(BaseAnalyzer):
         
         if "error" not in analysis_results:
             results.update({
-                "business_model": analysis_results.get("business_model", "Not specified"),
+                "business_model": analysis_results.get("business_model", _NOT_SPECIFIED),
                 "target_audience": analysis_results.get("target_audience", []),
-                "market_analysis": analysis_results.get("market_analysis", "Not specified"),
+                "market_analysis": analysis_results.get("market_analysis", _NOT_SPECIFIED),
                 "competitors": analysis_results.get("competitors", []),
                 "monetization": analysis_results.get("monetization", []),
-                "growth_potential": analysis_results.get("growth_potential", "Not specified")
+                "growth_potential": analysis_results.get("growth_potential", _NOT_SPECIFIED)
             })
         else:
             results.update({
@@ -46,110 +126,54 @@ class BusinessAnalyzer(BaseAnalyzer):
     
     def _get_service_description(self) -> str:
         """Formulates service description for business analysis."""
-        description = f"Business analysis of service {self.service_metadata.name}"
-        
-        if self.service_metadata.url:
-            description += f" (URL: {self.service_metadata.url})"
-        
-        if self.service_metadata.description:
-            description += f"\n\nService description: {self.service_metadata.description}"
-        
-        return description
+        metadata = self.service_metadata
+        return format_service_description("Business analysis", metadata.name, metadata.url, metadata.description)
     
     def generate_markdown(self, analysis_results: Dict[str, Any]) -> str:
         """Generate markdown report for business analysis."""
-        # Создаем объект BusinessAnalysisResult с правильными параметрами
-        result = BusinessAnalysisResult(
-            service_info=analysis_results.get("service_info", self.service_metadata),
-            analysis_type=analysis_results.get("analysis_type", AnalysisType.BUSINESS),
-            error=analysis_results.get("error"),
-            raw_data=analysis_results.get("raw_data", {})
-        )
-        
-        # Устанавливаем специфичные для бизнес-анализа поля
-        result.business_model = analysis_results.get("business_model", {})
-        result.target_audience = analysis_results.get("target_audience", {})
-        result.market_analysis = analysis_results.get("market_analysis", {})
-        result.competitors = analysis_results.get("competitors", [])
-        result.monetization_strategies = analysis_results.get("monetization_strategies", [])
-        result.growth_potential = analysis_results.get("growth_potential", {})
+        raw_data = analysis_results.get("raw_data") or {}
+        error = analysis_results.get("error")
         
-        report = f"""## Бизнес-анализ сервиса {self.service_metadata.name}
-
-### Краткая история
-{self._format_dict(analysis_results.get("history", {}))}
-
-### Целевая аудитория
-{self._format_dict(result.target_audience)}
-
-### Основные функции
-{self._format_list(analysis_results.get("key_features", []))}
-
-### Уникальные торговые преимущества
-{self._format_list(analysis_results.get("unique_advantages", []))}
-
-### Бизнес-модель
-{self._format_dict(result.business_model)}
-
-### Информация о технологическом стеке
-{self._format_dict(analysis_results.get("tech_stack", {}))}
-
-### Восприятие сильных сторон
-{self._format_list(analysis_results.get("perceived_strengths", []))}
-
-### Восприятие слабых сторон
-{self._format_list(analysis_results.get("perceived_weaknesses", []))}
-"""
+        parts = [f"## Бизнес-анализ сервиса {self.service_metadata.name}\n"]
+        for title, key, is_dict in _REPORT_SECTIONS:
+            formatter = self._format_dict if is_dict else self._format_list
+            parts.append(f"\n### {title}\n{formatter(analysis_results.get(key))}\n")
         
         # Add market analysis if available
-        if "market_analysis" in result.raw_data:
-            market = result.raw_data["market_analysis"]
+        if "market_analysis" in raw_data:
+            market = raw_data["market_analysis"]
             if "error" not in market:
-                report += "\n### Дополнительный анализ рынка\n"
-                
-                if "market_size" in market:
-                    report += "\n#### Размер рынка\n"
-                    report += self._format_dict(market["market_size"])
-                
-                if "market_trends" in market:
-                    report += "\n#### Тренды рынка\n"
-                    report += self._format_list(market["market_trends"])
-                
-                if "competitive_landscape" in market:
-                    report += "\n#### Конкурентная среда\n"
-                    report += self._format_dict(market["competitive_landscape"])
-                
-                if "growth_opportunities" in market:
-                    report += "\n#### Возможности роста\n"
-                    report += self._format_list(market["growth_opportunities"])
-                
-                if "risks" in market:
-                    report += "\n#### Риски\n"
-                    report += self._format_list(market["risks"])
+                parts.append("\n### Дополнительный анализ рынка\n")
+                for title, key, is_dict in _MARKET_REPORT_SECTIONS:
+                    if key in market:
+                        formatter = self._format_dict if is_dict else self._format_list
+                        parts.append(f"\n#### {title}\n{formatter(market[key])}")
             else:
-                report += f"\n> ⚠️ **Примечание**: Ошибка в анализе рынка: {market['error']}"
+                parts.append(f"\n> ⚠️ **Примечание**: Ошибка в анализе рынка: {market['error']}")
         
-        if result.error:
-            report += f"\n> ⚠️ **Примечание**: {result.error}"
+        if error:
+            parts.append(f"\n> ⚠️ **Примечание**: {error}")
         
-        return report
+        return "".join(parts)
 
     def _format_list(self, items: List[str]) -> str:
-        """Format list items for markdown."""
+        """Format list items for markdown, skipping empty items."""
         if not items:
-            return "Not specified"
-        return "\n".join(f"- {item}" for item in items)
+            return _NOT_SPECIFIED
+        lines = [f"- {item}" for item in items if item not in (None, "", [], {})]
+        return "\n".join(lines) if lines else _NOT_SPECIFIED
 
     def _format_dict(self, data: Dict[str, Any]) -> str:
-        """Format dictionary items for markdown."""
+        """Format dictionary items for markdown, skipping empty values."""
         if not data:
-            return "Not specified"
-        return "\n".join(f"- **{key}**: {value}" for key, value in data.items())
+            return _NOT_SPECIFIED
+        lines = [f"- **{key}**: {value}" for key, value in data.items() if value not in (None, "", [], {})]
+        return "\n".join(lines) if lines else _NOT_SPECIFIED
 
     def _format_list_of_dicts(self, items: List[Dict[str, Any]]) -> str:
         """Format list of dictionaries for markdown."""
         if not items:
-            return "Not specified"
+            return _NOT_SPECIFIED
         
         result = []
         for i, item in enumerate(items, 1):
@@ -168,145 +192,63 @@ class BusinessAnalyzer(BaseAnalyzer):
         Returns:
             Formatted prompt string
         """
-        prompt = f"""Проанализируй следующий веб-сервис с бизнес-точки зрения.
-        Сфокусируйся на выявлении:
-        1. Краткой истории (год основания, важные этапы развития)
-        2. Целевой аудитории (основные сегменты пользователей)
-        3. Основных функций (2-4 ключевых функционала)
-        4. Уникальных торговых преимуществ (ключевые отличия от конкурентов)
-        5. Бизнес-модели (как сервис зарабатывает деньги)
-        6. Информации о технологическом стеке (любые намеки на используемые технологии)
-        7. Восприятия сильных сторон (положительные стороны или выделяющиеся особенности)
-        8. Восприятия слабых сторон (упомянутые недостатки или ограничения)
-
-        Информация о сервисе:
-        Название: {service_info['service_name']}
-        URL: {service_info['service_url']}
-        Описание: {service_info['description']}
-
-        Дополнительные данные:
-        {json.dumps(service_info.get('additional_data', {}), indent=2, ensure_ascii=False)}
-
-        Верни анализ в формате JSON объекта со следующей структурой:
-        {{
-            "history": {{
-                "founded_year": "год основания",
-                "key_milestones": ["важное событие 1", "важное событие 2", ...]
-            }},
-            "target_audience": {{
-                "primary": "основная аудитория",
-                "secondary": "вторичная аудитория",
-                "demographics": "демографические характеристики"
-            }},
-            "key_features": ["функция 1", "функция 2", "функция 3", "функция 4"],
-            "unique_advantages": ["преимущество 1", "преимущество 2", ...],
-            "business_model": {{
-                "revenue_streams": ["источник дохода 1", "источник дохода 2", ...],
-                "pricing_strategy": "стратегия ценообразования"
-            }},
-            "tech_stack": {{
-                "frontend": ["технология 1", "технология 2"],
-                "backend": ["технология 1", "технология 2"],
-                "infrastructure": ["технология 1", "технология 2"]
-            }},
-            "perceived_strengths": ["сильная сторона 1", "сильная сторона 2", ...],
-            "perceived_weaknesses": ["слабая сторона 1", "слабая сторона 2", ...]
-        }}
-
-        ВАЖНО: Все результаты должны быть на русском языке! Предоставь конкретные, практические выводы.
-        """
-        
-        return prompt
+        # For services with URL the market analysis is requested in the same call
+        return _PROMPT_TEMPLATE.format(
+            service_name=service_info['service_name'],
+            service_url=service_info['service_url'],
+            description=service_info['description'],
+            additional_data=dumps_prompt_json(service_info.get('additional_data') or {}),
+            market_section=_MARKET_SECTION if service_info.get("service_url") else ""
+        )
     
     async def _perform_specific_analysis(self, service_info: Dict[str, Any]) -> Dict[str, Any]:
         """Perform business analysis of the service."""
         try:
-            # Create analysis result
-            result = BusinessAnalysisResult(
-                service_info=self.service_metadata,
-                analysis_type=AnalysisType.BUSINESS
-            )
-            
             # Analyze service description
             description = self._get_service_description()
             analysis_results = await self.analyze_description(description, AnalysisType.BUSINESS)
             
-            if "error" not in analysis_results:
-                result.business_model = analysis_results.get("business_model", {})
-                result.target_audience = analysis_results.get("target_audience", {})
-                result.market_analysis = analysis_results.get("market_analysis", {})
-                result.competitors = analysis_results.get("competitors", [])
-                result.monetization_strategies = analysis_results.get("monetization_strategies", [])
-                result.growth_potential = analysis_results.get("growth_potential", {})
-            else:
-                result.error = analysis_results["error"]
+            # Result dict has the fields of BusinessAnalysisResult and is built only once
+            error = analysis_results.get("error")
+            fields = {} if error else analysis_results
+            raw_data = {}
             
             # Add web metadata if available
             if "web_metadata" in service_info.get("additional_data", {}):
-                result.raw_data["web_metadata"] = service_info["additional_data"]["web_metadata"]
+                raw_data["web_metadata"] = service_info["additional_data"]["web_metadata"]
             
-            # Perform additional market analysis if URL is available
+            # Market analysis is requested in the same AI call when URL is available
             if self.service_metadata.url:
-                market_analysis = await self._analyze_market_aspects(service_info)
-                if market_analysis:
-                    result.raw_data["market_analysis"] = market_analysis
+                if error:
+                    raw_data["market_analysis"] = {"error": error}
+                elif isinstance(analysis_results.get("market"), dict):
+                    raw_data["market_analysis"] = self._extract_market_analysis(analysis_results["market"])
             
             return {
                 "service_info": self.service_metadata,
                 "analysis_type": AnalysisType.BUSINESS,
-                "business_model": result.business_model,
-                "target_audience": result.target_audience,
-                "market_analysis": result.market_analysis,
-                "competitors": result.competitors,
-                "monetization_strategies": result.monetization_strategies,
-                "growth_potential": result.growth_potential,
-                "error": result.error,
-                "raw_data": result.raw_data
+                "business_model": fields.get("business_model", {}),
+                "target_audience": fields.get("target_audience", {}),
+                "market_analysis": fields.get("market_analysis", {}),
+                "competitors": fields.get("competitors", []),
+                "monetization_strategies": fields.get("monetization_strategies", []),
+                "growth_potential": fields.get("growth_potential", {}),
+                "error": error,
+                "raw_data": raw_data
             }
             
         except Exception as e:
             return self._create_error_result(f"Error during business analysis: {str(e)}")
 
-    async def _analyze_market_aspects(self, service_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze additional market aspects of the service."""
-        try:
-            # Prepare market analysis prompt
-            prompt = self._prepare_market_analysis_prompt(service_info)
-            
-            # Get AI analysis
-            market_analysis = await self._analyze_with_ai(prompt)
-            
-            if "error" in market_analysis:
-                return {"error": market_analysis["error"]}
-            
-            return {
-                "market_size": market_analysis.get("market_size", {}),
-                "market_trends": market_analysis.get("market_trends", []),
-                "competitive_landscape": market_analysis.get("competitive_landscape", {}),
-                "growth_opportunities": market_analysis.get("growth_opportunities", []),
-                "risks": market_analysis.get("risks", [])
-            }
-            
-        except Exception as e:
-            self.logger.warning(f"Error during market analysis: {str(e)}")
-            return {"error": str(e)}
-
-    def _prepare_market_analysis_prompt(self, service_info: Dict[str, Any]) -> str:
-        """Prepare prompt for market analysis."""
-        return f"""Analyze the market aspects of the service:
-
-Service: {self.service_metadata.name}
-URL: {self.service_metadata.url}
-Description: {self.service_metadata.description}
-
-Focus on:
-1. Market size and potential
-2. Current market trends
-3. Competitive landscape
-4. Growth opportunities
-5. Potential risks and challenges
-
-Provide a structured analysis with specific data points and actionable insights."""
+    def _extract_market_analysis(self, market_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract market analysis sections from AI response."""
+        return {
+            "market_size": market_analysis.get("market_size", {}),
+            "market_trends": market_analysis.get("market_trends", []),
+            "competitive_landscape": market_analysis.get("competitive_landscape", {}),
+            "growth_opportunities": market_analysis.get("growth_opportunities", []),
+            "risks": market_analysis.get("risks", [])
+        }
 
     def _create_error_result(self, error_message: str) -> Dict[str, Any]:
         """Create a result object for an error."""
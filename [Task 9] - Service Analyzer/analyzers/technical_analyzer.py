@@ -1,13 +1,70 @@
-from .base_analyzer import BaseAnalyzer, AnalysisType, TechnicalAnalysisResult, AnalysisResponse
+from .base_analyzer import BaseAnalyzer, AnalysisType, TechnicalAnalysisResult, AnalysisResponse, dumps_prompt_json, format_service_description
 from typing import Dict, Any, List, Optional
 import requests
-import json
-import aiohttp
 import asyncio
+import aiohttp
+import time
+
+# Placeholder for empty report fields
+_NOT_SPECIFIED_RU = "Не указано"
+
+# Fields of the technical analysis returned by analyze()
+_RESULT_FIELDS = ("architecture", "technical_requirements", "technical_risks", "integrations", "scalability")
+
+# Response headers kept in availability results (lowercase), the rest is not reported
+_INTERESTING_HEADERS = frozenset({
+    "content-type",
+    "server",
+    "cache-control",
+    "content-length",
+    "content-encoding",
+    "x-powered-by"
+})
+
+# Availability probe statuses meaning that HEAD requests are not supported
+_HEAD_UNSUPPORTED_STATUSES = frozenset({403, 405, 501})
+
+# Technical analysis prompt; placeholders are filled in _prepare_analysis_prompt
+_PROMPT_TEMPLATE = """Analyze the following web service from a technical perspective.
+        Focus on identifying:
+        1. Technical architecture and stack
+        2. Technical requirements and constraints
+        3. Potential technical risks and challenges
+        4. Required integrations and APIs
+        5. Scalability considerations
+        6. Performance and security aspects
+
+        Service Information:
+        Name: {service_name}
+        URL: {service_url}
+        Description: {description}
+
+        Additional Data:
+        {additional_data}
+
+        Return the analysis as a JSON object with the following structure:
+        {{
+            "architecture": "description of the technical architecture",
+            "technical_requirements": ["requirement1", "requirement2", ...],
+            "technical_risks": ["risk1", "risk2", ...],
+            "integrations": ["integration1", "integration2", ...],
+            "scalability": "scalability analysis"
+        }}
+
+        Ensure all text is in English and provide specific, actionable insights.
+        """
 
 class TechnicalAnalyzer(BaseAnalyzer):
     """Analyzer for technical aspects of the service."""
     
+    # Timeouts of the availability check request: unreachable hosts fail on connect,
+    # slow but responding servers get the rest of the total time
+    AVAILABILITY_TIMEOUT = aiohttp.ClientTimeout(total=6, connect=2, sock_connect=2, sock_read=4)
+    
+    # Description analysis and availability shared by analyze and _perform_specific_analysis
+    _core_result: Optional[Dict[str, Any]] = None
+    _core_lock: Optional[asyncio.Lock] = None
+    
     async def analyze(self) -> Dict[str, Any]:
         """
         Performs technical analysis of the service, including:
@@ -17,48 +74,51 @@ class TechnicalAnalyzer(BaseAnalyzer):
         - Scalability
         - Technical risks
         """
-        results = {}
-        
-        # Analyze service description
-        description = self._get_service_description()
-        analysis_results = await self.analyze_description(description, AnalysisType.TECHNICAL)
+        core = await self._compute_core()
+        analysis_results = core["analysis"]
         
-        if "error" not in analysis_results:
-            results.update({
-                "architecture": analysis_results.get("architecture", "Not specified"),
-                "technical_requirements": analysis_results.get("technical_requirements", "Not specified"),
-                "technical_risks": analysis_results.get("technical_risks", "Not specified"),
-                "integrations": analysis_results.get("integrations", "Not specified"),
-                "scalability": analysis_results.get("scalability", "Not specified")
-            })
+        # Missing fields get the placeholder; on error no field is taken from the response
+        if "error" in analysis_results:
+            results = {key: "Could not be determined" for key in _RESULT_FIELDS}
+            results["error"] = analysis_results["error"]
         else:
-            results.update({
-                "architecture": "Could not be determined",
-                "technical_requirements": "Could not be determined",
-                "technical_risks": "Could not be determined",
-                "integrations": "Could not be determined",
-                "scalability": "Could not be determined",
-                "error": analysis_results["error"]
-            })
+            results = {key: analysis_results.get(key, "Not specified") for key in _RESULT_FIELDS}
         
         # Check service availability
-        if self.service_metadata.url:
-            availability = await self._check_availability()
-            results["availability"] = availability
+        if core["availability"] is not None:
+            results["availability"] = core["availability"]
         
         return results
     
-    def _get_service_description(self) -> str:
-        """Formulates service description for technical analysis."""
-        description = f"Technical analysis of service {self.service_metadata.name}"
-        
-        if self.service_metadata.url:
-            description += f" (URL: {self.service_metadata.url})"
+    async def _compute_core(self) -> Dict[str, Any]:
+        """
+        Run description analysis and availability check once per analyzer.
         
-        if self.service_metadata.description:
-            description += f"\n\nService description: {self.service_metadata.description}"
+        Returns:
+            Dictionary with "analysis" results and "availability" (None without URL)
+        """
+        if self._core_lock is None:
+            self._core_lock = asyncio.Lock()
         
-        return description
+        async with self._core_lock:
+            if self._core_result is None:
+                description = self._get_service_description()
+                if self.service_metadata.url:
+                    # AI analysis and HTTP probe are independent, run them together
+                    analysis, availability = await asyncio.gather(
+                        self.analyze_description(description, AnalysisType.TECHNICAL),
+                        self._check_availability()
+                    )
+                else:
+                    analysis = await self.analyze_description(description, AnalysisType.TECHNICAL)
+                    availability = None
+                self._core_result = {"analysis": analysis, "availability": availability}
+        return self._core_result
+    
+    def _get_service_description(self) -> str:
+        """Formulates service description for technical analysis."""
+        metadata = self.service_metadata
+        return format_service_description("Technical analysis", metadata.name, metadata.url, metadata.description)
     
     async def _check_availability(self) -> Dict[str, Any]:
         """Checks service availability."""
@@ -66,23 +126,44 @@ class TechnicalAnalyzer(BaseAnalyzer):
             return {"error": "URL not specified"}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                start_time = asyncio.get_event_loop().time()
-                async with session.get(self.service_metadata.url, timeout=5) as response:
-                    end_time = asyncio.get_event_loop().time()
-                    response_time = end_time - start_time
-
-                    return {
-                        "is_available": response.status < 400,
-                        "status_code": response.status,
-                        "response_time": response_time,
-                        "headers": dict(response.headers)
-                    }
+            session = await self._get_session()
+            # HEAD avoids transferring the page body
+            result = await self._probe(session.head, allow_redirects=True)
+            if result["status_code"] in _HEAD_UNSUPPORTED_STATUSES:
+                # Some servers reject HEAD, fall back to GET of a single byte
+                result = await self._probe(session.get, headers={"Range": "bytes=0-0"})
+            return result
         except asyncio.TimeoutError:
             return {"error": "Request timeout exceeded"}
         except Exception as e:
             return {"error": f"Error checking availability: {str(e)}"}
     
+    async def _probe(self, request, **kwargs) -> Dict[str, Any]:
+        """
+        Send an availability probe request without reading the response body.
+        
+        Args:
+            request: Session request method (session.head or session.get)
+            **kwargs: Additional request arguments
+            
+        Returns:
+            Availability information
+        """
+        start_time = time.monotonic()
+        async with request(self.service_metadata.url, timeout=self.AVAILABILITY_TIMEOUT, **kwargs) as response:
+            response_time = time.monotonic() - start_time
+            result = {
+                "is_available": response.status < 400,
+                "status_code": response.status,
+                "response_time": response_time,
+                "headers": {
+                    key: value
+                    for key, value in response.headers.items()
+                    if key.lower() in _INTERESTING_HEADERS
+                }
+            }
+        return result
+    
     def generate_markdown(self, analysis_results: Dict[str, Any]) -> str:
         """Generate markdown report for technical analysis."""
         # Создаем объект TechnicalAnalysisResult с правильными параметрами
@@ -128,16 +209,18 @@ class TechnicalAnalyzer(BaseAnalyzer):
         return report
 
     def _format_list(self, items: List[str]) -> str:
-        """Format list items for markdown."""
+        """Format list items for markdown, skipping empty items."""
         if not items:
-            return "Не указано"
-        return "\n".join(f"- {item}" for item in items)
+            return _NOT_SPECIFIED_RU
+        lines = [f"- {item}" for item in items if item not in (None, "", [], {})]
+        return "\n".join(lines) if lines else _NOT_SPECIFIED_RU
 
     def _format_dict(self, data: Dict[str, Any]) -> str:
-        """Format dictionary items for markdown."""
+        """Format dictionary items for markdown, skipping empty values."""
         if not data:
-            return "Не указано"
-        return "\n".join(f"- **{key}**: {value}" for key, value in data.items())
+            return _NOT_SPECIFIED_RU
+        lines = [f"- **{key}**: {value}" for key, value in data.items() if value not in (None, "", [], {})]
+        return "\n".join(lines) if lines else _NOT_SPECIFIED_RU
 
     def _format_availability(self, availability: Optional[Dict[str, Any]]) -> str:
         """Format availability information for markdown."""
@@ -148,16 +231,17 @@ class TechnicalAnalyzer(BaseAnalyzer):
             return f"❌ Сервис недоступен\n- Причина: {availability['error']}"
         
         status = "✅ Доступен" if availability.get("is_available") else "❌ Недоступен"
-        result = f"- {status}\n"
-        result += f"- Код ответа: {availability.get('status_code', 'N/A')}\n"
-        result += f"- Время ответа: {availability.get('response_time', 0):.2f} сек\n"
+        parts = [
+            f"- {status}",
+            f"- Код ответа: {availability.get('status_code', 'N/A')}",
+            f"- Время ответа: {availability.get('response_time', 0):.2f} сек"
+        ]
         
         if "headers" in availability:
-            result += "\n#### Заголовки ответа\n"
-            for key, value in availability["headers"].items():
-                result += f"- {key}: {value}\n"
+            parts.append("\n#### Заголовки ответа")
+            parts.extend(f"- {key}: {value}" for key, value in availability["headers"].items())
         
-        return result
+        return "\n".join(parts) + "\n"
 
     async def _perform_specific_analysis(self, service_info: Dict[str, Any]) -> Dict[str, Any]:
         """Perform technical analysis of the service."""
@@ -168,9 +252,8 @@ class TechnicalAnalyzer(BaseAnalyzer):
                 analysis_type=AnalysisType.TECHNICAL
             )
             
-            # Analyze service description
-            description = self._get_service_description()
-            analysis_results = await self.analyze_description(description, AnalysisType.TECHNICAL)
+            core = await self._compute_core()
+            analysis_results = core["analysis"]
             
             if "error" not in analysis_results:
                 result.architecture = analysis_results.get("architecture")
@@ -182,9 +265,8 @@ class TechnicalAnalyzer(BaseAnalyzer):
                 result.error = analysis_results["error"]
             
             # Check service availability
-            if self.service_metadata.url:
-                availability = await self._check_availability()
-                result.availability = availability
+            if core["availability"] is not None:
+                result.availability = core["availability"]
             
             # Add web metadata if available
             if "web_metadata" in service_info.get("additional_data", {}):
@@ -216,33 +298,9 @@ class TechnicalAnalyzer(BaseAnalyzer):
         Returns:
             Formatted prompt string
         """
-        prompt = f"""Analyze the following web service from a technical perspective.
-        Focus on identifying:
-        1. Technical architecture and stack
-        2. Technical requirements and constraints
-        3. Potential technical risks and challenges
-        4. Required integrations and APIs
-        5. Scalability considerations
-        6. Performance and security aspects
-
-        Service Information:
-        Name: {service_info['service_name']}
-        URL: {service_info['service_url']}
-        Description: {service_info['description']}
-
-        Additional Data:
-        {json.dumps(service_info.get('additional_data', {}), indent=2)}
-
-        Return the analysis as a JSON object with the following structure:
-        {{
-            "architecture": "description of the technical architecture",
-            "technical_requirements": ["requirement1", "requirement2", ...],
-            "technical_risks": ["risk1", "risk2", ...],
-            "integrations": ["integration1", "integration2", ...],
-            "scalability": "scalability analysis"
-        }}
-
-        Ensure all text is in English and provide specific, actionable insights.
-        """
-        
-        return prompt 
\ No newline at end of file
+        return _PROMPT_TEMPLATE.format(
+            service_name=service_info['service_name'],
+            service_url=service_info['service_url'],
+            description=service_info['description'],
+            additional_data=dumps_prompt_json(service_info.get('additional_data') or {})
+        )
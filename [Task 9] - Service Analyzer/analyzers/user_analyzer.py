@@ -1,11 +1,50 @@
-from .base_analyzer import BaseAnalyzer, AnalysisType, UserAnalysisResult, AnalysisResponse
-from typing import Dict, Any, List
-import json
+from .base_analyzer import BaseAnalyzer, AnalysisType, UserAnalysisResult, AnalysisResponse, dumps_prompt_json, format_service_description
+from typing import Dict, Any, List, Optional
 import asyncio
 
+# Fields of the user experience analysis returned by analyze()
+_RESULT_FIELDS = ("user_scenarios", "ux_issues", "interface_requirements", "success_metrics", "improvement_recommendations")
+
+# Placeholder for empty report fields
+_NOT_SPECIFIED = "Not specified"
+
+# User experience analysis prompt; placeholders are filled in _prepare_analysis_prompt
+_PROMPT_TEMPLATE = """Analyze the following web service from a user experience perspective.
+        Focus on identifying:
+        1. User scenarios and use cases
+        2. UX issues and pain points
+        3. Interface requirements and design considerations
+        4. Success metrics and KPIs
+        5. Improvement recommendations
+        6. User journey optimization
+
+        Service Information:
+        Name: {service_name}
+        URL: {service_url}
+        Description: {description}
+
+        Additional Data:
+        {additional_data}
+
+        Return the analysis as a JSON object with the following structure:
+        {{
+            "user_scenarios": ["scenario1", "scenario2", ...],
+            "ux_issues": ["issue1", "issue2", ...],
+            "interface_requirements": ["requirement1", "requirement2", ...],
+            "success_metrics": ["metric1", "metric2", ...],
+            "improvement_recommendations": ["recommendation1", "recommendation2", ...]
+        }}
+
+        Ensure all text is in English and provide specific, actionable insights.
+        """
+
 class UserAnalyzer(BaseAnalyzer):
     """Analyzer for user experience aspects of the service."""
     
+    # Description analysis shared by analyze and _perform_specific_analysis
+    _core_result: Optional[Dict[str, Any]] = None
+    _core_lock: Optional[asyncio.Lock] = None
+    
     async def analyze(self) -> Dict[str, Any]:
         """
         Performs user experience analysis of the service, including:
@@ -15,43 +54,36 @@ class UserAnalyzer(BaseAnalyzer):
         - Success metrics
         - Improvement recommendations
         """
-        results = {}
-        
-        # Analyze service description
-        description = self._get_service_description()
-        analysis_results = await self.analyze_description(description, AnalysisType.USER)
+        analysis_results = await self._compute_core()
         
-        if "error" not in analysis_results:
-            results.update({
-                "user_scenarios": analysis_results.get("user_scenarios", []),
-                "ux_issues": analysis_results.get("ux_issues", []),
-                "interface_requirements": analysis_results.get("interface_requirements", []),
-                "success_metrics": analysis_results.get("success_metrics", []),
-                "improvement_recommendations": analysis_results.get("improvement_recommendations", [])
-            })
-        else:
-            results.update({
-                "user_scenarios": [],
-                "ux_issues": [],
-                "interface_requirements": [],
-                "success_metrics": [],
-                "improvement_recommendations": [],
-                "error": analysis_results["error"]
-            })
+        # On error no field is taken from the response
+        fields = {} if "error" in analysis_results else analysis_results
+        results = {key: fields.get(key, []) for key in _RESULT_FIELDS}
+        if "error" in analysis_results:
+            results["error"] = analysis_results["error"]
         
         return results
     
-    def _get_service_description(self) -> str:
-        """Formulates service description for user experience analysis."""
-        description = f"User experience analysis of service {self.service_metadata.name}"
-        
-        if self.service_metadata.url:
-            description += f" (URL: {self.service_metadata.url})"
+    async def _compute_core(self) -> Dict[str, Any]:
+        """
+        Run description analysis once per analyzer.
         
-        if self.service_metadata.description:
-            description += f"\n\nService description: {self.service_metadata.description}"
+        Returns:
+            Description analysis results
+        """
+        if self._core_lock is None:
+            self._core_lock = asyncio.Lock()
         
-        return description
+        async with self._core_lock:
+            if self._core_result is None:
+                description = self._get_service_description()
+                self._core_result = await self.analyze_description(description, AnalysisType.USER)
+        return self._core_result
+    
+    def _get_service_description(self) -> str:
+        """Formulates service description for user experience analysis."""
+        metadata = self.service_metadata
+        return format_service_description("User experience analysis", metadata.name, metadata.url, metadata.description)
     
     def generate_markdown(self, analysis_results: Dict[str, Any]) -> str:
         """Generate markdown report for user experience analysis."""
@@ -70,64 +102,34 @@ class UserAnalyzer(BaseAnalyzer):
         result.success_metrics = analysis_results.get("success_metrics", [])
         result.improvement_recommendations = analysis_results.get("improvement_recommendations", [])
         
-        report = f"""## User Experience Analysis of Service {self.service_metadata.name}
-
-### User Scenarios
-{self._format_list(result.user_scenarios)}
-
-### UX Issues
-{self._format_list(result.ux_issues)}
-
-### Interface Requirements
-{self._format_list(result.interface_requirements)}
-
-### Success Metrics
-{self._format_list(result.success_metrics)}
-
-### Improvement Recommendations
-{self._format_list(result.improvement_recommendations)}
-"""
-        
-        # Add UX analysis if available
-        if "ux_analysis" in result.raw_data:
-            ux = result.raw_data["ux_analysis"]
-            if "error" not in ux:
-                report += "\n### Additional UX Analysis\n"
-                
-                if "accessibility" in ux:
-                    report += "\n#### Accessibility\n"
-                    report += self._format_dict(ux["accessibility"])
-                
-                if "usability" in ux:
-                    report += "\n#### Usability\n"
-                    report += self._format_dict(ux["usability"])
-                
-                if "user_feedback" in ux:
-                    report += "\n#### User Feedback\n"
-                    report += self._format_list(ux["user_feedback"])
-                
-                if "recommendations" in ux:
-                    report += "\n#### Additional Recommendations\n"
-                    report += self._format_list(ux["recommendations"])
-            else:
-                report += f"\n> ⚠️ **Note**: Error in UX analysis: {ux['error']}"
+        parts = [f"## User Experience Analysis of Service {self.service_metadata.name}\n"]
+        for title, items in (
+            ("User Scenarios", result.user_scenarios),
+            ("UX Issues", result.ux_issues),
+            ("Interface Requirements", result.interface_requirements),
+            ("Success Metrics", result.success_metrics),
+            ("Improvement Recommendations", result.improvement_recommendations)
+        ):
+            parts.append(f"\n### {title}\n{self._format_list(items)}\n")
         
         if result.error:
-            report += f"\n> ⚠️ **Note**: {result.error}"
+            parts.append(f"\n> ⚠️ **Note**: {result.error}")
         
-        return report
+        return "".join(parts)
 
     def _format_list(self, items: List[str]) -> str:
-        """Format list items for markdown."""
+        """Format list items for markdown, skipping empty items."""
         if not items:
-            return "Not specified"
-        return "\n".join(f"- {item}" for item in items)
+            return _NOT_SPECIFIED
+        lines = [f"- {item}" for item in items if item not in (None, "", [], {})]
+        return "\n".join(lines) if lines else _NOT_SPECIFIED
 
     def _format_dict(self, data: Dict[str, Any]) -> str:
-        """Format dictionary items for markdown."""
+        """Format dictionary items for markdown, skipping empty values."""
         if not data:
-            return "Not specified"
-        return "\n".join(f"- **{key}**: {value}" for key, value in data.items())
+            return _NOT_SPECIFIED
+        lines = [f"- **{key}**: {value}" for key, value in data.items() if value not in (None, "", [], {})]
+        return "\n".join(lines) if lines else _NOT_SPECIFIED
     
     def _prepare_analysis_prompt(self, service_info: Dict[str, Any]) -> str:
         """
@@ -139,36 +141,12 @@ class UserAnalyzer(BaseAnalyzer):
         Returns:
             Formatted prompt string
         """
-        prompt = f"""Analyze the following web service from a user experience perspective.
-        Focus on identifying:
-        1. User scenarios and use cases
-        2. UX issues and pain points
-        3. Interface requirements and design considerations
-        4. Success metrics and KPIs
-        5. Improvement recommendations
-        6. User journey optimization
-
-        Service Information:
-        Name: {service_info['service_name']}
-        URL: {service_info['service_url']}
-        Description: {service_info['description']}
-
-        Additional Data:
-        {json.dumps(service_info.get('additional_data', {}), indent=2)}
-
-        Return the analysis as a JSON object with the following structure:
-        {{
-            "user_scenarios": ["scenario1", "scenario2", ...],
-            "ux_issues": ["issue1", "issue2", ...],
-            "interface_requirements": ["requirement1", "requirement2", ...],
-            "success_metrics": ["metric1", "metric2", ...],
-            "improvement_recommendations": ["recommendation1", "recommendation2", ...]
-        }}
-
-        Ensure all text is in English and provide specific, actionable insights.
-        """
-        
-        return prompt
+        return _PROMPT_TEMPLATE.format(
+            service_name=service_info['service_name'],
+            service_url=service_info['service_url'],
+            description=service_info['description'],
+            additional_data=dumps_prompt_json(service_info.get('additional_data') or {})
+        )
     
     async def _perform_specific_analysis(self, service_info: Dict[str, Any]) -> Dict[str, Any]:
         """Perform user experience analysis of the service."""
@@ -179,9 +157,7 @@ class UserAnalyzer(BaseAnalyzer):
                 analysis_type=AnalysisType.USER
             )
             
-            # Analyze service description
-            description = self._get_service_description()
-            analysis_results = await self.analyze_description(description, AnalysisType.USER)
+            analysis_results = await self._compute_core()
             
             if "error" not in analysis_results:
                 result.user_scenarios = analysis_results.get("user_scenarios", [])
@@ -211,45 +187,6 @@ class UserAnalyzer(BaseAnalyzer):
         except Exception as e:
             return self._create_error_result(f"Error during user experience analysis: {str(e)}")
 
-    async def _analyze_ux_aspects(self, service_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze additional UX aspects of the service."""
-        try:
-            # Prepare UX analysis prompt
-            prompt = self._prepare_ux_analysis_prompt(service_info)
-            
-            # Get AI analysis
-            ux_analysis = await self._analyze_with_ai(prompt)
-            
-            if "error" in ux_analysis:
-                return {"error": ux_analysis["error"]}
-            
-            return {
-                "accessibility": ux_analysis.get("accessibility", {}),
-                "usability": ux_analysis.get("usability", {}),
-                "user_feedback": ux_analysis.get("user_feedback", []),
-                "recommendations": ux_analysis.get("recommendations", [])
-            }
-            
-        except Exception as e:
-            self.logger.warning(f"Error during UX analysis: {str(e)}")
-            return {"error": str(e)}
-
-    def _prepare_ux_analysis_prompt(self, service_info: Dict[str, Any]) -> str:
-        """Prepare prompt for UX analysis."""
-        return f"""Analyze the user experience aspects of the service:
-
-Service: {self.service_metadata.name}
-URL: {self.service_metadata.url}
-Description: {self.service_metadata.description}
-
-Focus on:
-1. Accessibility (WCAG compliance, mobile responsiveness)
-2. Usability (navigation, content organization, user flows)
-3. User feedback and satisfaction
-4. Specific recommendations for improvement
-
-Provide a structured analysis with specific examples and actionable recommendations."""
-
     def _create_error_result(self, error_message: str) -> Dict[str, Any]:
         """Create an error result for user experience analysis."""
         return {
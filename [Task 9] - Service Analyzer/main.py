@@ -1,19 +1,21 @@
 import typer
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Union
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.syntax import Syntax
 import os
 import asyncio
 from dotenv import load_dotenv
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from analyzers.business_analyzer import BusinessAnalyzer
 from analyzers.technical_analyzer import TechnicalAnalyzer
 from analyzers.user_analyzer import UserAnalyzer
-from analyzers.base_analyzer import APIError, APIKeyError, APIRequestError, APIRateLimitError
+from analyzers.base_analyzer import APIError, APIKeyError, APIRequestError, APIRateLimitError, close_shared_session, close_ai_clients
 
 # Load environment variables
 load_dotenv()
@@ -25,20 +27,53 @@ app = typer.Typer(
 )
 console = Console()
 
-def save_report(content: str, output_file: Path) -> None:
-    """Save analysis report to file."""
+def read_concurrency_limit(default: int = 3) -> int:
+    """Read MAX_CONCURRENT_ANALYZERS from the environment, keeping it at least 1."""
+    try:
+        limit = int(os.getenv("MAX_CONCURRENT_ANALYZERS", default))
+    except ValueError:
+        # Non-integer value: fall back instead of failing at import
+        return default
+    # Semaphore(0) would block every analyzer forever
+    return max(limit, 1)
+
+# Maximum number of analyzers running (and calling the OpenAI API) at the same time
+MAX_CONCURRENT_ANALYZERS = read_concurrency_limit()
+
+# Preview shows at most this many report lines, the full report is in the file
+PREVIEW_MAX_LINES = 200
+
+# Buffer size for writing the report file
+REPORT_WRITE_BUFFER = 1 << 16
+
+# Date format used in the report front matter and footer
+REPORT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# YAML front matter of the report file, filled with the save date
+_FRONT_MATTER_TEMPLATE = "---\ntitle: Service Analysis\ndate: {date}\n---\n\n"
+
+def save_report(content: Union[str, Iterable[str]], output_file: Path) -> None:
+    """Save analysis report to file, writing it chunk by chunk."""
     output_file.parent.mkdir(parents=True, exist_ok=True)
+    chunks = (content,) if isinstance(content, str) else content
     
-    # Add YAML front matter
-    report = f"""---
-title: Service Analysis
-date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
----
+    with output_file.open("w", encoding="utf-8", buffering=REPORT_WRITE_BUFFER) as f:
+        # Add YAML front matter
+        f.write(_FRONT_MATTER_TEMPLATE.format(date=datetime.now().strftime(REPORT_DATE_FORMAT)))
+        f.writelines(chunks)
+        f.write("\n")
 
-{content}
-"""
+def iter_report_parts(name: str, results: List[dict]) -> Iterator[str]:
+    """Yield parts of the markdown report for analysis results."""
+    yield f"# Анализ сервиса: {name}\n\n"
     
-    output_file.write_text(report, encoding='utf-8')
+    for result in results:
+        if "error" in result:
+            yield f"\n## Ошибка анализа\n\n[bold red]{result['error']}[/bold red]"
+        else:
+            yield f"\n{result.get('markdown', '')}\n"
+    
+    yield f"\n---\n*Отчет сгенерирован автоматически с помощью Service Analyzer*\n*Дата: {datetime.now().strftime(REPORT_DATE_FORMAT)}*\n"
 
 async def run_analysis(
     service_name: str,
@@ -47,63 +82,87 @@ async def run_analysis(
     description: Optional[str] = None,
     no_preview: bool = False
 ) -> dict:
-    """Run analysis using all analyzers."""
+    """Run analysis using all analyzers concurrently."""
     analyzers = [
         BusinessAnalyzer(service_name, url, api_key, description),
         TechnicalAnalyzer(service_name, url, api_key, description),
         UserAnalyzer(service_name, url, api_key, description)
     ]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYZERS)
+    
+    def error_result(message: str, markdown: str) -> dict:
+        return {
+            "error": message,
+            "service_info": {
+                "service_name": service_name,
+                "service_url": url,
+                "description": description
+            },
+            "analysis": {},
+            "markdown": markdown
+        }
     
-    results = []
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        for analyzer in analyzers:
-            analyzer_type = analyzer.__class__.__name__
-            task = progress.add_task(f"Запуск {analyzer_type}...", total=None)
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            async def run_analyzer(analyzer, task) -> dict:
+                analyzer_type = analyzer.__class__.__name__
+                
+                async with semaphore:
+                    progress.update(task, description=f"Запуск {analyzer_type}...")
+                    try:
+                        async with analyzer:  # Use async context manager
+                            result = await analyzer.analyze()
+                        progress.update(task, description=f"Завершен {analyzer_type}")
+                        return result
+                    except (APIKeyError, APIRateLimitError):
+                        raise
+                    except APIRequestError as e:
+                        progress.update(task, description=f"Ошибка в {analyzer_type}")
+                        return error_result(
+                            f"Ошибка во время анализа {analyzer_type}: {str(e)}",
+                            f"## Ошибка в {analyzer_type}\n\n{str(e)}"
+                        )
+                    except Exception as e:
+                        progress.update(task, description=f"Ошибка в {analyzer_type}")
+                        return error_result(
+                            f"Неожиданная ошибка во время анализа {analyzer_type}: {str(e)}",
+                            f"## Неожиданная ошибка в {analyzer_type}\n\n{str(e)}"
+                        )
+            
+            # One progress line per analyzer, shown upfront in a stable order
+            progress_tasks = [
+                progress.add_task(f"Ожидание {analyzer.__class__.__name__}...", total=None)
+                for analyzer in analyzers
+            ]
             
+            # Analyzers are independent, so their API calls overlap
+            tasks = [
+                asyncio.create_task(run_analyzer(analyzer, task))
+                for analyzer, task in zip(analyzers, progress_tasks)
+            ]
             try:
-                async with analyzer:  # Use async context manager
-                    result = await analyzer.analyze()
-                    results.append(result)
-                    progress.update(task, description=f"Завершен {analyzer_type}")
-            except APIKeyError as e:
+                results = await asyncio.gather(*tasks)
+            except (APIKeyError, APIRateLimitError) as e:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
                 progress.stop()
-                console.print(f"[bold red]Ошибка API ключа: {str(e)}[/bold red]")
+                if isinstance(e, APIKeyError):
+                    console.print(f"[bold red]Ошибка API ключа: {str(e)}[/bold red]")
+                else:
+                    console.print(f"[bold yellow]Превышен лимит запросов: {str(e)}[/bold yellow]")
+                    console.print("Попробуйте позже или используйте другой API ключ.")
                 raise typer.Exit(1)
-            except APIRateLimitError as e:
-                progress.stop()
-                console.print(f"[bold yellow]Превышен лимит запросов: {str(e)}[/bold yellow]")
-                console.print("Попробуйте позже или используйте другой API ключ.")
-                raise typer.Exit(1)
-            except APIRequestError as e:
-                results.append({
-                    "error": f"Ошибка во время анализа {analyzer_type}: {str(e)}",
-                    "service_info": {
-                        "service_name": service_name,
-                        "service_url": url,
-                        "description": description
-                    },
-                    "analysis": {},
-                    "markdown": f"## Ошибка в {analyzer_type}\n\n{str(e)}"
-                })
-                progress.update(task, description=f"Ошибка в {analyzer_type}")
-            except Exception as e:
-                results.append({
-                    "error": f"Неожиданная ошибка во время анализа {analyzer_type}: {str(e)}",
-                    "service_info": {
-                        "service_name": service_name,
-                        "service_url": url,
-                        "description": description
-                    },
-                    "analysis": {},
-                    "markdown": f"## Неожиданная ошибка в {analyzer_type}\n\n{str(e)}"
-                })
-                progress.update(task, description=f"Ошибка в {analyzer_type}")
+    finally:
+        # Analyzers share HTTP session and OpenAI clients; close them once all of them are done
+        await close_shared_session()
+        await close_ai_clients()
     
-    return results
+    return list(results)
 
 @app.command()
 def main(
@@ -131,25 +190,32 @@ def main(
             raise typer.Exit(1)
         
         # Run analysis
-        results = asyncio.run(run_analysis(name, api_key, url, description, no_preview))
-        
-        # Generate report
-        report = f"# Анализ сервиса: {name}\n\n"
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            results = runner.run(run_analysis(name, api_key, url, description, no_preview))
         
-        for result in results:
-            if "error" in result:
-                report += f"\n## Ошибка анализа\n\n[bold red]{result['error']}[/bold red]"
-            else:
-                report += f"\n{result.get('markdown', '')}\n"
-        
-        report += f"\n---\n*Отчет сгенерирован автоматически с помощью Service Analyzer*\n*Дата: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        # Generate report; parts are kept in memory only when the preview needs them
+        report_parts = iter_report_parts(name, results)
+        if not no_preview:
+            report_parts = list(report_parts)
         
         # Save report
-        save_report(report, output)
+        save_report(report_parts, output)
         
         if not no_preview:
             console.print("\nПредварительный просмотр отчета:")
-            console.print(Markdown(report))
+            preview_lines = "".join(report_parts).splitlines()
+            preview = "\n".join(preview_lines[:PREVIEW_MAX_LINES])
+            if len(preview_lines) > PREVIEW_MAX_LINES:
+                preview += f"\n\n*... отчет сокращен, полная версия в файле {output}*"
+            
+            if console.is_terminal:
+                # Markdown renderer pulls in the syntax highlighter, import it only for the preview
+                from rich.markdown import Markdown
+                console.print(Markdown(preview))
+            else:
+                # Rendering is pointless when output is piped, print the markdown as is
+                console.out(preview, highlight=False)
         
         console.print(f"\nОтчет сохранен в: {output}")
         
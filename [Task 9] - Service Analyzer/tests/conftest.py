@@ -1,17 +1,58 @@
+import asyncio
 import os
-import sys
 import pytest
+from types import MappingProxyType
+from tenacity import wait_none
 
-# Добавляем корневую директорию проекта в PYTHONPATH
+# Корневая директория проекта (в PYTHONPATH её добавляет pytest, см. pythonpath в pytest.ini)
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, project_root)
+
+from analyzers import base_analyzer
+from analyzers.base_analyzer import BaseAnalyzer
 
 # Фикстуры, которые будут доступны во всех тестах
+@pytest.fixture(scope="session")
+def event_loop():
+    """Один цикл событий на всю сессию вместо отдельного цикла на каждый тест."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.run_until_complete(base_analyzer.close_shared_session())
+    loop.close()
+
+@pytest.fixture(autouse=True)
+def _reset_event_loop_state(event_loop):
+    """Изолирует тесты друг от друга при общем цикле событий."""
+    yield
+    # asyncio.Runner в main сбрасывает текущий цикл при выходе
+    asyncio.set_event_loop(event_loop)
+    # Кэши страниц и анализов привязаны к циклу и иначе переживали бы тест
+    for registry in (base_analyzer._page_caches, base_analyzer._page_locks, base_analyzer._analysis_caches):
+        registry.pop(event_loop, None)
+
+@pytest.fixture(autouse=True)
+def _no_retry_wait(monkeypatch):
+    """Убирает паузы между повторными запросами к API, чтобы ошибки не ждали backoff."""
+    monkeypatch.setattr(BaseAnalyzer._call_ai_api.retry, "wait", wait_none())
+
 @pytest.fixture(scope="session")
 def test_data_dir():
     """Возвращает путь к директории с тестовыми данными."""
     return os.path.join(project_root, "tests", "data")
 
+@pytest.fixture(scope="session")
+def test_api_key():
+    """Возвращает тестовый API ключ для создания анализаторов."""
+    return "test-api-key-12345"
+
+@pytest.fixture(scope="session")
+def base_service_info():
+    """Возвращает общие входные данные сервиса (только для чтения); варианты строятся через {**base_service_info, ...}."""
+    return MappingProxyType({
+        "service_name": "Test Service",
+        "service_url": "https://test.com",
+        "description": "Test description"
+    })
+
 @pytest.fixture(scope="session")
 def mock_api_key():
     """Возвращает тестовый API ключ."""
@@ -0,0 +1,77 @@
+import pytest
+
+from analyzers.technical_analyzer import TechnicalAnalyzer
+from analyzers.user_analyzer import UserAnalyzer
+
+# Анализаторы с одинаковым поведением общих методов: класс, имя, URL, тип анализа, заглушка пустого значения
+@pytest.fixture(params=[
+    (TechnicalAnalyzer, "Test Technical Service", "https://test-technical.com", "Technical analysis", "Не указано"),
+    (UserAnalyzer, "Test User Service", "https://test-user.com", "User experience analysis", "Not specified"),
+], ids=["technical", "user"])
+def analyzer_case(request):
+    return request.param
+
+@pytest.fixture
+def analyzer(analyzer_case, test_api_key):
+    cls, name, url, _, _ = analyzer_case
+    return cls(name, url, api_key=test_api_key)
+
+@pytest.fixture
+def placeholder(analyzer_case):
+    return analyzer_case[4]
+
+def test_get_service_description_generated(analyzer, analyzer_case):
+    """Test getting service description built from metadata."""
+    _, name, url, kind, _ = analyzer_case
+    description = analyzer._get_service_description()
+    assert f"{kind} of service" in description
+    assert name in description
+    assert url.split("://")[1] in description
+
+def test_get_service_description_custom(analyzer):
+    """Test getting service description with provided description."""
+    analyzer.service_metadata.description = "Custom description"
+    description = analyzer._get_service_description()
+    assert "Custom description" in description
+
+@pytest.mark.parametrize("data, expected", [
+    ({"key1": "value1", "key2": "value2"}, ["**key1**: value1", "**key2**: value2"]),
+    ({}, []),
+], ids=["filled", "empty"])
+def test_format_dict(analyzer, placeholder, data, expected):
+    """Test formatting filled and empty dictionary for markdown."""
+    formatted = analyzer._format_dict(data)
+    for fragment in expected:
+        assert fragment in formatted
+    if not data:
+        assert formatted == placeholder
+
+@pytest.mark.parametrize("items, expected", [
+    (["item1", "item2", "item3"], ["- item1", "- item2", "- item3"]),
+    ([], []),
+], ids=["filled", "empty"])
+def test_format_list(analyzer, placeholder, items, expected):
+    """Test formatting filled and empty list for markdown."""
+    formatted = analyzer._format_list(items)
+    for fragment in expected:
+        assert fragment in formatted
+    if not items:
+        assert formatted == placeholder
+
+def test_prepare_analysis_prompt(analyzer, base_service_info):
+    """Test that the analysis prompt includes service information."""
+    service_info = {**base_service_info, "additional_data": {"key": "value"}}
+
+    prompt = analyzer._prepare_analysis_prompt(service_info)
+    assert "Test Service" in prompt
+    assert "https://test.com" in prompt
+    assert "Test description" in prompt
+
+def test_create_error_result(analyzer):
+    """Test creating error result."""
+    error_result = analyzer._create_error_result("Test error")
+
+    assert "service_info" in error_result
+    assert "analysis" in error_result
+    assert "markdown" in error_result
+    assert "Test error" in error_result["markdown"]
@@ -1,35 +1,48 @@
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
-import sys
-import os
+from unittest.mock import Mock, patch, AsyncMock
 from typing import Dict, Any, Optional
 import json
 import aiohttp
 from datetime import datetime
 from bs4 import BeautifulSoup
 import logging
-
-# Добавляем путь к корневой директории проекта
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from types import SimpleNamespace
 
 from analyzers.base_analyzer import (
     BaseAnalyzer, 
     AnalysisType, 
     ServiceMetadata,
+    FetchedPage,
     AnalysisResponse,
     APIError,
     APIKeyError,
     APIRequestError,
-    APIRateLimitError
+    APIRateLimitError,
+    _parse_html,
+    _is_security_header,
+    _ai_clients,
+    _page_locks,
+    close_shared_session
 )
 
+class MockStreamReader:
+    """Mock class for aiohttp response body stream."""
+    def __init__(self, data: bytes):
+        self._data = data
+
+    async def iter_chunked(self, n: int):
+        for i in range(0, len(self._data), n):
+            yield self._data[i:i + n]
+
 class MockResponse:
     """Mock class for aiohttp response."""
     def __init__(self, status: int, text: str, headers: Dict[str, str] = None):
         self.status = status
         self._text = text
         self.headers = headers or {}
+        self.charset = "utf-8"
+        self.content = MockStreamReader(text.encode("utf-8"))
 
     async def text(self) -> str:
         return self._text
@@ -41,14 +54,17 @@ class MockResponse:
         pass
 
 class MockSession:
-    """Mock class for aiohttp session."""
-    def __init__(self, raise_exc=None):
+    """Mock class for aiohttp session serving responses from a URL table."""
+    def __init__(self, responses: Optional[Dict[str, MockResponse]] = None, raise_exc=None):
+        self.responses = responses or {}
         self.raise_exc = raise_exc
+        self.requested_urls = []
 
-    async def get(self, url, timeout=None):
+    def get(self, url, timeout=None):
         if self.raise_exc:
             raise self.raise_exc
-        return MockResponse(200, "<html><body>Test</body></html>", {"Server": "nginx"})
+        self.requested_urls.append(url)
+        return self.responses.get(url) or MockResponse(404, "")
 
     async def close(self):
         pass
@@ -59,6 +75,29 @@ class MockSession:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         pass
 
+# Страница с маркерами фронтенда, библиотек и инструментов для определения технологий
+SAMPLE_HTML = """
+<html>
+    <head>
+        <script src="https://code.jquery.com/jquery.min.js"></script>
+        <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.0.0/dist/js/bootstrap.min.js"></script>
+    </head>
+    <body>
+        <div data-reactroot>
+            <p>React app</p>
+        </div>
+        <script>
+            // Google Analytics
+            gtag('config', 'GA_MEASUREMENT_ID');
+        </script>
+    </body>
+</html>
+"""
+
+def make_completion(content: str) -> SimpleNamespace:
+    """Builds a minimal chat completion response with the given message content."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
 class TestAnalyzer(BaseAnalyzer):
     """Test implementation of BaseAnalyzer."""
     
@@ -75,26 +114,25 @@ class TestAnalyzer(BaseAnalyzer):
     def generate_markdown(self, analysis_results: Dict[str, Any]) -> str:
         return "# Test Analysis\n\nTest content"
 
-@pytest.fixture
-def test_api_key():
-    return "test-api-key-12345"
-
 @pytest.fixture
 def analyzer(test_api_key):
     return TestAnalyzer("Test Service", "https://test-service.com", api_key=test_api_key)
 
-@pytest.mark.asyncio
-async def test_get_service_description(analyzer):
+@pytest.fixture(scope="module")
+def mock_session():
+    # Таблица ответов одна на модуль; _get_session возвращает сессию через _session
+    return MockSession({
+        "https://test-service.com": MockResponse(200, "<html><body>Test</body></html>", {"Server": "nginx"})
+    })
+
+async def test_get_service_description(analyzer, mock_session):
     """Test getting service description."""
-    with patch.object(analyzer, '_get_session') as mock_get_session:
-        mock_session = MockSession()
-        mock_get_session.return_value = mock_session
-        
-        description = await analyzer._get_service_description()
-        assert "Test Service" in description
-        assert "test-service.com" in description
+    analyzer._session = mock_session
+    
+    description = await analyzer._get_service_description()
+    assert "Test Service" in description
+    assert "test-service.com" in description
 
-@pytest.mark.asyncio
 async def test_get_service_description_no_url(analyzer):
     """Test getting service description without URL."""
     analyzer.service_metadata.url = None
@@ -103,30 +141,151 @@ async def test_get_service_description_no_url(analyzer):
     description = await analyzer._get_service_description()
     assert description == "Service Test Service"
 
-@pytest.mark.asyncio
-async def test_enrich_service_info(analyzer):
+async def test_enrich_service_info(analyzer, mock_session):
     """Test enriching service information."""
-    with patch.object(analyzer, '_get_session') as mock_get_session:
-        mock_session = MockSession()
-        mock_get_session.return_value = mock_session
-        
-        service_info = await analyzer._enrich_service_info()
+    analyzer._session = mock_session
+    
+    service_info = await analyzer._enrich_service_info()
+    
+    assert service_info["service_name"] == "Test Service"
+    assert service_info["service_url"] == "https://test-service.com"
+    assert "additional_data" in service_info
+
+async def test_service_page_fetched_once(analyzer):
+    """Test that description and enrichment share a single page fetch."""
+    html = '<html><head><meta name="description" content="Page description"></head></html>'
+    mock_session = MockSession({"https://test-service.com": MockResponse(200, html, {"Server": "nginx"})})
+    analyzer._session = mock_session
+    
+    description = await analyzer._get_service_description()
+    service_info = await analyzer._enrich_service_info()
+    
+    assert description == "Page description"
+    assert service_info["additional_data"]["web_metadata"]["technologies"]["backend"] == ["Nginx"]
+    assert mock_session.requested_urls == ["https://test-service.com"]
+
+async def test_read_page_truncates_large_pages():
+    """Test that page reading stops after the size limit."""
+    response = MockResponse(200, "<html>" + "я" * 100 + "</html>")
+    
+    with patch("analyzers.base_analyzer.PAGE_READ_CHUNK_SIZE", 16), \
+         patch("analyzers.base_analyzer.PAGE_MAX_BYTES", 64):
+        html = await BaseAnalyzer._read_page(response)
+    
+    assert html.startswith("<html>я")
+    assert len(html.encode("utf-8")) <= 64
+    assert await BaseAnalyzer._read_page(MockResponse(200, "<p>Привет</p>")) == "<p>Привет</p>"
+
+def test_is_security_header():
+    """Test security header classification."""
+    assert _is_security_header("X-Frame-Options")
+    assert _is_security_header("Strict-Transport-Security")
+    assert _is_security_header("Content-Security-Policy")
+    assert _is_security_header("Referrer-Policy")
+    assert not _is_security_header("Server")
+    assert not _is_security_header("Cache-Control")
+
+async def test_service_page_shared_between_analyzers(test_api_key):
+    """Test that analyzers of the same URL share a single page fetch."""
+    html = '<html><head><title>Shared page</title></head></html>'
+    mock_session = MockSession({"https://shared-service.com": MockResponse(200, html)})
+    analyzers = [
+        TestAnalyzer("Test Service", "https://shared-service.com", api_key=test_api_key)
+        for _ in range(3)
+    ]
+    for a in analyzers:
+        a._session = mock_session
+    
+    with patch.object(TestAnalyzer, '_extract_description', wraps=BaseAnalyzer._extract_description) as mock_extract:
+        descriptions = await asyncio.gather(*(a._get_service_description() for a in analyzers))
+    
+    assert descriptions == ["Shared page"] * 3
+    assert len(mock_session.requested_urls) == 1
+    assert mock_extract.call_count == 1
+
+async def test_error_page_not_cached(test_api_key):
+    """Test that error responses are fetched again instead of being served from the page cache."""
+    mock_session = MockSession({"https://unavailable-service.com": MockResponse(503, "")})
+    a = TestAnalyzer("Test Service", "https://unavailable-service.com", api_key=test_api_key)
+    a._session = mock_session
+    
+    first = await a._fetch_page()
+    second = await a._fetch_page()
+    
+    assert first.status == second.status == 503
+    assert len(mock_session.requested_urls) == 2
+    # Uncached pages do not leave their fetch lock behind
+    assert _page_locks[asyncio.get_running_loop()] == {}
+
+async def test_web_metadata_shared_between_analyzers(test_api_key):
+    """Test that web metadata of a page is extracted once and expires with the page."""
+    html = '<html><script src="/jquery.js"></script></html>'
+    mock_session = MockSession({"https://metadata-service.com": MockResponse(200, html, {"Server": "nginx"})})
+    analyzers = [
+        TestAnalyzer("Test Service", "https://metadata-service.com", api_key=test_api_key)
+        for _ in range(2)
+    ]
+    for a in analyzers:
+        a._session = mock_session
+    
+    with patch.object(TestAnalyzer, '_detect_technologies_sync', wraps=BaseAnalyzer._detect_technologies_sync) as mock_detect:
+        infos = await asyncio.gather(*(a._enrich_service_info() for a in analyzers))
+        assert mock_detect.call_count == 1
+        assert len(mock_session.requested_urls) == 1
+        assert infos[0]["additional_data"] == infos[1]["additional_data"]
+        assert infos[0]["additional_data"]["web_metadata"]["technologies"]["libraries"] == ["jQuery"]
         
-        assert service_info["service_name"] == "Test Service"
-        assert service_info["service_url"] == "https://test-service.com"
-        assert "additional_data" in service_info
+        with patch("analyzers.base_analyzer.PAGE_CACHE_TTL", 0):
+            await analyzers[0]._enrich_service_info()
+        assert len(mock_session.requested_urls) == 2
+        assert mock_detect.call_count == 2
+
+async def test_page_parsed_once_for_description_and_metadata(test_api_key):
+    """Test that the description and technology detection share the parsed document of a fetched page."""
+    html = '<html><head><title>Parsed page</title></head><body><div data-reactroot=""></div></body></html>'
+    mock_session = MockSession({"https://parsed-service.com": MockResponse(200, html)})
+    a = TestAnalyzer("Test Service", "https://parsed-service.com", api_key=test_api_key)
+    a._session = mock_session
+    
+    with patch("analyzers.base_analyzer._parse_html", wraps=_parse_html) as mock_parse:
+        assert await a._get_service_description() == "Parsed page"
+        page = mock_parse.call_args.args[1]
+        parsed = page.parsed
+        info = await a._enrich_service_info()
+    
+    assert info["additional_data"]["web_metadata"]["technologies"]["frontend"] == ["React"]
+    # Technology detection went through the same cached page and reused its document
+    assert mock_parse.call_count == 2
+    assert mock_parse.call_args.args[1] is page
+    assert parsed is not None and page.parsed is parsed
 
-@pytest.mark.asyncio
 async def test_analyze_with_ai(analyzer):
     """Test AI analysis."""
     with patch.object(analyzer, '_call_ai_api') as mock_call_api:
-        mock_call_api.return_value = '{"test": "result"}'
+        mock_call_api.return_value = {"test": "result"}
         
         result = await analyzer._analyze_with_ai({"service_name": "test"})
         assert "test" in result
         assert result["test"] == "result"
 
-@pytest.mark.asyncio
+async def test_analyze_description_memoized(analyzer):
+    """Test that successful description analyses are reused and errors are not."""
+    with patch.object(analyzer, '_analyze_with_ai', new_callable=AsyncMock) as mock_analyze:
+        mock_analyze.return_value = {"test": ["result"]}
+        first = await analyzer.analyze_description("Description", AnalysisType.TECHNICAL)
+        first["test"].append("mutated")
+        second = await analyzer.analyze_description("Description", AnalysisType.TECHNICAL)
+        assert second == {"test": ["result"]}
+        assert mock_analyze.call_count == 1
+        
+        await analyzer.analyze_description("Description", AnalysisType.USER)
+        assert mock_analyze.call_count == 2
+        
+        mock_analyze.return_value = {"error": "failed"}
+        await analyzer.analyze_description("Other", AnalysisType.TECHNICAL)
+        await analyzer.analyze_description("Other", AnalysisType.TECHNICAL)
+        assert mock_analyze.call_count == 4
+
 async def test_analyze_with_ai_error(analyzer):
     """Test AI analysis with error."""
     # Отключаем retry для теста
@@ -135,7 +294,6 @@ async def test_analyze_with_ai_error(analyzer):
         assert "error" in result
         assert "Rate limit exceeded" in result["error"]
 
-@pytest.mark.asyncio
 async def test_analyze_success(analyzer):
     """Test successful analysis."""
     with patch.object(analyzer, '_get_service_description', return_value="Test description"):
@@ -146,14 +304,12 @@ async def test_analyze_success(analyzer):
         assert "markdown" in result
         assert result["service_info"]["service_name"] == "Test Service"
 
-@pytest.mark.asyncio
-async def test_analyze_api_error(test_api_key, caplog):
+async def test_analyze_api_error(analyzer, mock_session, monkeypatch, caplog):
     """Test analysis with API error."""
     caplog.set_level(logging.WARNING)
-    # Создаем анализатор с моком сессии, который будет вызывать ошибку
-    analyzer = TestAnalyzer("Test Service", "https://test-service.com", api_key=test_api_key)
-    error_session = MockSession(raise_exc=APIRequestError("API request failed"))
-    analyzer._session = error_session
+    # Общая мок-сессия вызывает ошибку только в этом тесте
+    monkeypatch.setattr(mock_session, "raise_exc", APIRequestError("API request failed"))
+    analyzer._session = mock_session
     
     # Патчим метод _get_service_description, чтобы он не пытался делать реальный запрос
     with patch.object(analyzer, '_get_service_description', return_value="Test Description"):
@@ -167,44 +323,54 @@ async def test_analyze_api_error(test_api_key, caplog):
         # Проверяем, что в логах есть сообщение об ошибке
         assert any("Error enriching service info" in record.message for record in caplog.records)
 
-@pytest.mark.asyncio
-async def test_unimplemented_methods(test_api_key):
+def test_unimplemented_methods(test_api_key):
     """Test that abstract methods are properly implemented."""
     analyzer = TestAnalyzer("Test Service", api_key=test_api_key)
     assert callable(analyzer._prepare_analysis_prompt)
     assert callable(analyzer.generate_markdown)
     assert callable(analyzer._perform_specific_analysis)
 
-@pytest.mark.asyncio
+def test_ai_client_created_lazily():
+    """Test that the OpenAI client is created on first use, not in the constructor."""
+    analyzer = TestAnalyzer("Test Service", api_key="lazy-api-key")
+    assert "lazy-api-key" not in _ai_clients
+    try:
+        client = analyzer._client
+        assert _ai_clients["lazy-api-key"] is client
+        assert analyzer._client is client
+    finally:
+        _ai_clients.pop("lazy-api-key", None)
+
 async def test_detect_technologies(analyzer):
     """Test technology detection."""
-    html = """
-    <html>
-        <head>
-            <script src="https://code.jquery.com/jquery.min.js"></script>
-            <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.0.0/dist/js/bootstrap.min.js"></script>
-        </head>
-        <body>
-            <div data-reactroot>
-                <p>React app</p>
-            </div>
-            <script>
-                // Google Analytics
-                gtag('config', 'GA_MEASUREMENT_ID');
-            </script>
-        </body>
-    </html>
-    """
     headers = {"Server": "nginx/1.18.0"}
     
-    technologies = await analyzer._detect_technologies(html, headers)
+    technologies = await analyzer._detect_technologies(SAMPLE_HTML, headers)
     
     assert "React" in technologies["frontend"]
     assert "Nginx" in technologies["backend"]
     assert "jQuery" in technologies["libraries"]
     assert "Bootstrap" in technologies["libraries"]
 
-@pytest.mark.asyncio
+async def test_detect_technologies_parses_page_once(analyzer):
+    """Test that repeated detection on the same fetched page reuses its parsed document."""
+    page = FetchedPage(status=200, headers={}, html=SAMPLE_HTML)
+    first = await analyzer._detect_technologies(SAMPLE_HTML, {}, page)
+    parsed = page.parsed
+    assert parsed is not None
+    
+    second = await analyzer._detect_technologies(SAMPLE_HTML, {}, page)
+    assert first == second
+    assert page.parsed is parsed
+
+async def test_detect_technologies_skips_parsing_without_markers(analyzer):
+    """Test that pages without frontend or library markers are not parsed."""
+    with patch("analyzers.base_analyzer._parse_html", wraps=_parse_html) as mock_parse:
+        technologies = await analyzer._detect_technologies("<html><body><p>Plain page</p></body></html>", {})
+    assert technologies["frontend"] == []
+    assert technologies["libraries"] == []
+    mock_parse.assert_not_called()
+
 async def test_detect_technologies_error(analyzer):
     """Test technology detection with error."""
     with patch('bs4.BeautifulSoup', side_effect=Exception("Parse error")):
@@ -212,19 +378,63 @@ async def test_detect_technologies_error(analyzer):
         assert technologies["frontend"] == []
         assert technologies["backend"] == []
 
-@pytest.mark.asyncio
+def test_extract_description():
+    """Test description extraction priority: meta description, first paragraph, title."""
+    html = '<html><head><title>Title</title><meta name="description" content="Meta"></head><body><p>Text</p></body></html>'
+    assert BaseAnalyzer._extract_description(html) == "Meta"
+    assert BaseAnalyzer._extract_description("<title>Title</title><p> Text </p>") == "Text"
+    assert BaseAnalyzer._extract_description("<title>Title</title><p> </p>") == "Title"
+    assert BaseAnalyzer._extract_description("<div></div>") is None
+
+def test_extract_description_meta_without_parsing():
+    """Test that meta description is found by the regex scan regardless of attribute order."""
+    html = "<head><META content='Tom &amp; Jerry' Name=\"description\"></head><p>Text</p>"
+    with patch("analyzers.base_analyzer._parse_html", wraps=_parse_html) as mock_parse:
+        assert BaseAnalyzer._extract_description(html) == "Tom & Jerry"
+        mock_parse.assert_not_called()
+        # Empty content falls back to parsing the page
+        assert BaseAnalyzer._extract_description('<meta name="description" content=""><p>Text</p>') == "Text"
+        assert mock_parse.call_count == 1
+
+def test_extract_html_markers_beautifulsoup_fallback():
+    """Test technology markers extraction without selectolax."""
+    html = '<div ng-version="17"></div><script src="/js/JQuery.min.js"></script>'
+    with patch("analyzers.base_analyzer.HTMLParser", None):
+        frontend, script_sources = BaseAnalyzer._extract_html_markers(html)
+    
+    assert frontend == ["Angular"]
+    assert script_sources == ["/js/JQuery.min.js"]
+
 async def test_call_ai_api_success(analyzer):
     """Test successful AI API call."""
-    with patch.object(analyzer._client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"test": "result"}'
-        mock_create.return_value = mock_response
-        
+    with patch.object(analyzer._client.chat.completions, 'create', new_callable=AsyncMock,
+                      return_value=make_completion('{"test": "result"}')) as mock_create:
         result = await analyzer._call_ai_api("Test prompt")
-        assert result == '{"test": "result"}'
+        assert result == {"test": "result"}
+        assert mock_create.call_args.kwargs["response_format"] == {"type": "json_object"}
+
+async def test_call_ai_api_cached(analyzer, tmp_path):
+    """Test that AI responses are served from the on-disk cache."""
+    analyzer.AI_CACHE_DIR = str(tmp_path)
+    with patch.object(analyzer._client.chat.completions, 'create', new_callable=AsyncMock,
+                      return_value=make_completion('{"test": "результат"}')) as mock_create:
+        assert await analyzer._call_ai_api("Test prompt") == {"test": "результат"}
+        assert await analyzer._call_ai_api("Test prompt") == {"test": "результат"}
+        assert mock_create.call_count == 1
+        
+        await analyzer._call_ai_api("Test prompt", no_cache=True)
+        assert mock_create.call_count == 2
+
+async def test_call_ai_api_malformed_not_cached(analyzer, tmp_path):
+    """Test that a reply that fails to parse is not cached."""
+    analyzer.AI_CACHE_DIR = str(tmp_path)
+    with patch.object(analyzer._client.chat.completions, 'create', new_callable=AsyncMock,
+                      return_value=make_completion('{"test": "обрезанный')) as mock_create:
+        assert "error" in await analyzer._call_ai_api("Test prompt")
+        assert "error" in await analyzer._call_ai_api("Test prompt")
+        assert mock_create.call_count == 2
+        assert list(tmp_path.iterdir()) == []
 
-@pytest.mark.asyncio
 async def test_call_ai_api_rate_limit(analyzer):
     """Test AI API call with rate limit error."""
     with patch.object(analyzer._client.chat.completions, 'create') as mock_create:
@@ -233,24 +443,38 @@ async def test_call_ai_api_rate_limit(analyzer):
         with pytest.raises(Exception):
             await analyzer._call_ai_api("Test prompt")
 
-@pytest.mark.asyncio
+async def test_call_ai_api_reraises_after_retries(analyzer):
+    """Test that the original error is raised once retries are exhausted."""
+    with patch.object(analyzer._client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
+        mock_create.side_effect = Exception("Connection reset")
+        
+        with pytest.raises(APIRequestError):
+            await analyzer._call_ai_api("Test prompt")
+        assert mock_create.call_count == BaseAnalyzer.MAX_RETRIES
+
 async def test_context_manager(analyzer):
     """Test async context manager."""
-    async with analyzer as a:
-        assert a == analyzer
-        assert a._session is not None
+    mock_session = MockSession()
+    with patch("analyzers.base_analyzer.get_shared_session", new_callable=AsyncMock, return_value=mock_session):
+        async with analyzer as a:
+            assert a == analyzer
+            assert a._session is mock_session
     
     assert analyzer._session is None
 
-@pytest.mark.asyncio
 async def test_get_session(analyzer):
     """Test getting session."""
-    session = await analyzer._get_session()
-    assert session is not None
-    assert isinstance(session, aiohttp.ClientSession)
-
-@pytest.mark.asyncio
-async def test_validate_analysis_result(analyzer):
+    # Настоящая сессия не нужна: проверяем только создание и повторное использование
+    await close_shared_session()
+    with patch("aiohttp.TCPConnector", autospec=True), \
+         patch("aiohttp.ClientSession", autospec=True) as mock_session_cls:
+        session = await analyzer._get_session()
+        mock_session_cls.assert_called_once()
+        assert session is mock_session_cls.return_value
+        assert await analyzer._get_session() is session
+        await close_shared_session()
+
+def test_validate_analysis_result(analyzer):
     """Test analysis result validation."""
     valid_result = {
         "service_info": {"name": "test"},
@@ -262,8 +486,7 @@ async def test_validate_analysis_result(analyzer):
     invalid_result = {"service_info": {"name": "test"}}
     assert analyzer._validate_analysis_result(invalid_result) is False
 
-@pytest.mark.asyncio
-async def test_create_error_result(analyzer):
+def test_create_error_result(analyzer):
     """Test creating error result."""
     error_result = analyzer._create_error_result("Test error")
     
@@ -274,15 +497,14 @@ async def test_create_error_result(analyzer):
     assert "markdown" in error_result
     assert "Test error" in error_result["markdown"]
 
-@pytest.mark.asyncio
-async def test_get_system_prompt(analyzer):
+def test_get_system_prompt(analyzer):
     """Test getting system prompt."""
     prompt = analyzer._get_system_prompt(AnalysisType.BUSINESS)
     assert "эксперт по анализу сервисов" in prompt
     assert "бизнес-анализа" in prompt
+    assert analyzer._get_system_prompt(AnalysisType.BUSINESS) is prompt
 
-@pytest.mark.asyncio
-async def test_get_user_prompt(analyzer):
+def test_get_user_prompt(analyzer):
     """Test getting user prompt."""
     prompt = analyzer._get_user_prompt("Test description", AnalysisType.TECHNICAL)
     assert "Test Service" in prompt
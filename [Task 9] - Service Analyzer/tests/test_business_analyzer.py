@@ -1,48 +1,48 @@
 import pytest
-import asyncio
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
-import sys
-import os
-from typing import Dict, Any
-
-# Добавляем путь к корневой директории проекта
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import patch
+from types import MappingProxyType
 
 from analyzers.business_analyzer import BusinessAnalyzer
-from analyzers.base_analyzer import AnalysisType, ServiceMetadata
-
-@pytest.fixture
-def test_api_key():
-    return "test-api-key-12345"
+from analyzers.base_analyzer import AnalysisType
+
+# Результат бизнес-анализа для generate_markdown; service_info подставляется в тестах
+_BUSINESS_RESULT_TEMPLATE = MappingProxyType({
+    "analysis_type": AnalysisType.BUSINESS,
+    "business_model": {"type": "SaaS model"},
+    "target_audience": {"primary": "Developers", "secondary": "Startups"},
+    "core_functions": ["Function 1", "Function 2"],
+    "unique_advantages": ["Advantage 1", "Advantage 2"],
+    "market_analysis": "Growing market",
+    "competitors": ["Competitor 1", "Competitor 2"],
+    "monetization_strategies": ["Strategy 1", "Strategy 2"],
+    "growth_potential": "High potential",
+    "error": None
+})
 
 @pytest.fixture
 def business_analyzer(test_api_key):
     return BusinessAnalyzer("Test Business Service", "https://test-business.com", api_key=test_api_key)
 
-@pytest.mark.asyncio
-async def test_business_analyzer_init(test_api_key):
+def test_business_analyzer_init(test_api_key):
     """Test BusinessAnalyzer initialization."""
     analyzer = BusinessAnalyzer("Test Service", api_key=test_api_key)
     assert analyzer.service_metadata.name == "Test Service"
     assert analyzer.api_key == test_api_key
 
-@pytest.mark.asyncio
-async def test_get_service_description(business_analyzer):
+def test_get_service_description(business_analyzer):
     """Test getting service description for business analysis."""
     description = business_analyzer._get_service_description()
     assert "Business analysis of service" in description
     assert "Test Business Service" in description
     assert "test-business.com" in description
 
-@pytest.mark.asyncio
-async def test_get_service_description_with_description(business_analyzer):
+def test_get_service_description_with_description(business_analyzer):
     """Test getting service description with custom description."""
     business_analyzer.service_metadata.description = "Custom business description"
     description = business_analyzer._get_service_description()
     assert "Custom business description" in description
 
-@pytest.mark.asyncio
-async def test_format_list(business_analyzer):
+def test_format_list(business_analyzer):
     """Test formatting list for markdown."""
     items = ["Item 1", "Item 2", "Item 3"]
     formatted = business_analyzer._format_list(items)
@@ -50,28 +50,33 @@ async def test_format_list(business_analyzer):
     assert "- Item 2" in formatted
     assert "- Item 3" in formatted
 
-@pytest.mark.asyncio
-async def test_format_list_empty(business_analyzer):
+def test_format_list_empty(business_analyzer):
     """Test formatting empty list."""
     formatted = business_analyzer._format_list([])
     assert formatted == "Not specified"
 
-@pytest.mark.asyncio
-async def test_format_dict(business_analyzer):
+def test_format_dict(business_analyzer):
     """Test formatting dictionary for markdown."""
     data = {"key1": "value1", "key2": "value2"}
     formatted = business_analyzer._format_dict(data)
     assert "**key1**: value1" in formatted
     assert "**key2**: value2" in formatted
 
-@pytest.mark.asyncio
-async def test_format_dict_empty(business_analyzer):
+def test_format_dict_empty(business_analyzer):
     """Test formatting empty dictionary."""
     formatted = business_analyzer._format_dict({})
     assert formatted == "Not specified"
 
-@pytest.mark.asyncio
-async def test_format_list_of_dicts(business_analyzer):
+def test_format_skips_empty_values(business_analyzer):
+    """Test that empty items and values are left out of markdown."""
+    assert business_analyzer._format_list(["Item 1", "", None]) == "- Item 1"
+    assert business_analyzer._format_list(["", None]) == "Not specified"
+    assert business_analyzer._format_dict({"key1": "value1", "key2": None, "key3": [], "key4": 0}) == (
+        "- **key1**: value1\n- **key4**: 0"
+    )
+    assert business_analyzer._format_dict({"key1": ""}) == "Not specified"
+
+def test_format_list_of_dicts(business_analyzer):
     """Test formatting list of dictionaries."""
     items = [
         {"name": "Competitor 1", "strength": "High"},
@@ -83,20 +88,14 @@ async def test_format_list_of_dicts(business_analyzer):
     assert "**name**: Competitor 1" in formatted
     assert "**strength**: High" in formatted
 
-@pytest.mark.asyncio
-async def test_format_list_of_dicts_empty(business_analyzer):
+def test_format_list_of_dicts_empty(business_analyzer):
     """Test formatting empty list of dictionaries."""
     formatted = business_analyzer._format_list_of_dicts([])
     assert formatted == "Not specified"
 
-@pytest.mark.asyncio
-async def test_prepare_analysis_prompt(business_analyzer):
+def test_prepare_analysis_prompt(business_analyzer, base_service_info):
     """Test preparing analysis prompt."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
-    }
+    service_info = base_service_info
     
     prompt = business_analyzer._prepare_analysis_prompt(service_info)
     assert "Test Service" in prompt
@@ -106,29 +105,9 @@ async def test_prepare_analysis_prompt(business_analyzer):
     assert "целевой аудитории" in prompt.lower()
     assert "зарабатывает деньги" in prompt.lower()
 
-@pytest.mark.asyncio
-async def test_prepare_market_analysis_prompt(business_analyzer):
-    """Test preparing market analysis prompt."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
-    }
-    
-    prompt = business_analyzer._prepare_market_analysis_prompt(service_info)
-    assert "Test Business Service" in prompt
-    assert "https://test-business.com" in prompt
-    assert "market size" in prompt.lower()
-    assert "competitive landscape" in prompt.lower()
-
-@pytest.mark.asyncio
-async def test_perform_specific_analysis_success(business_analyzer):
+async def test_perform_specific_analysis_success(business_analyzer, base_service_info):
     """Test successful business analysis."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
-    }
+    service_info = base_service_info
     
     with patch.object(business_analyzer, 'analyze_description') as mock_analyze:
         mock_analyze.return_value = {
@@ -147,14 +126,9 @@ async def test_perform_specific_analysis_success(business_analyzer):
         assert "target_audience" in result
         assert result["service_info"].name == "Test Business Service"
 
-@pytest.mark.asyncio
-async def test_perform_specific_analysis_error(business_analyzer):
+async def test_perform_specific_analysis_error(business_analyzer, base_service_info):
     """Test business analysis with error."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
-    }
+    service_info = base_service_info
     
     with patch.object(business_analyzer, 'analyze_description') as mock_analyze:
         mock_analyze.return_value = {"error": "Analysis failed"}
@@ -165,81 +139,33 @@ async def test_perform_specific_analysis_error(business_analyzer):
         assert "error" in result
         assert result["error"] == "Analysis failed"
 
-@pytest.mark.asyncio
-async def test_analyze_market_aspects_success(business_analyzer):
-    """Test successful market analysis."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
-    }
+async def test_perform_specific_analysis_market(business_analyzer, base_service_info):
+    """Test that market analysis returned by the main AI call is extracted into raw data."""
+    service_info = base_service_info
     
-    with patch.object(business_analyzer, '_analyze_with_ai') as mock_analyze:
+    with patch.object(business_analyzer, 'analyze_description') as mock_analyze:
         mock_analyze.return_value = {
-            "market_size": {"total": "1B USD"},
-            "market_trends": ["Growing", "Digital transformation"],
-            "competitive_landscape": {"competitors": 10},
-            "growth_opportunities": ["International expansion"],
-            "risks": ["Market saturation"]
+            "business_model": "SaaS model",
+            "market": {
+                "market_size": {"total": "1B USD"},
+                "market_trends": ["Growing", "Digital transformation"],
+                "competitive_landscape": {"competitors": 10},
+                "growth_opportunities": ["International expansion"],
+                "risks": ["Market saturation"]
+            }
         }
         
-        result = await business_analyzer._analyze_market_aspects(service_info)
-        
-        assert "market_size" in result
-        assert "market_trends" in result
-        assert "competitive_landscape" in result
-        assert "growth_opportunities" in result
-        assert "risks" in result
-
-@pytest.mark.asyncio
-async def test_analyze_market_aspects_error(business_analyzer):
-    """Test market analysis with error."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
-    }
-    
-    with patch.object(business_analyzer, '_analyze_with_ai') as mock_analyze:
-        mock_analyze.return_value = {"error": "Market analysis failed"}
-        
-        result = await business_analyzer._analyze_market_aspects(service_info)
-        
-        assert "error" in result
-        assert result["error"] == "Market analysis failed"
-
-@pytest.mark.asyncio
-async def test_analyze_market_aspects_exception(business_analyzer):
-    """Test market analysis with exception."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
-    }
-    
-    with patch.object(business_analyzer, '_analyze_with_ai', side_effect=Exception("Test error")):
-        result = await business_analyzer._analyze_market_aspects(service_info)
+        result = await business_analyzer._perform_specific_analysis(service_info)
         
-        assert "error" in result
-        assert "Test error" in result["error"]
+        market = result["raw_data"]["market_analysis"]
+        assert market["market_size"] == {"total": "1B USD"}
+        assert market["market_trends"] == ["Growing", "Digital transformation"]
+        assert market["risks"] == ["Market saturation"]
+        assert mock_analyze.call_count == 1
 
-@pytest.mark.asyncio
-async def test_generate_markdown(business_analyzer):
+def test_generate_markdown(business_analyzer):
     """Test markdown generation."""
-    # Создаем правильную структуру данных для BusinessAnalysisResult
-    analysis_results = {
-        "service_info": business_analyzer.service_metadata,
-        "analysis_type": AnalysisType.BUSINESS,
-        "business_model": {"type": "SaaS model"},
-        "target_audience": {"primary": "Developers", "secondary": "Startups"},
-        "core_functions": ["Function 1", "Function 2"],
-        "unique_advantages": ["Advantage 1", "Advantage 2"],
-        "market_analysis": "Growing market",
-        "competitors": ["Competitor 1", "Competitor 2"],
-        "monetization_strategies": ["Strategy 1", "Strategy 2"],
-        "growth_potential": "High potential",
-        "error": None
-    }
+    analysis_results = {**_BUSINESS_RESULT_TEMPLATE, "service_info": business_analyzer.service_metadata}
     
     markdown = business_analyzer.generate_markdown(analysis_results)
     
@@ -249,19 +175,11 @@ async def test_generate_markdown(business_analyzer):
     assert "Developers" in markdown
     assert "Startups" in markdown
 
-@pytest.mark.asyncio
-async def test_generate_markdown_with_error(business_analyzer):
+def test_generate_markdown_with_error(business_analyzer):
     """Test markdown generation with error."""
-    # Создаем правильную структуру данных для BusinessAnalysisResult
     analysis_results = {
+        **_BUSINESS_RESULT_TEMPLATE,
         "service_info": business_analyzer.service_metadata,
-        "analysis_type": AnalysisType.BUSINESS,
-        "business_model": {},
-        "target_audience": {},
-        "market_analysis": {},
-        "competitors": [],
-        "monetization_strategies": [],
-        "growth_potential": {},
         "error": "Analysis failed"
     }
     
@@ -270,15 +188,14 @@ async def test_generate_markdown_with_error(business_analyzer):
     assert "## Бизнес-анализ" in markdown
     assert "Analysis failed" in markdown
 
-@pytest.mark.asyncio
-async def test_create_error_result(business_analyzer):
+@pytest.mark.mockecho
+def test_create_error_result(business_analyzer):
     """Test creating error result."""
     error_result = business_analyzer._create_error_result("Test error")
     
     assert "error" in error_result
     assert error_result["error"] == "Test error"
 
-@pytest.mark.asyncio
 async def test_analyze_success(business_analyzer):
     """Test successful business analysis."""
     with patch.object(business_analyzer, '_get_service_description', return_value="Test description"):
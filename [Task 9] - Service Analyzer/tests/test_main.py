@@ -1,72 +1,81 @@
 import pytest
 from pathlib import Path
-from unittest.mock import AsyncMock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 from typer.testing import CliRunner
 import json
 import aiohttp
-from main import app, run_analysis, save_report, main
+from main import app, run_analysis, save_report, iter_report_parts, main, read_concurrency_limit
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
+    # CliRunner не хранит состояние между вызовами, поэтому один на сессию
     return CliRunner()
 
+@pytest.fixture(scope="session")
+def help_result(runner):
+    """Вывод --help статичен, поэтому команда вызывается один раз за сессию."""
+    return runner.invoke(app, ["--help"])
+
+class StubAnalyzer(SimpleNamespace):
+    """Lightweight analyzer stand-in supporting the async context manager protocol."""
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+def make_analyzer(class_name: str, markdown: str) -> StubAnalyzer:
+    """Builds a stub analyzer whose class name and analyze() result mimic a real one."""
+    return type(class_name, (StubAnalyzer,), {})(analyze=AsyncMock(return_value={"markdown": markdown}))
+
 @pytest.fixture
 def mock_analyzers():
-    business = MagicMock()
-    business.__class__.__name__ = "BusinessAnalyzer"
-    business.analyze = AsyncMock(return_value={"markdown": "## Бизнес-анализ\n\nTest"})
-    
-    technical = MagicMock()
-    technical.__class__.__name__ = "TechnicalAnalyzer"
-    technical.analyze = AsyncMock(return_value={"markdown": "## Технический анализ\n\nTest"})
-    
-    user = MagicMock()
-    user.__class__.__name__ = "UserAnalyzer"
-    user.analyze = AsyncMock(return_value={"markdown": "## Пользовательский анализ\n\nTest"})
-    
+    business = make_analyzer("BusinessAnalyzer", "## Бизнес-анализ\n\nTest")
+    technical = make_analyzer("TechnicalAnalyzer", "## Технический анализ\n\nTest")
+    user = make_analyzer("UserAnalyzer", "## Пользовательский анализ\n\nTest")
     return business, technical, user
 
-@pytest.mark.asyncio
-async def test_run_analysis_success(mock_analyzers):
-    """Test successful analysis run."""
+@pytest.fixture
+def patched_analyzers(mock_analyzers):
+    """Подменяет классы анализаторов в main заглушками из mock_analyzers."""
     business, technical, user = mock_analyzers
-    
     with patch("main.BusinessAnalyzer", return_value=business), \
          patch("main.TechnicalAnalyzer", return_value=technical), \
          patch("main.UserAnalyzer", return_value=user):
-        
-        results = await run_analysis(
-            service_name="test-service",
-            api_key="test-key",
-            url="http://test.com",
-            description="Test description"
-        )
-        
-        assert len(results) == 3
-        assert all("markdown" in result for result in results)
-        assert business.analyze.call_count == 1
-        assert technical.analyze.call_count == 1
-        assert user.analyze.call_count == 1
-
-@pytest.mark.asyncio
-async def test_run_analysis_analyzer_error(mock_analyzers):
+        yield business, technical, user
+
+async def test_run_analysis_success(patched_analyzers):
+    """Test successful analysis run."""
+    business, technical, user = patched_analyzers
+    
+    results = await run_analysis(
+        service_name="test-service",
+        api_key="test-key",
+        url="http://test.com",
+        description="Test description"
+    )
+    
+    assert len(results) == 3
+    assert all("markdown" in result for result in results)
+    assert business.analyze.call_count == 1
+    assert technical.analyze.call_count == 1
+    assert user.analyze.call_count == 1
+
+async def test_run_analysis_analyzer_error(patched_analyzers):
     """Test analysis with analyzer error."""
-    business, technical, user = mock_analyzers
+    business, technical, user = patched_analyzers
     technical.analyze.side_effect = Exception("Test error")
     
-    with patch("main.BusinessAnalyzer", return_value=business), \
-         patch("main.TechnicalAnalyzer", return_value=technical), \
-         patch("main.UserAnalyzer", return_value=user):
-        
-        results = await run_analysis(
-            service_name="test-service",
-            api_key="test-key",
-            url="http://test.com"
-        )
-        
-        assert len(results) == 3
-        assert "error" in results[1]
-        assert "Test error" in results[1]["error"]
+    results = await run_analysis(
+        service_name="test-service",
+        api_key="test-key",
+        url="http://test.com"
+    )
+    
+    assert len(results) == 3
+    assert "error" in results[1]
+    assert "Test error" in results[1]["error"]
 
 def test_save_report(tmp_path):
     """Test saving report to file."""
@@ -81,9 +90,36 @@ def test_save_report(tmp_path):
     assert "Test Report" in saved_content
     assert "Test content" in saved_content
 
-def test_main_help(runner):
+def test_save_report_chunks(tmp_path):
+    """Test saving report written from parts."""
+    output_file = tmp_path / "reports" / "test.md"
+    
+    save_report(iter_report_parts("Test", [{"markdown": "## Part 1"}, {"error": "Failed"}]), output_file)
+    
+    saved_content = output_file.read_text(encoding='utf-8')
+    assert saved_content.startswith("---\ntitle: Service Analysis\n")
+    assert "# Анализ сервиса: Test" in saved_content
+    assert "## Part 1" in saved_content
+    assert "Failed" in saved_content
+
+@pytest.mark.parametrize("value, expected", [
+    (None, 3),
+    ("5", 5),
+    ("0", 1),
+    ("-2", 1),
+    ("many", 3),
+], ids=["default", "set", "zero", "negative", "invalid"])
+def test_read_concurrency_limit(monkeypatch, value, expected):
+    """Test that the analyzer concurrency limit is parsed defensively and kept at least 1."""
+    if value is None:
+        monkeypatch.delenv("MAX_CONCURRENT_ANALYZERS", raising=False)
+    else:
+        monkeypatch.setenv("MAX_CONCURRENT_ANALYZERS", value)
+    assert read_concurrency_limit() == expected
+
+def test_main_help(help_result):
     """Test help output."""
-    result = runner.invoke(app, ["--help"])
+    result = help_result
     assert result.exit_code == 0
     assert "Usage:" in result.output
     assert "Arguments" in result.output
@@ -99,9 +135,8 @@ def test_main_missing_required_argument(runner):
     assert result.exit_code != 0
     assert "Missing argument" in result.output
 
-def test_main_success(runner, mock_analyzers, tmp_path):
+def test_main_success(runner, tmp_path):
     """Test successful command execution."""
-    business, technical, user = mock_analyzers
     output_file = tmp_path / "analysis.md"
     
     with patch("main.run_analysis", new_callable=AsyncMock) as mock_run_analysis, \
@@ -125,9 +160,8 @@ def test_main_success(runner, mock_analyzers, tmp_path):
         mock_save_report.assert_called_once()
         assert "Предварительный просмотр отчета:" in result.output
 
-def test_main_no_preview(runner, mock_analyzers, tmp_path):
+def test_main_no_preview(runner, tmp_path):
     """Test command with no preview option."""
-    business, technical, user = mock_analyzers
     output_file = tmp_path / "analysis.md"
     
     with patch("main.run_analysis", new_callable=AsyncMock) as mock_run_analysis, \
@@ -152,36 +186,47 @@ def test_main_no_preview(runner, mock_analyzers, tmp_path):
         mock_save_report.assert_called_once()
         assert "Предварительный просмотр отчета:" not in result.output
 
-@pytest.mark.asyncio
-async def test_run_analysis_error():
-    """Test service analysis with error."""
-    with patch('main.BusinessAnalyzer') as mock_business, \
-         patch('main.TechnicalAnalyzer') as mock_tech, \
-         patch('main.UserAnalyzer') as mock_user:
+def test_main_preview_truncated(runner, tmp_path):
+    """Test that long reports are shortened in the preview but saved in full."""
+    output_file = tmp_path / "analysis.md"
+    long_markdown = "\n".join(f"- line {i}" for i in range(500))
+    
+    with patch("main.run_analysis", new_callable=AsyncMock) as mock_run_analysis:
+        mock_run_analysis.return_value = [{"markdown": long_markdown}]
         
-        # Setup mock analyzers
-        mock_tech_instance = mock_tech.return_value
-        mock_user_instance = mock_user.return_value
-        mock_business_instance = mock_business.return_value
-
-        # Setup mock to raise exception
-        mock_tech_instance.analyze = AsyncMock(side_effect=Exception("Technical Analysis Error"))
-        mock_user_instance.analyze = AsyncMock(side_effect=Exception("User Analysis Error"))
-        mock_business_instance.analyze = AsyncMock(side_effect=Exception("Business Analysis Error"))
-
-        # Run analysis
-        results = await run_analysis(
-            service_name="Test Service",
-            api_key="test-api-key",
-            url="https://test-service.com"
-        )
-
-        # Verify results
-        assert len(results) == 3
-        assert all("error" in result for result in results)
-        assert any("Technical Analysis Error" in result["error"] for result in results)
-        assert any("User Analysis Error" in result["error"] for result in results)
-        assert any("Business Analysis Error" in result["error"] for result in results)
+        result = runner.invoke(app, [
+            "test-service",
+            "--api-key", "test-key",
+            "--output", str(output_file)
+        ])
+    
+    assert result.exit_code == 0
+    assert "отчет сокращен" in result.output
+    assert "- line 499" not in result.output
+    assert "- line 499" in output_file.read_text(encoding="utf-8")
+
+async def test_run_analysis_error(patched_analyzers):
+    """Test service analysis with error."""
+    business, technical, user = patched_analyzers
+    
+    # Setup mock to raise exception
+    technical.analyze.side_effect = Exception("Technical Analysis Error")
+    user.analyze.side_effect = Exception("User Analysis Error")
+    business.analyze.side_effect = Exception("Business Analysis Error")
+
+    # Run analysis
+    results = await run_analysis(
+        service_name="Test Service",
+        api_key="test-api-key",
+        url="https://test-service.com"
+    )
+
+    # Verify results
+    assert len(results) == 3
+    assert all("error" in result for result in results)
+    assert any("Technical Analysis Error" in result["error"] for result in results)
+    assert any("User Analysis Error" in result["error"] for result in results)
+    assert any("Business Analysis Error" in result["error"] for result in results)
 
 def test_main_error(runner, tmp_path):
     """Test command execution with error."""
@@ -1,151 +1,146 @@
 import pytest
-import asyncio
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
-import sys
-import os
-from typing import Dict, Any
-
-# Добавляем путь к корневой директории проекта
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import patch, MagicMock, AsyncMock
+from typing import Dict
+import aiohttp
 
 from analyzers.technical_analyzer import TechnicalAnalyzer
-from analyzers.base_analyzer import AnalysisType, ServiceMetadata
+from analyzers.base_analyzer import AnalysisType
 
-@pytest.fixture
-def test_api_key():
-    return "test-api-key-12345"
+def aresult(value):
+    """Builds a coroutine stub returning value, for patches whose calls are not asserted."""
+    async def _stub(*args, **kwargs):
+        return value
+    return _stub
 
 @pytest.fixture
 def technical_analyzer(test_api_key):
     return TechnicalAnalyzer("Test Technical Service", "https://test-technical.com", api_key=test_api_key)
 
-@pytest.mark.asyncio
-async def test_technical_analyzer_init(test_api_key):
+@pytest.fixture(autouse=True)
+def mock_analyze(technical_analyzer):
+    """Подменяет analyze_description анализатора; по умолчанию анализ пустой."""
+    technical_analyzer.analyze_description = AsyncMock(return_value={})
+    return technical_analyzer.analyze_description
+
+def test_technical_analyzer_init(test_api_key):
     """Test TechnicalAnalyzer initialization."""
     analyzer = TechnicalAnalyzer("Test Service", api_key=test_api_key)
     assert analyzer.service_metadata.name == "Test Service"
     assert analyzer.api_key == test_api_key
 
-@pytest.mark.asyncio
-async def test_get_service_description(technical_analyzer):
-    """Test getting service description for technical analysis."""
-    description = technical_analyzer._get_service_description()
-    assert "Technical analysis of service" in description
-    assert "Test Technical Service" in description
-    assert "test-technical.com" in description
-
-@pytest.mark.asyncio
-async def test_get_service_description_with_description(technical_analyzer):
-    """Test getting service description with custom description."""
-    technical_analyzer.service_metadata.description = "Custom technical description"
-    description = technical_analyzer._get_service_description()
-    assert "Custom technical description" in description
-
-@pytest.mark.asyncio
-async def test_format_dict(technical_analyzer):
-    """Test formatting dictionary for markdown."""
-    data = {"key1": "value1", "key2": "value2"}
-    formatted = technical_analyzer._format_dict(data)
-    assert "**key1**: value1" in formatted
-    assert "**key2**: value2" in formatted
-
-@pytest.mark.asyncio
-async def test_format_dict_empty(technical_analyzer):
-    """Test formatting empty dictionary."""
-    formatted = technical_analyzer._format_dict({})
-    assert formatted == "Не указано"
-
-@pytest.mark.asyncio
-async def test_prepare_analysis_prompt(technical_analyzer):
-    """Test preparing analysis prompt."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description",
-        "additional_data": {"key": "value"}
-    }
-    
-    prompt = technical_analyzer._prepare_analysis_prompt(service_info)
-    assert "Test Service" in prompt
-    assert "https://test.com" in prompt
-    assert "Test description" in prompt
+def test_prepare_analysis_prompt(technical_analyzer, base_service_info):
+    """Test that the analysis prompt asks for technical aspects."""
+    prompt = technical_analyzer._prepare_analysis_prompt(base_service_info)
     assert "architecture" in prompt.lower()
     assert "technical requirements" in prompt.lower()
     assert "scalability" in prompt.lower()
 
-@pytest.mark.asyncio
-async def test_perform_specific_analysis_success(technical_analyzer):
-    """Test successful technical analysis."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
-    }
+def _check_success(result):
+    assert "service_info" in result
+    assert "architecture" in result
+    assert "technical_requirements" in result
+    assert result["service_info"].name == "Test Technical Service"
+
+def _check_error(result):
+    assert "service_info" in result
+    assert "error" in result
+    assert result["error"] == "Analysis failed"
+
+def _check_exception(result):
+    assert "error" in result
+    assert "Test error" in result["error"]
+
+@pytest.mark.parametrize("outcome, check", [
+    ({
+        "architecture": "Microservices",
+        "technical_requirements": ["High availability", "Scalability"],
+        "technical_risks": ["Security risks", "Performance issues"],
+        "integrations": ["API", "Database"],
+        "scalability": "Horizontal scaling"
+    }, _check_success),
+    ({"error": "Analysis failed"}, _check_error),
+    (Exception("Test error"), _check_exception)
+], ids=["success", "error", "exception"])
+async def test_perform_specific_analysis(technical_analyzer, mock_analyze, outcome, check, base_service_info):
+    """Test technical analysis with successful, failed and raising description analysis."""
+    service_info = base_service_info
+    if isinstance(outcome, Exception):
+        mock_analyze.side_effect = outcome
+    else:
+        mock_analyze.return_value = outcome
     
-    with patch.object(technical_analyzer, 'analyze_description') as mock_analyze:
-        mock_analyze.return_value = {
-            "architecture": "Microservices",
-            "technical_requirements": ["High availability", "Scalability"],
-            "technical_risks": ["Security risks", "Performance issues"],
-            "integrations": ["API", "Database"],
-            "scalability": "Horizontal scaling"
-        }
-        
+    with patch.object(technical_analyzer, '_check_availability', new=aresult({"is_available": True})):
         result = await technical_analyzer._perform_specific_analysis(service_info)
-        
-        assert "service_info" in result
-        assert "architecture" in result
-        assert "technical_requirements" in result
-        assert result["service_info"].name == "Test Technical Service"
-
-@pytest.mark.asyncio
-async def test_perform_specific_analysis_error(technical_analyzer):
-    """Test technical analysis with error."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
-    }
     
-    with patch.object(technical_analyzer, 'analyze_description') as mock_analyze:
-        mock_analyze.return_value = {"error": "Analysis failed"}
+    check(result)
+
+async def test_core_analysis_computed_once(technical_analyzer, mock_analyze):
+    """Test that analyze and _perform_specific_analysis share one analysis and availability check."""
+    with patch.object(technical_analyzer, '_check_availability', new_callable=AsyncMock) as mock_check:
+        mock_analyze.return_value = {"architecture": "Microservices"}
+        mock_check.return_value = {"is_available": True, "status_code": 200}
         
-        result = await technical_analyzer._perform_specific_analysis(service_info)
+        results = await technical_analyzer.analyze()
+        specific = await technical_analyzer._perform_specific_analysis({})
         
-        assert "service_info" in result
-        assert "error" in result
-        assert result["error"] == "Analysis failed"
+        assert results["architecture"] == specific["architecture"] == "Microservices"
+        assert results["availability"] == specific["availability"]
+        assert mock_analyze.call_count == 1
+        assert mock_check.call_count == 1
+
+class MockProbeResponse:
+    """Mock class for aiohttp response of an availability probe."""
+    def __init__(self, status: int, headers: Dict[str, str]):
+        self.status = status
+        self.headers = headers
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+async def test_check_availability_head_fallback(technical_analyzer):
+    """Test that availability is probed with HEAD and falls back to GET."""
+    mock_session = MagicMock()
+    mock_session.head.return_value = MockProbeResponse(405, {})
+    mock_session.get.return_value = MockProbeResponse(206, {"Server": "nginx", "Set-Cookie": "id=1"})
+    
+    with patch.object(technical_analyzer, '_get_session', new=aresult(mock_session)):
+        availability = await technical_analyzer._check_availability()
+    
+    assert mock_session.head.call_count == 1
+    assert mock_session.get.call_args.kwargs["headers"] == {"Range": "bytes=0-0"}
+    assert availability["is_available"] is True
+    assert availability["status_code"] == 206
+    assert availability["headers"] == {"Server": "nginx"}
 
-@pytest.mark.asyncio
 async def test_check_availability_success(technical_analyzer):
     """Test successful availability check."""
-    with patch.object(technical_analyzer, '_check_availability') as mock_check:
-        mock_check.return_value = {
-            "is_available": True,
-            "status_code": 200,
-            "response_time": 0.1,
-            "headers": {"Server": "nginx", "Content-Type": "text/html"}
-        }
-        
-        availability = await technical_analyzer._check_availability()
-        
-        assert availability["is_available"] is True
-        assert availability["status_code"] == 200
-        assert "nginx" in str(availability["headers"])
+    mock_session = MagicMock()
+    mock_session.head.return_value = MockProbeResponse(200, {"Server": "nginx", "Content-Type": "text/html"})
+    technical_analyzer._session = mock_session
+    
+    availability = await technical_analyzer._check_availability()
+    
+    assert availability["is_available"] is True
+    assert availability["status_code"] == 200
+    assert availability["response_time"] >= 0
+    assert "nginx" in str(availability["headers"])
+    assert mock_session.get.call_count == 0
 
-@pytest.mark.asyncio
 async def test_check_availability_error(technical_analyzer):
     """Test availability check with error."""
-    with patch.object(technical_analyzer, '_check_availability') as mock_check:
-        mock_check.return_value = {"error": "Connection failed"}
-        
-        availability = await technical_analyzer._check_availability()
-        
-        assert "error" in availability
-        assert "Connection failed" in availability["error"]
+    mock_session = MagicMock()
+    mock_session.head.side_effect = aiohttp.ClientConnectionError("Connection failed")
+    technical_analyzer._session = mock_session
+    
+    availability = await technical_analyzer._check_availability()
+    
+    assert "error" in availability
+    assert "Connection failed" in availability["error"]
 
-@pytest.mark.asyncio
-async def test_generate_markdown(technical_analyzer):
+def test_generate_markdown(technical_analyzer):
     """Test markdown generation."""
     # Создаем правильную структуру данных для TechnicalAnalysisResult
     analysis_results = {
@@ -175,8 +170,7 @@ async def test_generate_markdown(technical_analyzer):
     assert "API" in markdown
     assert "Horizontal scaling" in markdown
 
-@pytest.mark.asyncio
-async def test_generate_markdown_with_error(technical_analyzer):
+def test_generate_markdown_with_error(technical_analyzer):
     """Test markdown generation with error."""
     # Создаем правильную структуру данных для TechnicalAnalysisResult
     analysis_results = {
@@ -195,47 +189,42 @@ async def test_generate_markdown_with_error(technical_analyzer):
     assert "## Технический анализ" in markdown
     assert "Analysis failed" in markdown
 
-@pytest.mark.asyncio
-async def test_create_error_result(technical_analyzer):
+@pytest.mark.mockecho
+def test_create_error_result(technical_analyzer):
     """Test creating error result."""
     error_result = technical_analyzer._create_error_result("Test error")
     
     assert "error" in error_result
     assert error_result["error"] == "Test error"
 
-@pytest.mark.asyncio
-async def test_analyze_success(technical_analyzer):
+@patch.object(TechnicalAnalyzer, '_perform_specific_analysis')
+@patch.object(TechnicalAnalyzer, '_enrich_service_info')
+@patch.object(TechnicalAnalyzer, '_get_service_description', return_value="Test description")
+async def test_analyze_success(mock_description, mock_enrich, mock_perform, technical_analyzer):
     """Test successful technical analysis."""
-    with patch.object(technical_analyzer, '_get_service_description', return_value="Test description"):
-        with patch.object(technical_analyzer, '_enrich_service_info') as mock_enrich:
-            mock_enrich.return_value = {
-                "service_name": "Test Technical Service",
-                "service_url": "https://test-technical.com",
-                "description": "Test description"
-            }
-            
-            with patch.object(technical_analyzer, '_perform_specific_analysis') as mock_perform:
-                mock_perform.return_value = {
-                    "service_info": {"service_name": "Test Technical Service"},
-                    "architecture": "Microservices",
-                    "markdown": "## Технический анализ\n\nTest"
-                }
-                
-                result = await technical_analyzer.analyze()
-                
-                assert "architecture" in result
-                assert "technical_requirements" in result
-                assert "technical_risks" in result
-                assert "integrations" in result
-                assert "scalability" in result
+    mock_enrich.return_value = {
+        "service_name": "Test Technical Service",
+        "service_url": "https://test-technical.com",
+        "description": "Test description"
+    }
+    mock_perform.return_value = {
+        "service_info": {"service_name": "Test Technical Service"},
+        "architecture": "Microservices",
+        "markdown": "## Технический анализ\n\nTest"
+    }
+    
+    result = await technical_analyzer.analyze()
+    
+    assert "architecture" in result
+    assert "technical_requirements" in result
+    assert "technical_risks" in result
+    assert "integrations" in result
+    assert "scalability" in result
 
-@pytest.mark.asyncio
-async def test_perform_specific_analysis_with_web_metadata(technical_analyzer):
+async def test_perform_specific_analysis_with_web_metadata(technical_analyzer, mock_analyze, base_service_info):
     """Test technical analysis with web metadata."""
     service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description",
+        **base_service_info,
         "additional_data": {
             "web_metadata": {
                 "technologies": {
@@ -246,32 +235,16 @@ async def test_perform_specific_analysis_with_web_metadata(technical_analyzer):
         }
     }
     
-    with patch.object(technical_analyzer, 'analyze_description') as mock_analyze:
-        mock_analyze.return_value = {
-            "architecture": "Microservices",
-            "technical_requirements": ["High availability"],
-            "technical_risks": ["Security risks"],
-            "integrations": ["API"],
-            "scalability": "Horizontal scaling"
-        }
-        
-        result = await technical_analyzer._perform_specific_analysis(service_info)
-        
-        assert "service_info" in result
-        assert "architecture" in result
-        assert "raw_data" in result
-
-@pytest.mark.asyncio
-async def test_perform_specific_analysis_exception(technical_analyzer):
-    """Test technical analysis with exception."""
-    service_info = {
-        "service_name": "Test Service",
-        "service_url": "https://test.com",
-        "description": "Test description"
+    mock_analyze.return_value = {
+        "architecture": "Microservices",
+        "technical_requirements": ["High availability"],
+        "technical_risks": ["Security risks"],
+        "integrations": ["API"],
+        "scalability": "Horizontal scaling"
     }
     
-    with patch.object(technical_analyzer, 'analyze_description', side_effect=Exception("Test error")):
-        result = await technical_analyzer._perform_specific_analysis(service_info)
-        
-        assert "error" in result
-        assert "Test error" in result["error"] 
\ No newline at end of file
+    result = await technical_analyzer._perform_specific_analysis(service_info)
+    
+    assert "service_info" in result
+    assert "architecture" in result
+    assert "raw_data" in result